@@ -27,6 +27,14 @@ class SimulationMetrics(TypedDict):
     per_category_acceptance: Dict[str, int]
 
 
+def polarization_score(accepted: int, rejected: int, total: int) -> float:
+    decided = accepted + rejected
+    if decided <= 0 or total <= 0:
+        return 0.0
+    balance = 1.0 - (abs(accepted - rejected) / decided)
+    return max(0.0, min(1.0, balance * (decided / total)))
+
+
 def compute_metrics(agents: List[Agent]) -> SimulationMetrics:
 
     counts: Dict[Opinion, int] = {"accept": 0, "reject": 0, "neutral": 0}
@@ -44,12 +52,7 @@ def compute_metrics(agents: List[Agent]) -> SimulationMetrics:
             per_category[agent.category_id] += 1
     total = len(agents)
     acceptance_rate = counts["accept"] / total if total > 0 else 0.0
-    decided = counts["accept"] + counts["reject"]
-    if decided > 0:
-        balance = 1.0 - (abs(counts["accept"] - counts["reject"]) / decided)
-        polarization = max(0.0, min(1.0, balance * (decided / total)))
-    else:
-        polarization = 0.0
+    polarization = polarization_score(counts["accept"], counts["reject"], total)
     per_category_acceptance = {k: v["accept"] for k, v in per_category_breakdown.items()}
     return {
         "total_agents": total,
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import bisect
 import json
 import hashlib
 import pickle
@@ -11,17 +12,22 @@ import math
 import random
 import re
 import os
-import uuid
+import secrets
 import time
-from collections import Counter, deque
-from typing import Callable, Dict, List, Any, Tuple, Optional
+import zlib
+from collections import Counter, OrderedDict, deque
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from itertools import islice
+from string import Template
+from typing import Callable, Dict, FrozenSet, Iterator, List, Any, Sequence, Tuple, Optional
 
 from ..core.dataset_loader import Dataset
 from ..models.schemas import ReasoningStep
 from ..services.evidence_ladder import summarize_evidence_confidence
 from .agent import Agent
 from .influence import compute_pairwise_influences, decide_opinion_change
-from .aggregator import compute_metrics
+from .aggregator import compute_metrics, polarization_score
 from ..core.ollama_client import generate_ollama
 from ..core.text_encoding_guard import attempt_repair, detect_mojibake
 try:
@@ -29,7 +35,703 @@ try:
 except Exception:  # validator is optional
     LLMOutputValidator = None  # type: ignore
     build_default_forbidden_phrases = lambda: []  # type: ignore
+try:
+    import orjson
+except Exception:  # faster JSON decoding is optional
+    orjson = None  # type: ignore
+
+
+# json.dumps builds a fresh encoder whenever it gets non-default options; the
+# task payload in prompts is encoded with this shared one instead.
+_PROMPT_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+def _loads_json(text: str) -> Any:
+    """json.loads, decoded by orjson when it is installed.
+
+    Inputs orjson rejects (NaN/Infinity, lone surrogates) are retried with
+    json.loads, so both accept the same documents; the one difference is that
+    orjson turns integers outside the 64-bit range into floats.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+# Prompt templates for the direct LLM reasoning paths, parsed once at import.
+# Optional blocks (reply line, evidence rule) are rendered by the caller and
+# carry their own trailing newline so absent blocks leave no blank line.
+_PROMPT_TEMPLATES: Dict[Tuple[str, str], Template] = {
+    ("reasoning", "ar"): Template("\n".join((
+        "${guardrail}",
+        "أنت ${role_label}. المرحلة: ${phase_label}.",
+        "الفكرة: ${idea_label}.",
+        "موقفك الحالي: ${new_label} (كان: ${prev_label}، تغيّر: ${changed_label}).",
+        "سماتك: ${traits_desc}. تحيزاتك: ${bias_desc}.",
+        "آخر أفكارك: ${memory_context}.",
+        "شريحتك من البحث فقط: ${research_summary}",
+        "إشارات: ${research_signals}",
+        "بطاقات الأدلة:",
+        "${evidence_lines}",
+        "${reply_block}قواعد صارمة:",
+        "${evidence_rule}- اكتب 1-3 جمل باللهجة المصرية.",
+        "- ممنوع القوائم/النقاط/الاقتباسات.",
+        "- لا تستخدم كلام عام أو عبارات محفوظة.",
+        "- التزم بمجالك: ${role_guidance}.",
+        "- اجعل موقفك واضحًا واذكر سبب محدد مرتبط بالشريحة/الأدلة.",
+        "- الطول 160-420 حرف.",
+        "- تجنب بدايات: ${avoid_openers}.",
+        "- لا تذكر القيود حرفيًا: ${constraints_summary}.",
+        "- تجنب تكرار عبارات حديثة: ${recent_avoid}.",
+    ))),
+    ("reasoning", "en"): Template("\n".join((
+        "${guardrail}",
+        "You are ${role_label}. Phase: ${phase_label}.",
+        "Idea: ${idea_label}.",
+        "Your stance: ${new_label} (was: ${prev_label}, changed: ${changed_label}).",
+        "Traits: ${traits_desc}. Biases: ${bias_desc}.",
+        "Recent thoughts: ${memory_context}.",
+        "Your research slice only: ${research_summary}",
+        "Signals: ${research_signals}",
+        "Evidence cards:",
+        "${evidence_lines}",
+        "${reply_block}Strict rules:",
+        "${evidence_rule}- Write 1-3 sentences.",
+        "- No bullets/lists/quotes.",
+        "- No generic templates or boilerplate.",
+        "- Stay strictly in your domain: ${role_guidance}.",
+        "- Make the stance clear with a concrete, specific rationale grounded in the slice/evidence.",
+        "- Length 120-420 chars.",
+        "- Avoid opener patterns: ${avoid_openers}.",
+        "- Do not restate constraints literally: ${constraints_summary}.",
+        "- Avoid repeating recent phrases: ${recent_avoid}.",
+    ))),
+    ("reasoning_reply", "ar"): Template(
+        "رد مباشرة على ${short_id} واذكر ${short_id} حرفيًا داخل الرد.\n"
+        "رسالة ${short_id}: \"${snippet}\"\n"
+    ),
+    ("reasoning_reply", "en"): Template(
+        "Reply directly to ${short_id} and include ${short_id} literally in the reply.\n"
+        "${short_id} said: \"${snippet}\"\n"
+    ),
+    ("reasoning_evidence_rule", "ar"): Template("- اذكر معرف دليل واحد على الأقل مثل ${evidence_id}.\n"),
+    ("reasoning_evidence_rule", "en"): Template("- Include at least one evidence ID like ${evidence_id}.\n"),
+    ("emergency", "ar"): Template("\n".join((
+        "أنت ${role_label}. المرحلة: ${phase_label}.",
+        "الفكرة: ${idea_label}.",
+        "نقطة للنقاش: ${reply_ref}.",
+        "أدلة متاحة:",
+        "${evidence_lines}",
+        "قواعد الرد:",
+        "- اكتب 1-2 جمل طبيعية.",
+        "- لا تستخدم نقاط أو تنسيق رسمي.",
+        "- التزم بسياق الدور: ${role_guidance}.",
+        "- استخدم لهجة مصرية واضحة وبسيطة.${evidence_rule}",
+    ))),
+    ("emergency", "en"): Template("\n".join((
+        "You are ${role_label}. Phase: ${phase_label}.",
+        "Idea: ${idea_label}.",
+        "Debate reference: ${reply_ref}",
+        "Evidence:",
+        "${evidence_lines}",
+        "Rules:",
+        "${evidence_rule}- Write 1-2 sentences.",
+        "- No bullets/lists/quotes.",
+        "- Sound like a real person, not a template.",
+        "- Stay strictly in your domain: ${role_guidance}.",
+        "- Keep it concise and specific.",
+    ))),
+    ("emergency_evidence_rule", "ar"): Template("\n- اذكر دليل واحد على الأقل مثل ${evidence_id}."),
+    ("emergency_evidence_rule", "en"): Template("- Include at least one evidence ID like ${evidence_id}.\n"),
+}
+
+
+def _render_prompt(name: str, language: str, **fields: Any) -> str:
+    return _PROMPT_TEMPLATES[(name, "ar" if language == "ar" else "en")].substitute(fields)
+
+
+
+_CLARIFICATION_AXIS_MAP: Dict[str, str] = {
+    "privacy_surveillance": "privacy_scope",
+    "legal_compliance": "compliance_boundary",
+    "ethical_discrimination": "fairness_guardrails",
+    "unclear_target": "target_segment",
+    "unclear_value": "value_proposition",
+    "feasibility_scalability": "delivery_scope",
+    "market_demand": "demand_validation",
+    "evidence_gap": "evidence_priority",
+}
+
+_NONPOSITIVE_OPINIONS = frozenset({"reject", "neutral"})
+_CANONICAL_STANCES = frozenset({"accept", "reject", "neutral"})
+_PRIVACY_TOKENS = frozenset({"privacy", "legal", "compliance", "discrimination", "خصوصية", "قانون", "امتثال", "تمييز"})
+# Fallback reasons that signal an unresolved debate, mapped to the clarification
+# reason tag they should raise.
+_FALLBACK_TO_REASON_TAG: Dict[str, str] = {
+    "idea_anchor_missing": "unclear_value",
+    "low_relevance": "evidence_gap",
+    "validator_fail": "evidence_gap",
+    "generation_failed": "evidence_gap",
+    "empty_or_invalid_output": "evidence_gap",
+    "no_candidate": "evidence_gap",
+    "too_short": "unclear_value",
+    "too_long": "unclear_value",
+    "template_prefix": "unclear_value",
+    "generic_template": "unclear_value",
+    "reused_opener": "unclear_value",
+    "safety_anchor_missing": "legal_compliance",
+    "unsupported_numeric_claim": "evidence_gap",
+    "unsupported_address_claim": "evidence_gap",
+    "unsupported_specific_claim": "evidence_gap",
+}
+_UNRESOLVED_FALLBACK_REASONS = frozenset(_FALLBACK_TO_REASON_TAG)
+
+# Static clarification question per reason tag, keyed by language. Shared and
+# read-only: callers only read fields and copy the options when normalizing.
+_CLARIFICATION_TEMPLATES: Dict[str, Dict[str, Dict[str, Any]]] = {
+    "ar": {
+        "privacy_surveillance": {
+            "question": "إيه حدود جمع البيانات اللي تقبلها في الفكرة؟",
+            "options": [
+                "بيانات يقدمها المستخدم بنفسه فقط",
+                "بيانات عامة فقط مع موافقة صريحة",
+                "مسموح بيانات إضافية بشرط مراجعة بشرية كاملة",
+            ],
+            "reason_summary": "أغلب الوكلاء شايفين مخاطر خصوصية ومراقبة عالية.",
+        },
+        "legal_compliance": {
+            "question": "إيه مستوى الالتزام القانوني المطلوب قبل الإطلاق؟",
+            "options": [
+                "الالتزام الكامل (GDPR/قوانين محلية) قبل أي إطلاق",
+                "إطلاق محدود مع موافقات صريحة وتدقيق شهري",
+                "نسخة تجريبية بدون قرارات مؤثرة لحين اكتمال الامتثال",
+            ],
+            "reason_summary": "الاعتراضات مركزة على المخاطر القانونية والامتثال.",
+        },
+        "ethical_discrimination": {
+            "question": "كيف تحب النظام يتعامل مع قرارات قد تسبب تمييز؟",
+            "options": [
+                "منع أي قرار آلي نهائي واعتماد مراجعة بشرية",
+                "قرار آلي مبدئي مع حق اعتراض واضح للمستخدم",
+                "إيقاف تقييم الحساسية والاكتفاء بمؤشرات غير شخصية",
+            ],
+            "reason_summary": "الوكلاء محتاجين ضمانات عدالة ومنع التمييز.",
+        },
+        "unclear_target": {
+            "question": "مين الجمهور الأساسي اللي نركز عليه أولاً؟",
+            "options": [
+                "شريحة ضيقة جدًا كمرحلة أولى",
+                "شريحتين بمتطلبات متقاربة",
+                "سوق واسع مع تخصيص لاحق",
+            ],
+            "reason_summary": "فيه غموض في الشريحة المستهدفة.",
+        },
+        "unclear_value": {
+            "question": "إيه القيمة الأساسية اللي لازم تكون واضحة للمستخدم؟",
+            "options": [
+                "توفير وقت/تكلفة بشكل مباشر",
+                "تحسين الجودة والدقة",
+                "تقليل المخاطر والامتثال",
+            ],
+            "reason_summary": "الوكلاء طالبين توضيح أقوى للقيمة المقدمة.",
+        },
+        "feasibility_scalability": {
+            "question": "إيه مستوى التعقيد الفني المقبول في النسخة الأولى؟",
+            "options": [
+                "MVP بسيط بخصائص قليلة",
+                "نطاق متوسط مع بنية قابلة للتوسع",
+                "نطاق كامل من البداية مع استثمار أكبر",
+            ],
+            "reason_summary": "الأغلبية عندها قلق من قابلية التنفيذ والتوسع.",
+        },
+        "market_demand": {
+            "question": "إزاي نثبت الطلب السوقي قبل التوسع؟",
+            "options": [
+                "Pilot صغير بعملاء حقيقيين",
+                "اختبار أسعار مع صفحة انتظار",
+                "شراكة مبكرة مع عميل مؤسسي",
+            ],
+            "reason_summary": "الاعتراضات مرتبطة بوضوح الطلب والمنافسة.",
+        },
+        "evidence_gap": {
+            "question": "أي نوع دليل تحب نركز عليه قبل استكمال النقاش؟",
+            "options": [
+                "مصادر سوق وتسعير",
+                "لوائح وقوانين",
+                "مقابلات مستخدمين وحالات استخدام",
+            ],
+            "reason_summary": "الوكلاء محتاجين أدلة أقوى قبل الحسم.",
+        },
+    },
+    "en": {
+        "privacy_surveillance": {
+            "question": "What data-collection boundary should this idea enforce?",
+            "options": [
+                "Only user-submitted data",
+                "Public data with explicit consent",
+                "Extended data but with mandatory human review",
+            ],
+            "reason_summary": "Most agents flagged high privacy/surveillance risk.",
+        },
+        "legal_compliance": {
+            "question": "What compliance bar must be met before launch?",
+            "options": [
+                "Full compliance before launch",
+                "Limited pilot with explicit consent and audits",
+                "No high-impact decisions until compliance is complete",
+            ],
+            "reason_summary": "Objections are concentrated around legal/compliance risk.",
+        },
+        "ethical_discrimination": {
+            "question": "How should the system avoid discriminatory outcomes?",
+            "options": [
+                "No final automated decisions, always human review",
+                "Automated draft decision with clear appeal path",
+                "Remove sensitive scoring and keep non-personal signals only",
+            ],
+            "reason_summary": "Agents are asking for fairness and anti-bias safeguards.",
+        },
+        "unclear_target": {
+            "question": "Who is the primary target segment for phase one?",
+            "options": [
+                "A narrow niche segment",
+                "Two adjacent segments",
+                "Broad market with later specialization",
+            ],
+            "reason_summary": "Target segment is still ambiguous.",
+        },
+        "unclear_value": {
+            "question": "What single value promise should lead the pitch?",
+            "options": [
+                "Clear time/cost savings",
+                "Higher quality/accuracy",
+                "Risk reduction/compliance confidence",
+            ],
+            "reason_summary": "Agents need a sharper value proposition.",
+        },
+        "feasibility_scalability": {
+            "question": "What technical scope is realistic for v1?",
+            "options": [
+                "Lean MVP with minimal scope",
+                "Mid-scope with scalable architecture",
+                "Full-scope launch with larger investment",
+            ],
+            "reason_summary": "Feasibility and scalability are major concerns.",
+        },
+        "market_demand": {
+            "question": "How should demand be validated before scaling?",
+            "options": [
+                "Small paid pilot",
+                "Pricing test + waitlist",
+                "Early enterprise design partner",
+            ],
+            "reason_summary": "Debate is blocked on demand and competitive proof.",
+        },
+        "evidence_gap": {
+            "question": "Which evidence should we prioritize before continuing?",
+            "options": [
+                "Market/pricing evidence",
+                "Regulatory/compliance evidence",
+                "User interviews and use-case validation",
+            ],
+            "reason_summary": "Agents are blocked by missing evidence.",
+        },
+    },
+}
+for _language_templates in _CLARIFICATION_TEMPLATES.values():
+    for _reason_tag, _template in _language_templates.items():
+        _template["decision_axis"] = _CLARIFICATION_AXIS_MAP.get(_reason_tag, "evidence_priority")
+del _language_templates, _reason_tag, _template
+
+
+def _build_clarification_template(reason_tag: str, language: str) -> Dict[str, Any]:
+    templates = _CLARIFICATION_TEMPLATES["ar" if language == "ar" else "en"]
+    return templates.get(reason_tag, templates["evidence_gap"])
+
+
+def _normalize_clarification_options(raw_options: Any) -> List[Dict[str, str]]:
+    normalized: List[Dict[str, str]] = []
+    if isinstance(raw_options, list):
+        for item in raw_options:
+            label = ""
+            option_id = ""
+            if isinstance(item, str):
+                label = item.strip()
+            elif isinstance(item, dict):
+                label = str(
+                    item.get("label")
+                    or item.get("text")
+                    or item.get("value")
+                    or ""
+                ).strip()
+                option_id = str(
+                    item.get("id")
+                    or item.get("option_id")
+                    or ""
+                ).strip()
+            if not label:
+                continue
+            normalized.append(
+                {
+                    "id": option_id or f"opt_{len(normalized) + 1}",
+                    "label": label[:220],
+                }
+            )
+            if len(normalized) >= 3:
+                break
+    deduped: List[Dict[str, str]] = []
+    seen = set()
+    for item in normalized:
+        key = _normalized(item["label"])
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        deduped.append(item)
+        if len(deduped) >= 3:
+            break
+    return deduped
+
+
+def _extract_json_dict(raw_text: str) -> Dict[str, Any]:
+    text = str(raw_text or "").strip()
+    if not text:
+        return {}
+    # The model is asked for JSON, so the raw text usually parses as-is;
+    # only carve fenced/braced blocks out of it when it does not.
+    try:
+        parsed = _loads_json(text)
+    except Exception:
+        parsed = None
+    if isinstance(parsed, dict):
+        return parsed
+    fenced = _FENCED_JSON_RE.search(text)
+    if fenced:
+        try:
+            parsed = _loads_json(fenced.group(1))
+        except Exception:
+            parsed = None
+        if isinstance(parsed, dict):
+            return parsed
+    braced = _find_balanced(text, "{", "}")
+    if braced:
+        try:
+            parsed = _loads_json(braced)
+        except Exception:
+            return {}
+        if isinstance(parsed, dict):
+            return parsed
+    return {}
+
+
+def _find_balanced(text: str, open_ch: str, close_ch: str) -> Optional[str]:
+    """Return the span from the first ``open_ch`` to its matching ``close_ch``.
+
+    Brackets inside JSON strings (honouring backslash escapes) are ignored.
+    The scan jumps between bracket, quote and backslash characters, so it is
+    linear in the text, unlike a greedy ``.*`` search that can backtrack.
+    """
+    start = text.find(open_ch)
+    if start < 0:
+        return None
+    depth = 0
+    in_string = False
+    escaped_at = -1
+    for match in _BALANCE_TOKEN_RES[open_ch].finditer(text, start):
+        pos = match.start()
+        if pos == escaped_at:
+            continue
+        ch = match.group()
+        if ch == "\\":
+            if in_string:
+                escaped_at = pos + 1
+        elif ch == '"':
+            in_string = not in_string
+        elif in_string:
+            continue
+        elif ch == open_ch:
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return text[start:pos + 1]
+    return None
+
 
+def _candidate_json_fragments(raw_text: str) -> Iterator[str]:
+    """Yield the raw text, then fenced, braced and bracketed blocks carved out of it.
+
+    Fragments are produced lazily, so a response that already parses never
+    reaches the regex scans, and each distinct fragment is yielded only once
+    so the same text is never handed to json.loads twice.
+    """
+    yield raw_text
+    seen = {raw_text}
+    fenced = _FENCED_JSON_FRAGMENT_RE.search(raw_text)
+    if fenced:
+        fragment = fenced.group(1).strip()
+        if fragment not in seen:
+            seen.add(fragment)
+            yield fragment
+    for open_ch, close_ch in (("{", "}"), ("[", "]")):
+        block = _find_balanced(raw_text, open_ch, close_ch)
+        if block and block not in seen:
+            seen.add(block)
+            yield block
+
+
+def _window_keys(item: Dict[str, Any]) -> Tuple[Any, Optional[str], Optional[str]]:
+    """Return (opinion, focus reason tag, unresolved fallback reason) for a window entry."""
+    opinion = item.get("opinion")
+    tag = str(item.get("reason_tag") or "evidence_gap") if opinion in _NONPOSITIVE_OPINIONS else None
+    fallback_reason: Optional[str] = None
+    raw_fallback = item.get("fallback_reason")
+    if raw_fallback:
+        normalized_fallback = str(raw_fallback).strip().lower()
+        if normalized_fallback in _UNRESOLVED_FALLBACK_REASONS:
+            fallback_reason = normalized_fallback
+    return opinion, tag, fallback_reason
+
+
+class _ClarificationWindow:
+    """Sliding window of phase dialogue outcomes for the clarification gate.
+
+    Opinion, reason-tag and fallback tallies are kept up to date as entries
+    enter and leave the window, so evaluating the gate does not rescan it.
+    Each entry's keys are derived once on append and reused on eviction.
+    Entries must not be mutated after they are appended.
+    """
+
+    def __init__(self, maxlen: int) -> None:
+        self._items: deque[Dict[str, Any]] = deque(maxlen=maxlen)
+        self._keys: deque[Tuple[Any, Optional[str], Optional[str]]] = deque(maxlen=maxlen)
+        self._reset_counts()
+
+    def reset(self, maxlen: int) -> None:
+        """Empty the window for a new phase, keeping its buffers if the size is unchanged."""
+        if self._items.maxlen == maxlen:
+            self._items.clear()
+            self._keys.clear()
+        else:
+            self._items = deque(maxlen=maxlen)
+            self._keys = deque(maxlen=maxlen)
+        self._reset_counts()
+
+    def _reset_counts(self) -> None:
+        self.reject_count = 0
+        self.neutral_count = 0
+        self.focus_count = 0
+        self.unresolved_fallback_count = 0
+        self.tag_counter: Counter[str] = Counter()
+        self.fallback_counter: Counter[str] = Counter()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def append(self, item: Dict[str, Any]) -> None:
+        if len(self._items) == self._items.maxlen:
+            self._account(self._keys[0], -1)
+        keys = _window_keys(item)
+        self._items.append(item)
+        self._keys.append(keys)
+        self._account(keys, 1)
+
+    def _account(self, keys: Tuple[Any, Optional[str], Optional[str]], delta: int) -> None:
+        opinion, tag, fallback_reason = keys
+        if opinion == "reject":
+            self.reject_count += delta
+        elif opinion == "neutral":
+            self.neutral_count += delta
+        if tag is not None:
+            self.focus_count += delta
+            self._bump(self.tag_counter, tag, delta)
+        if fallback_reason is not None:
+            self.unresolved_fallback_count += delta
+            self._bump(self.fallback_counter, fallback_reason, delta)
+
+    @staticmethod
+    def _bump(counter: Counter[str], key: str, delta: int) -> None:
+        count = counter[key] + delta
+        if count > 0:
+            counter[key] = count
+        else:
+            del counter[key]
+
+    def _leader(self, counter: Counter[str], key_index: int) -> Tuple[str, int]:
+        best = max(counter.values())
+        leaders = [key for key, count in counter.items() if count == best]
+        if len(leaders) > 1:
+            # Ties go to the key seen first in the current window, matching a
+            # Counter built from a fresh scan.
+            for keys in self._keys:
+                key = keys[key_index]
+                if key in leaders:
+                    return key, best
+        return leaders[0], best
+
+    def top_reason_tag(self) -> Tuple[str, int]:
+        return self._leader(self.tag_counter, 1)
+
+    def dominant_fallback_reason(self) -> Tuple[str, int]:
+        return self._leader(self.fallback_counter, 2)
+
+    def focus_items(self) -> List[Dict[str, Any]]:
+        return [item for item, keys in zip(self._items, self._keys) if keys[1] is not None]
+
+
+class _DialogueHistory:
+    """Bounded dialogue context with a per-opinion index for reply targeting.
+
+    Each opinion bucket keeps (sequence, entry) pairs; a pair is live while its
+    sequence is still inside the bounded history, so reply lookups read from
+    the bucket tails instead of scanning the whole history.
+    """
+
+    def __init__(self, entries: Sequence[Dict[str, Any]], maxlen: int) -> None:
+        self._entries: deque[Dict[str, Any]] = deque(maxlen=maxlen)
+        self._by_opinion: Dict[Optional[str], deque[Tuple[int, Dict[str, Any]]]] = {}
+        self._next_seq = 0
+        for entry in entries:
+            self.append(entry)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def recent(self, count: int) -> List[Dict[str, Any]]:
+        """The last ``count`` entries, oldest first, without copying the rest."""
+        return list(islice(reversed(self._entries), count))[::-1]
+
+    @property
+    def version(self) -> int:
+        """Number of entries appended so far; changes whenever the history does."""
+        return self._next_seq
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        opinion = entry.get("opinion")
+        key = opinion if isinstance(opinion, str) else None
+        bucket = self._by_opinion.get(key)
+        if bucket is None:
+            bucket = self._by_opinion[key] = deque(maxlen=self._entries.maxlen)
+        bucket.append((self._next_seq, entry))
+        self._entries.append(entry)
+        self._next_seq += 1
+
+    def reply_target(self, agent_id: str, opinion: str) -> Optional[Dict[str, Any]]:
+        """Latest entry by another agent, preferring one with a different opinion."""
+        oldest_live = self._next_seq - len(self._entries)
+        best: Optional[Dict[str, Any]] = None
+        best_seq = -1
+        for key, bucket in self._by_opinion.items():
+            if key == opinion:
+                continue
+            for seq, entry in reversed(bucket):
+                if seq < oldest_live or seq <= best_seq:
+                    break
+                if entry.get("agent_id") != agent_id:
+                    best, best_seq = entry, seq
+                    break
+        if best is not None:
+            return best
+        for entry in reversed(self._entries):
+            if entry.get("agent_id") != agent_id:
+                return entry
+        return None
+
+
+@dataclass(slots=True)
+class _ReasoningTask:
+    """One agent's reasoning turn within an iteration, with fields already typed."""
+
+    agent: Agent
+    prev_opinion: str
+    math_opinion: str
+    changed: bool
+    role_label: str
+    phase_label: str
+    role_guidance: str
+    traits_summary: str
+    bias_summary: str
+    length_mode: str
+    emit_message: bool
+    evidence_hint: str = ""
+    # Shared between tasks of the same role, hence immutable.
+    evidence_hints: Tuple[str, ...] = ()
+    evidence_confidence: Optional[float] = None
+    reply_to_id: str = ""
+    reply_to_short: str = ""
+    reply_to_message: str = ""
+    # Checkpoints re-send the whole phase task list every time; a task only
+    # changes when its reply target is set, so its serialized form is reused.
+    _serialized: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
+    def set_reply_target(self, reply_to_id: str, reply_to_short: str, reply_to_message: str) -> None:
+        self.reply_to_id = reply_to_id
+        self.reply_to_short = reply_to_short
+        self.reply_to_message = reply_to_message
+        self._serialized = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Checkpoint form of the task; the returned dict is shared and must not be mutated."""
+        if self._serialized is None:
+            self._serialized = self._build_dict()
+        return self._serialized
+
+    def _build_dict(self) -> Dict[str, Any]:
+        return {
+            "agent_id": self.agent.agent_id,
+            "prev_opinion": self.prev_opinion,
+            "math_opinion": self.math_opinion,
+            "changed": bool(self.changed),
+            "role_label": self.role_label,
+            "phase_label": self.phase_label,
+            "role_guidance": self.role_guidance,
+            "traits_summary": self.traits_summary,
+            "bias_summary": self.bias_summary,
+            "reply_to_id": self.reply_to_id,
+            "reply_to_short": self.reply_to_short,
+            "reply_to_message": self.reply_to_message,
+            "length_mode": self.length_mode,
+            "emit_message": bool(self.emit_message),
+            "evidence_hint": self.evidence_hint,
+            "evidence_hints": list(self.evidence_hints),
+            "evidence_confidence": self.evidence_confidence,
+        }
+
+
+@dataclass(slots=True)
+class _ReasoningStats:
+    """Per-run reasoning telemetry counters, reported under ``reasoning_telemetry``."""
+
+    total_steps: int = 0
+    fallback_steps: int = 0
+    classified_steps: int = 0
+    regeneration_attempts: int = 0
+    autorepair_attempts: int = 0
+    autorepair_success: int = 0
+    low_quality_steps: int = 0
+    quality_flags: Dict[str, int] = field(default_factory=dict)
+    rejections: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_steps": self.total_steps,
+            "fallback_steps": self.fallback_steps,
+            "classified_steps": self.classified_steps,
+            "regeneration_attempts": self.regeneration_attempts,
+            "autorepair_attempts": self.autorepair_attempts,
+            "autorepair_success": self.autorepair_success,
+            "low_quality_steps": self.low_quality_steps,
+            "quality_flags": dict(self.quality_flags),
+            "rejections": dict(self.rejections),
+        }
 
 
 class ClarificationNeeded(RuntimeError):
@@ -41,6 +743,493 @@ class ClarificationNeeded(RuntimeError):
         self.payload = payload
 
 
+def _clip_text(value: str, limit: int) -> str:
+    # str.split() breaks on exactly the characters ``\s`` matches, so this is
+    # _WHITESPACE_RE.sub(" ", ...) plus strip() without the regex engine.
+    value = " ".join((value or "").split())
+    if len(value) <= limit:
+        return value
+    return value[: max(0, limit - 3)].rstrip() + "..."
+
+
+def _script_counts(text: str) -> Tuple[int, int]:
+    """(Latin letters, Arabic-block characters) in ``text``, counted by the regex engine."""
+    return len(_LATIN_CHAR_RE.findall(text)), len(_ARABIC_CHAR_RE.findall(text))
+
+
+def _str_field(data: Dict[str, Any], key: str, default: Any = "") -> str:
+    """``str(data.get(key) or default)`` that hands back non-empty strings as-is."""
+    value = data.get(key)
+    if isinstance(value, str) and value:
+        return value
+    return str(value or default)
+
+
+@lru_cache(maxsize=4096)
+def _normalized(text: str) -> str:
+    # Dedupe keys for option labels and agent messages recur across gate
+    # evaluations; the bounded cache turns those repeats into a dict hit.
+    return " ".join((text or "").lower().split())
+
+
+@lru_cache(maxsize=256)
+def _persona_vocab(archetype: str, category: str, language: str) -> Tuple[str, ...]:
+    a = archetype.lower()
+    c = category.lower()
+    if "tech" in a or "developer" in a or "engineer" in c:
+        return (
+            ("تحسين الكفاءة", "قابلية التوسع", "زمن الاستجابة", "استقرار النظام")
+            if language == "ar"
+            else ("efficiency gains", "scalability", "latency and reliability", "automation potential")
+        )
+    if "entrepreneur" in a or "business" in a:
+        return (
+            ("العائد على الاستثمار", "طلب السوق", "هامش الربح", "تكلفة الاستحواذ")
+            if language == "ar"
+            else ("ROI", "market demand", "profit margin", "pricing leverage")
+        )
+    if "worker" in a or "employee" in c:
+        return (
+            ("التوفير الشهري", "سهولة الاستخدام", "الاستقرار الوظيفي", "الموثوقية")
+            if language == "ar"
+            else ("monthly savings", "reliability", "day-to-day usability", "job stability")
+        )
+    return (
+        ("توافق السوق", "الثقة", "الامتثال", "تبني المستخدمين")
+        if language == "ar"
+        else ("go-to-market traction", "trust", "compliance", "user adoption")
+    )
+
+
+# Phrase pools for the template-based debate/reasoning messages, keyed by language.
+_ARABIC_PEER_TAGS: Tuple[str, ...] = ("أ", "ب", "ج", "د", "هـ", "و", "ز", "ح", "ط", "ي")
+_PEER_LABELS: Dict[str, Tuple[str, ...]] = {
+    "en": ("Agent A", "Agent B", "Agent C"),
+    "ar": ("الوكيل أ", "الوكيل ب", "الوكيل ج"),
+}
+_REASONING_PREFIXES: Dict[str, Tuple[str, ...]] = {
+    "en": ("From my perspective", "Given my background", "As someone in this segment", "In my view"),
+    "ar": ("من وجهة نظري", "بحكم خبرتي", "كممثل لهذا النوع من الجمهور", "برأيي الشخصي"),
+}
+_DEBATE_TEMPLATES: Dict[Tuple[str, str], str] = {
+    ("ar", "reject"): (
+        "{other_tag} شايف الفكرة جيدة، لكن {focal} ما زالت نقطة ضعف واضحة عندي. "
+        "محتاج دليل عملي أو أرقام قبل ما أغيّر رأيي. ({constraints}){insight_clause}"
+    ),
+    ("ar", "accept"): (
+        "{other_tag} متحفظ، لكني شايف أن {focal} يعطي أفضلية واضحة للفكرة حتى الآن. ({constraints}){insight_clause}"
+    ),
+    ("ar", "neutral"): "{other_tag} قال رأيه، وأنا محايد لأن تفاصيل {focal} غير محسومة حتى الآن. ({constraints}){insight_clause}",
+    ("en", "reject"): (
+        "{other_tag} likes the idea, but I still see {focal} as a major weak spot. "
+        "I need concrete proof before moving. ({constraints}){insight_clause}"
+    ),
+    ("en", "accept"): "{other_tag} is cautious, but I think {focal} keeps the upside credible right now. ({constraints}){insight_clause}",
+    ("en", "neutral"): "{other_tag} shared a view; I'm still neutral because {focal} feels unresolved. ({constraints}){insight_clause}",
+}
+_DEBATE_INSIGHT_CLAUSES: Dict[str, str] = {
+    "en": " Also, {insight}.",
+    "ar": " أيضاً، {insight}.",
+}
+# How many recently accepted reasoning openers are remembered to block reuse.
+_USED_OPENERS_LIMIT = 512
+# A hard-unsafe idea's reasoning must mention at least one of these.
+_SAFETY_ANCHOR_TOKENS = frozenset({
+    "privacy", "ethical", "ethic", "legal", "compliance", "discrimination", "bias", "consent",
+    "خصوصية", "أخلاقي", "قانون", "امتثال", "تمييز", "تحيز", "موافقة",
+})
+# Signal snippets are ranked up for these safety words and down for listicle noise.
+_SIGNAL_SAFETY_TOKENS = frozenset({
+    "privacy", "legal", "compliance", "discrimination", "bias", "consent",
+    "خصوصية", "قانون", "امتثال", "تمييز", "تحيز", "موافقة", "مراقبة",
+})
+_SIGNAL_NOISE_MARKERS = (
+    "best", "top", "list", "review", "rank", "ranking", "software", "tools", "guide",
+    "الأفضل", "افضل", "قائمة", "دليل", "مراجعة",
+)
+_IDEA_CONCERN_GROUPS: Tuple[Tuple[Tuple[str, ...], Dict[str, str]], ...] = (
+    (("legal", "court", "lawsuit", "police", "regulation"), {"en": "regulation and liability", "ar": "اللوائح والمسؤولية"}),
+    (("predict", "prediction", "outcome"), {"en": "prediction accuracy", "ar": "دقة التنبؤ"}),
+    (("documents", "upload", "records", "photos"), {"en": "privacy and data security", "ar": "الخصوصية وأمن البيانات"}),
+)
+_IDEA_CONCERN_FALLBACKS: Dict[str, Tuple[str, ...]] = {
+    "en": (
+        "go-to-market traction and delivery risk",
+        "distribution hurdles and adoption friction",
+        "rollout complexity and operational load",
+        "positioning clarity and execution strain",
+    ),
+    "ar": (
+        "توافق السوق وتعقيدات الإطلاق",
+        "عوائق التوزيع وصعوبة التبني",
+        "تعقيد الإطلاق والضغط التشغيلي",
+        "وضوح التموضع وإجهاد التنفيذ",
+    ),
+}
+_ACCEPT_REASON_TEMPLATES: Dict[str, Tuple[str, ...]] = {
+    "en": ("{focal} looks strong", "{focal} is still compelling", "{focal} keeps the value clear"),
+    "ar": ("{focal} تبدو قوية", "{focal} ما زالت مقنعة", "{focal} توضح القيمة بشكل كافٍ"),
+}
+_REJECT_REASON_TEMPLATES: Dict[str, Tuple[str, ...]] = {
+    "en": (
+        "{focal} risk feels too high, especially around {concern}",
+        "{focal} uncertainty is still too high",
+        "{focal} and {other_concern} are unresolved",
+    ),
+    "ar": (
+        "مخاطر {focal} مرتفعة، خصوصاً فيما يتعلق بـ {concern}",
+        "عدم وضوح {focal} ما زال كبيراً",
+        "{focal} و {other_concern} لم تُحل بعد",
+    ),
+}
+
+
+_STOP_WORDS_EN = frozenset({
+    "the", "and", "for", "with", "that", "this", "from", "are", "was", "were", "have", "has", "had",
+    "you", "your", "but", "not", "about", "into", "out", "our", "their", "they", "them", "its", "it's",
+    "will", "would", "should", "could", "can", "may", "might", "just", "like", "very", "than", "then",
+    "more", "less", "also", "because", "as", "at", "by", "to", "of", "in", "on",
+})
+_STOP_WORDS_AR = frozenset({
+    "هذا", "هذه", "ذلك", "تلك", "هنا", "هناك", "الذي", "التي", "الذين",
+    "من", "إلى", "على", "في", "عن", "مع", "بين", "أو", "و", "ثم",
+    "هو", "هي", "هم", "هن", "كان", "كانت", "يكون", "تكون",
+    "ما", "لا", "لم", "لن", "قد", "لقد", "تم", "كل", "أي",
+    "أنا", "انت", "أنت", "انتي", "أنتِ", "نحن", "هم", "هن",
+    "لدى", "عند", "بعد", "قبل", "فقط", "أيضا", "أكثر", "أقل",
+    "جدا", "تماما", "تقريبا", "ضمن", "حول", "بشكل", "طريقة",
+    "الفكرة", "مشروع", "المشروع", "النظام",
+})
+
+_WORD_RE = re.compile(r"[A-Za-z]{3,}|[\u0600-\u06FF]{3,}")
+_LATIN_WORD_RE = re.compile(r"[A-Za-z]{3,}")
+
+
+def _extract_words(text: str) -> List[str]:
+    if not text:
+        return []
+    if text.isascii():
+        # Pure-ASCII text can only yield Latin words, so skip the Arabic branch
+        # of the pattern and the Arabic stop-word lookup entirely.
+        return [word for word in _LATIN_WORD_RE.findall(text.lower()) if word not in _STOP_WORDS_EN]
+    cleaned: List[str] = []
+    for word in _WORD_RE.findall(text):
+        lower = word.lower()
+        if lower in _STOP_WORDS_EN or word in _STOP_WORDS_AR:
+            continue
+        cleaned.append(lower)
+    return cleaned
+
+# Zero-width and bidi control characters that LLM output (mostly Arabic) carries
+# without changing the visible text.
+_SNIPPET_KEY_TABLE = str.maketrans(dict.fromkeys("\u200b\u200c\u200d\u200e\u200f\u2066\u2067\u2068\u2069\ufeff"))
+
+
+def _snippet_key(text: str) -> str:
+    # Dropping a mark between two spaces leaves a double space, so whitespace is
+    # collapsed after the translate rather than relying on _clip_text's pass.
+    return " ".join(text.translate(_SNIPPET_KEY_TABLE).lower().split())
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+# Folding "!" and "?" into "." lets sentence splitting use one C-level
+# str.split instead of a regex over the [.!?] character class.
+_SENTENCE_END_TABLE = str.maketrans("!?", "..")
+_ARABIC_CHAR_RE = re.compile(r"[\u0600-\u06FF]")
+_LATIN_CHAR_RE = re.compile(r"[A-Za-z]")
+_FENCED_JSON_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+_FENCED_JSON_FRAGMENT_RE = re.compile(r"```(?:json)?\s*(\{.*?\}|\[.*?\])\s*```", re.DOTALL)
+_LETTER_RUN_RE = re.compile(r"[A-Za-z\u0600-\u06FF]+")
+_SENTENCE_BREAK_RE = re.compile(r"(?<=[.!?؟])\s+")
+# The emergency generator's class carries "طں", a mis-encoded "؟"; it is kept
+# as-is so that path trims replies exactly as before.
+_EMERGENCY_SENTENCE_BREAK_RE = re.compile(r"(?<=[.!?طں])\s+")
+_CONTEXT_ECHO_RE = re.compile(r"\([^\)]*(category=|audience=|goals=|maturity=|location=|risk=)\s*[^\)]*\)")
+# Characters _find_balanced has to look at, per opening bracket.
+_BALANCE_TOKEN_RES: Dict[str, "re.Pattern[str]"] = {
+    "{": re.compile(r'[{}"\\]'),
+    "[": re.compile(r'[\[\]"\\]'),
+}
+
+
+# Canned openers and boilerplate phrases that mark a reasoning candidate as a
+# template. Each list is one alternation, so a candidate is checked in a single
+# regex pass: anchored at the start for prefixes, anywhere for generic phrases.
+_TEMPLATE_PREFIX_RE = re.compile("|".join(re.escape(_normalized(sig)) for sig in (
+    "كمختص",
+    "as a",
+    "I need more clarity",
+    "this could work if executed carefully",
+    "this is too risky to accept as-is",
+)))
+_GENERIC_TEMPLATE_RE = re.compile("|".join(re.escape(_normalized(sig)) for sig in (
+    "As a specialist",
+    "Based on the available data",
+    "I need more concrete detail before deciding",
+    "كمختص",
+    "أنا محتاج توضيح أكتر قبل ما أحكم",
+)))
+# Phrases the legacy reasoning helpers reject; the validator's list is fixed at
+# import, so it is lowered and joined with the engine's own phrases once.
+_FORBIDDEN_PHRASES = tuple(str(phrase).lower() for phrase in build_default_forbidden_phrases() if phrase)
+_BANNED_REASONING_PHRASES = _FORBIDDEN_PHRASES + (
+    "execution risks",
+    "market fit",
+    "evidence is inconclusive",
+    "insufficient data",
+)
+# One alternation, like the template patterns above, so a check is a single scan.
+_BANNED_REASONING_RE = re.compile("|".join(map(re.escape, _BANNED_REASONING_PHRASES)))
+
+
+def _encode_tokens(tokens: Tuple[str, ...]) -> Tuple[bytes, ...]:
+    return tuple(token.encode("utf-8") for token in tokens if token)
+
+
+# Keyword groups are matched against the UTF-8 bytes of the idea text; UTF-8 is
+# self-synchronizing, so a bytes hit is exactly a str substring hit.
+_RISK_TOKEN_GROUPS: Tuple[Tuple[float, Tuple[bytes, ...]], ...] = (
+    (0.15, _encode_tokens(("legal", "court", "lawsuit", "police", "regulation"))),
+    (0.1, _encode_tokens(("predict", "prediction", "outcome", "diagnosis"))),
+    (0.15, _encode_tokens(("medical", "health", "clinic", "doctor"))),
+    (0.08, _encode_tokens(("documents", "upload", "records"))),
+    (0.2, _encode_tokens((
+        "privacy",
+        "surveillance",
+        "tracking",
+        "gps",
+        "location",
+        "bank",
+        "banking",
+        "account",
+        "credit",
+        "wallet",
+        "messages",
+        "email",
+        "chat",
+        "dm",
+        "personal data",
+        "pii",
+        "biometric",
+        "password",
+        "ssn",
+        "social security",
+        "خصوص",
+        "تجسس",
+        "موقع",
+        "رسائل",
+        "بنك",
+        "حساب",
+        "بطاقة",
+        "بيانات",
+        "هوية",
+        "رقم قومي",
+    ))),
+)
+
+_UNSAFE_TOKENS_BYTES_INVASIVE = _encode_tokens((
+    "private message", "private messages", "dm", "chat history", "bank", "banking", "credit card",
+    "gps", "location tracking", "political", "religious", "biometric", "surveillance", "monitoring",
+    "رسائل خاصة", "الرسائل الخاصة", "سجل مشترياته", "مشتريات بنكية", "تحركاته", "gps", "آرائه السياسية", "الدينية",
+    "مراقبة", "تتبع", "خصوصية",
+))
+_UNSAFE_TOKENS_BYTES_PUNITIVE = _encode_tokens((
+    "ban", "blacklist", "block from applying", "for 5 years", "five years", "statewide ban",
+    "حظر", "منع", "قائمة سوداء", "لمدة 5 سنوات", "خمس سنوات", "من التقديم",
+))
+_UNSAFE_TOKENS_BYTES_SCORING = _encode_tokens((
+    "trust score", "social score", "risk score", "درجة ثقة", "نظام نقاط", "تصنيف المتقدمين",
+))
+_UNSAFE_TOKEN_GROUPS: Tuple[Tuple[str, float, Tuple[bytes, ...]], ...] = (
+    ("invasive_data_collection", 0.45, _UNSAFE_TOKENS_BYTES_INVASIVE),
+    ("disproportionate_punitive_outcome", 0.35, _UNSAFE_TOKENS_BYTES_PUNITIVE),
+    ("high_risk_automated_scoring", 0.20, _UNSAFE_TOKENS_BYTES_SCORING),
+)
+
+
+def _idea_risk_score(idea_text: str) -> float:
+    text_bytes = idea_text.lower().encode("utf-8")
+    score = 0.0
+    for weight, tokens in _RISK_TOKEN_GROUPS:
+        if any(token in text_bytes for token in tokens):
+            score += weight
+    return min(0.6, score)
+
+
+def _classify_hard_unsafe_policy(text: str) -> Tuple[bool, Optional[str], float]:
+    normalized = (text or "").strip().lower()
+    if not normalized:
+        return False, None, 0.0
+    text_bytes = normalized.encode("utf-8")
+    score = 0.0
+    reasons: List[str] = []
+    for reason, weight, tokens in _UNSAFE_TOKEN_GROUPS:
+        if any(token in text_bytes for token in tokens):
+            score += weight
+            reasons.append(reason)
+
+    if score >= 0.55:
+        return True, ",".join(reasons[:3]) or "unsafe_policy", min(1.0, score)
+    return False, None, min(1.0, score)
+
+
+def _research_signals_text(research_structured: Any) -> str:
+    signals = research_structured.get("signals") if isinstance(research_structured, dict) else []
+    if isinstance(signals, list) and signals:
+        return "; ".join(str(s) for s in signals[:6])
+    return ""
+
+
+def _constraints_summary(user_context: Dict[str, Any], language: str, preflight_summary: str) -> str:
+    category = str(user_context.get("category") or "")
+    audience = ", ".join(user_context.get("targetAudience") or [])
+    goals = ", ".join(user_context.get("goals") or [])
+    risk = user_context.get("riskAppetite")
+    maturity = str(user_context.get("ideaMaturity") or "")
+    location = f"{user_context.get('city') or ''}, {user_context.get('country') or ''}".strip(", ")
+    parts = []
+    if category:
+        parts.append(f"category={category}" if language != "ar" else f"الفئة={category}")
+    if audience:
+        parts.append(f"audience={audience}" if language != "ar" else f"الجمهور={audience}")
+    if goals:
+        parts.append(f"goals={goals}" if language != "ar" else f"الأهداف={goals}")
+    if maturity:
+        parts.append(f"maturity={maturity}" if language != "ar" else f"نضج الفكرة={maturity}")
+    if location:
+        parts.append(f"location={location}" if language != "ar" else f"المكان={location}")
+    if isinstance(risk, (int, float)):
+        parts.append(f"risk={risk:.2f}" if language != "ar" else f"المخاطرة={risk:.2f}")
+    if preflight_summary:
+        clipped_summary = _clip_text(preflight_summary, 180)
+        parts.append(
+            f"preflight={clipped_summary}" if language != "ar" else f"توضيح ما قبل التشغيل={clipped_summary}"
+        )
+    return "; ".join(parts)
+
+
+def _precompute_idea_profile(
+    idea_text: str,
+    language: str,
+    user_context: Dict[str, Any],
+    preflight_summary: str,
+    safety_guard_enabled: bool,
+) -> Dict[str, Any]:
+    """Derive the CPU-only idea signals a run needs before its first LLM call."""
+    hard_unsafe: Tuple[bool, Optional[str], float] = (False, None, 0.0)
+    if safety_guard_enabled:
+        hard_unsafe = _classify_hard_unsafe_policy(idea_text)
+    return {
+        "risk": _idea_risk_score(idea_text),
+        "hard_unsafe": hard_unsafe,
+        "constraints_summary": _constraints_summary(user_context, language, preflight_summary),
+    }
+
+
+def _compile_keyword_matcher(
+    groups: Dict[str, Sequence[str]],
+) -> Tuple["re.Pattern[str]", Dict[str, FrozenSet[str]]]:
+    """Build one scan that reports every group whose keyword occurs in a text.
+
+    The lookahead matches at every offset and prefers the longest keyword there;
+    each keyword also carries the groups of its own keyword prefixes, so nested
+    and overlapping hits are not lost to the leftmost-first alternation.
+    """
+    keywords = sorted({key for keys in groups.values() for key in keys if key}, key=len, reverse=True)
+    groups_by_keyword: Dict[str, FrozenSet[str]] = {
+        keyword: frozenset(
+            group
+            for group, keys in groups.items()
+            if any(keyword.startswith(key) for key in keys if key)
+        )
+        for keyword in keywords
+    }
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+    return pattern, groups_by_keyword
+
+
+def _keyword_groups(text: str, matcher: Tuple["re.Pattern[str]", Dict[str, FrozenSet[str]]]) -> set[str]:
+    pattern, groups_by_keyword = matcher
+    found: set[str] = set()
+    for keyword in set(pattern.findall(text)):
+        found |= groups_by_keyword[keyword]
+    return found
+
+
+# Role keywords used to route evidence cards to the matching role briefs.
+_ROLE_EVIDENCE_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "tech": ("latency", "scalability", "performance", "api", "backend", "server", "security"),
+    "business": ("roi", "cac", "market", "pricing", "competition", "demand", "margin", "revenue"),
+    "employee": ("budget", "stability", "workflow", "training", "salary", "workload"),
+    "health": ("ethic", "privacy", "patient", "safety", "clinical", "harm", "mental"),
+    "policy": ("law", "regulation", "compliance", "liability", "gdpr", "audit"),
+    "consumer": ("price", "cost", "usability", "trust", "support", "onboarding"),
+}
+_ROLE_EVIDENCE_MATCHER = _compile_keyword_matcher(_ROLE_EVIDENCE_KEYWORDS)
+
+# Broader focus keywords used to slice research text for each agent.
+_FOCUS_RESEARCH_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "tech": ("latency", "scalability", "performance", "throughput", "reliability", "uptime", "api", "backend", "server", "security", "infrastructure"),
+    "health": ("patient", "safety", "ethic", "clinical", "privacy", "consent", "care", "harm", "mental"),
+    "policy": ("regulation", "law", "compliance", "liability", "privacy", "audit", "gdpr"),
+    "business": ("market", "pricing", "roi", "competition", "demand", "margin", "acquisition", "growth", "cac"),
+    "employee": ("budget", "stability", "workflow", "training", "support", "salary", "workload"),
+    "consumer": ("price", "cost", "usability", "convenience", "support", "trust", "onboarding"),
+}
+_FOCUS_RESEARCH_MATCHER = _compile_keyword_matcher(_FOCUS_RESEARCH_KEYWORDS)
+
+# Reason tags in priority order: the first tag with any keyword in a message wins.
+_REASON_TAG_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "privacy_surveillance": (
+        "privacy", "surveillance", "tracking", "gps", "messages", "private chat", "bank", "banking",
+        "pii", "personal data", "monitor", "مراقبة", "خصوصية", "تتبع", "تحركات", "رسائل خاصة", "بيانات شخصية",
+    ),
+    "legal_compliance": (
+        "legal", "law", "gdpr", "eeoc", "compliance", "regulation", "liability", "audit", "policy",
+        "قانون", "امتثال", "تشريعات", "لائحة", "تنظيم", "مساءلة", "تدقيق",
+    ),
+    "ethical_discrimination": (
+        "ethic", "ethical", "discrimination", "bias", "fairness", "unfair", "تمييز", "تحيز", "عدالة", "أخلاقي",
+    ),
+    "unclear_target": (
+        "target audience", "segment", "customer", "persona", "who will use", "من هو العميل", "الجمهور", "الشريحة",
+    ),
+    "unclear_value": (
+        "value proposition", "why now", "unclear value", "problem fit", "need clearer benefit",
+        "القيمة", "غير واضح", "الفائدة", "حل المشكلة",
+    ),
+    "feasibility_scalability": (
+        "feasible", "feasibility", "scalability", "latency", "infrastructure", "implementation",
+        "maintenance", "complexity", "deploy", "تشغيل", "قابلية", "توسع", "تنفيذ", "تعقيد",
+    ),
+    "market_demand": (
+        "market", "demand", "competition", "pricing", "cac", "roi", "sales", "traction",
+        "السوق", "الطلب", "منافسة", "تسعير", "عوائد",
+    ),
+    "evidence_gap": (
+        "evidence", "source", "citation", "proof", "missing data", "insufficient data", "need data",
+        "أدلة", "مصدر", "إثبات", "بيانات غير كافية",
+    ),
+}
+_REASON_TAG_MATCHER = _compile_keyword_matcher(_REASON_TAG_KEYWORDS)
+
+
+# Template options pre-normalized once, so fallback paths reuse them instead of
+# re-normalizing the same literals for every clarification.
+_CLARIFICATION_TEMPLATE_OPTIONS: Dict[str, Dict[str, List[Dict[str, str]]]] = {
+    template_language: {
+        reason_tag: _normalize_clarification_options(template.get("options"))
+        for reason_tag, template in templates.items()
+    }
+    for template_language, templates in _CLARIFICATION_TEMPLATES.items()
+}
+
+
+def _clarification_template_options(reason_tag: str, language: str) -> List[Dict[str, str]]:
+    options_by_tag = _CLARIFICATION_TEMPLATE_OPTIONS["ar" if language == "ar" else "en"]
+    return options_by_tag.get(reason_tag, options_by_tag["evidence_gap"])
+
+
 class SimulationEngine:
     """Driver for executing social simulations.
 
@@ -52,11 +1241,13 @@ class SimulationEngine:
 
     def __init__(self, dataset: Dataset) -> None:
         self.dataset = dataset
+        # Engine-wide ceiling on in-flight LLM requests, shared by every run on
+        # this engine; each run additionally keeps its own dialogue sequential.
         try:
-            concurrency = int(os.getenv("LLM_CONCURRENCY", "1"))
+            concurrency = int(os.getenv("SIM_LLM_CONCURRENCY") or os.getenv("LLM_CONCURRENCY") or 4)
         except ValueError:
-            concurrency = 1
-        self._llm_semaphore = asyncio.Semaphore(max(1, concurrency))
+            concurrency = 4
+        self._llm_semaphore = asyncio.Semaphore(max(1, min(32, concurrency)))
         self._llm_timeout = float(os.getenv("LLM_REASONING_TIMEOUT", "15.0"))
 
     @staticmethod
@@ -66,13 +1257,7 @@ class SimulationEngine:
     @staticmethod
     def _is_template_message(message: str) -> bool:
         lowered = SimulationEngine._normalize_msg(message)
-        banned_phrases = build_default_forbidden_phrases() + [
-            "execution risks",
-            "market fit",
-            "evidence is inconclusive",
-            "insufficient data",
-        ]
-        return any(phrase in lowered for phrase in banned_phrases)
+        return _BANNED_REASONING_RE.search(lowered) is not None
 
     @staticmethod
     def _serialize_random_state(state: object) -> str:
@@ -199,30 +1384,6 @@ class SimulationEngine:
             restored.append(agent)
         return restored
 
-    @staticmethod
-    def _serialize_task(task: Dict[str, Any]) -> Dict[str, Any]:
-        agent = task.get("agent")
-        return {
-            "agent_id": getattr(agent, "agent_id", ""),
-            "prev_opinion": task.get("prev_opinion"),
-            "math_opinion": task.get("math_opinion"),
-            "changed": bool(task.get("changed")),
-            "role_label": task.get("role_label"),
-            "phase_label": task.get("phase_label"),
-            "role_guidance": task.get("role_guidance"),
-            "traits_summary": task.get("traits_summary"),
-            "bias_summary": task.get("bias_summary"),
-            "reply_to_id": task.get("reply_to_id"),
-            "reply_to_short": task.get("reply_to_short"),
-            "reply_to_message": task.get("reply_to_message"),
-            "length_mode": task.get("length_mode"),
-            "emit_message": bool(task.get("emit_message")),
-            "evidence_hint": task.get("evidence_hint"),
-            "evidence_hints": task.get("evidence_hints") or [],
-            "evidence_confidence": task.get("evidence_confidence"),
-        }
-
-
     def _validate_llm_response(
         self,
         explanation: str,
@@ -243,25 +1404,18 @@ class SimulationEngine:
         opener = " ".join(text.split()[:4]).lower()
         if opener and opener in avoid_openers:
             return False, "reused opener"
-        words = re.findall(r"[A-Za-z\u0600-\u06FF]+", text.lower())
+        words = _LETTER_RUN_RE.findall(text.lower())
         if words and len(words) >= 10:
             unique_ratio = len(set(words)) / max(1, len(words))
             if unique_ratio < 0.25:
                 return False, "low diversity"
         # Do not hard-fail for missing reply tag or evidence id; prefer generating reasoning.
 
-        banned_phrases = build_default_forbidden_phrases() + [
-            "execution risks",
-            "market fit",
-            "evidence is inconclusive",
-            "insufficient data",
-        ]
         lowered = text.lower()
-        if any(bp and str(bp).lower() in lowered for bp in banned_phrases):
+        if _BANNED_REASONING_RE.search(lowered):
             return False, "banned phrase"
         if language == "ar":
-            latin = sum(1 for ch in text if "a" <= ch.lower() <= "z")
-            arabic = sum(1 for ch in text if "\u0600" <= ch <= "\u06ff")
+            latin, arabic = _script_counts(text)
             if latin > arabic * 2 and latin > 40:
                 return False, "mostly latin"
         return True, "ok"
@@ -315,7 +1469,7 @@ class SimulationEngine:
                 return
 
         def _clip(value: str, limit: int) -> str:
-            value = re.sub(r"\s+", " ", (value or "").strip())
+            value = _WHITESPACE_RE.sub(" ", (value or "").strip())
             if len(value) <= limit:
                 return value
             return value[: max(0, limit - 3)].rstrip() + "..."
@@ -351,7 +1505,7 @@ class SimulationEngine:
         def _trim_to_limit(text: str, limit: int) -> str:
             if len(text) <= limit:
                 return text
-            sentences = re.split(r"(?<=[.!?؟])\s+", text)
+            sentences = _SENTENCE_BREAK_RE.split(text)
             trimmed = ""
             for sentence in sentences:
                 if not sentence:
@@ -404,72 +1558,41 @@ class SimulationEngine:
         if requires_evidence and evidence_ids:
             evidence_rule = evidence_ids[0]
 
-        if language == "ar":
-            prompt_lines = [
-                human_guardrail,
-                f"أنت {role_label}. المرحلة: {phase_label}.",
-                f"الفكرة: {idea_label}.",
-                f"موقفك الحالي: {new_label} (كان: {prev_label}، تغيّر: {changed_label}).",
-                f"سماتك: {traits_desc}. تحيزاتك: {bias_desc}.",
-                f"آخر أفكارك: {memory_context}.",
-                f"شريحتك من البحث فقط: {research_summary or '-'}",
-                f"إشارات: {research_signals or '-'}",
-                f"بطاقات الأدلة:\n{evidence_lines or '-'}",
-                *(
-                    [
-                        f"رد مباشرة على {reply_to_short_id} واذكر {reply_to_short_id} حرفيًا داخل الرد.",
-                        f"رسالة {reply_to_short_id}: \"{reply_snippet}\"",
-                    ]
-                    if reply_to_short_id
-                    else []
-                ),
-                "قواعد صارمة:",
-                "- اكتب 1-3 جمل باللهجة المصرية.",
-                "- ممنوع القوائم/النقاط/الاقتباسات.",
-                "- لا تستخدم كلام عام أو عبارات محفوظة.",
-                f"- التزم بمجالك: {role_guidance}.",
-                "- اجعل موقفك واضحًا واذكر سبب محدد مرتبط بالشريحة/الأدلة.",
-                "- الطول 160-420 حرف.",
-                f"- تجنب بدايات: {avoid_openers_block or '-'}.",
-                f"- لا تذكر القيود حرفيًا: {constraints_summary or '-'}.",
-                f"- تجنب تكرار عبارات حديثة: {recent_avoid or '-'}.",
-            ]
-            if evidence_rule:
-                prompt_lines.insert(prompt_lines.index("قواعد صارمة:") + 1, f"- اذكر معرف دليل واحد على الأقل مثل {evidence_rule}.")
-            prompt = "\n".join(prompt_lines)
-        else:
-            prompt_lines = [
-                human_guardrail,
-                f"You are {role_label}. Phase: {phase_label}.",
-                f"Idea: {idea_label}.",
-                f"Your stance: {new_label} (was: {prev_label}, changed: {changed_label}).",
-                f"Traits: {traits_desc}. Biases: {bias_desc}.",
-                f"Recent thoughts: {memory_context}.",
-                f"Your research slice only: {research_summary or '-'}",
-                f"Signals: {research_signals or '-'}",
-                f"Evidence cards:\n{evidence_lines or '-'}",
-                *(
-                    [
-                        f"Reply directly to {reply_to_short_id} and include {reply_to_short_id} literally in the reply.",
-                        f"{reply_to_short_id} said: \"{reply_snippet}\"",
-                    ]
-                    if reply_to_short_id
-                    else []
-                ),
-                "Strict rules:",
-                "- Write 1-3 sentences.",
-                "- No bullets/lists/quotes.",
-                "- No generic templates or boilerplate.",
-                f"- Stay strictly in your domain: {role_guidance}.",
-                "- Make the stance clear with a concrete, specific rationale grounded in the slice/evidence.",
-                "- Length 120-420 chars.",
-                f"- Avoid opener patterns: {avoid_openers_block or '-'}.",
-                f"- Do not restate constraints literally: {constraints_summary or '-'}.",
-                f"- Avoid repeating recent phrases: {recent_avoid or '-'}.",
-            ]
-            if evidence_rule:
-                prompt_lines.insert(prompt_lines.index("Strict rules:") + 1, f"- Include at least one evidence ID like {evidence_rule}.")
-            prompt = "\n".join(prompt_lines)
+        reply_block = ""
+        if reply_to_short_id:
+            reply_block = _render_prompt(
+                "reasoning_reply",
+                language,
+                short_id=reply_to_short_id,
+                snippet=reply_snippet,
+            )
+        prompt = _render_prompt(
+            "reasoning",
+            language,
+            guardrail=human_guardrail,
+            role_label=role_label,
+            phase_label=phase_label,
+            idea_label=idea_label,
+            new_label=new_label,
+            prev_label=prev_label,
+            changed_label=changed_label,
+            traits_desc=traits_desc,
+            bias_desc=bias_desc,
+            memory_context=memory_context,
+            research_summary=research_summary or "-",
+            research_signals=research_signals or "-",
+            evidence_lines=evidence_lines or "-",
+            reply_block=reply_block,
+            evidence_rule=(
+                _render_prompt("reasoning_evidence_rule", language, evidence_id=evidence_rule)
+                if evidence_rule
+                else ""
+            ),
+            role_guidance=role_guidance,
+            avoid_openers=avoid_openers_block or "-",
+            constraints_summary=constraints_summary or "-",
+            recent_avoid=recent_avoid or "-",
+        )
         try:
             try:
                 max_attempts = int(os.getenv("LLM_REASONING_ATTEMPTS", "4") or 4)
@@ -532,8 +1655,8 @@ class SimulationEngine:
                         timeout=self._llm_timeout,
                     )
                 explanation = response.strip()
-                explanation = re.sub(r"\([^\)]*(category=|audience=|goals=|maturity=|location=|risk=)\s*[^\)]*\)", "", explanation)
-                sentences = re.split(r"(?<=[.!?طں])\s+", explanation)
+                explanation = _CONTEXT_ECHO_RE.sub("", explanation)
+                sentences = _EMERGENCY_SENTENCE_BREAK_RE.split(explanation)
                 if len(sentences) > 3:
                     explanation = " ".join(sentences[:3]).strip()
                 explanation = _trim_to_limit(explanation, 480)
@@ -559,7 +1682,8 @@ class SimulationEngine:
                 if validator is not None:
                     persona_summary = f"{role_label}; traits: {traits_desc}; biases: {bias_desc}; guidance: {role_guidance}"
                     recent = list(recent_phrases or []) + list(agent.short_memory or [])
-                    res = await validator.validate(explanation, persona_summary, recent)
+                    async with self._llm_semaphore:
+                        res = await validator.validate(explanation, persona_summary, recent)
                     if not res.ok:
                         last_reason = "validator:" + ",".join(res.reasons)
                         if debug:
@@ -597,7 +1721,10 @@ class SimulationEngine:
                     if validator is None:
                         return candidate
                     persona_summary = f"{role_label}; traits: {traits_desc}; biases: {bias_desc}; guidance: {role_guidance}"
-                    res = await validator.validate(candidate, persona_summary, list(recent_phrases or []) + list(agent.short_memory or []))
+                    async with self._llm_semaphore:
+                        res = await validator.validate(
+                            candidate, persona_summary, list(recent_phrases or []) + list(agent.short_memory or [])
+                        )
                     if res.ok:
                         return candidate
                 if debug:
@@ -627,7 +1754,7 @@ class SimulationEngine:
         debug = os.getenv("LLM_REASONING_DEBUG", "false").strip().lower() in {"1", "true", "yes", "on"}
 
         def _clip(value: str, limit: int) -> str:
-            value = re.sub(r"\s+", " ", (value or "").strip())
+            value = _WHITESPACE_RE.sub(" ", (value or "").strip())
             if len(value) <= limit:
                 return value
             return value[: max(0, limit - 3)].rstrip() + "..."
@@ -643,36 +1770,24 @@ class SimulationEngine:
         evidence_ids = [f"E{i + 1}" for i in range(len(evidence_cards))]
         requires_evidence = len(evidence_ids) > 0
         if language == "ar":
-            prompt_lines = [
-                f"أنت {role_label}. المرحلة: {phase_label}.",
-                f"الفكرة: {idea_label}.",
-                f"نقطة للنقاش: {reply_to_short_id or 'نقاش سابق'}.",
-                f"أدلة متاحة:\n{evidence_lines or '-'}",
-                "قواعد الرد:",
-                "- اكتب 1-2 جمل طبيعية.",
-                "- لا تستخدم نقاط أو تنسيق رسمي.",
-                "- التزم بسياق الدور: " + role_guidance + ".",
-                "- استخدم لهجة مصرية واضحة وبسيطة.",
-            ]
-            if requires_evidence and evidence_ids:
-                prompt_lines.append(f"- اذكر دليل واحد على الأقل مثل {evidence_ids[0]}.")
-            prompt = "\n".join(prompt_lines)
+            reply_ref = reply_to_short_id or "نقاش سابق"
         else:
-            prompt_lines = [
-                f"You are {role_label}. Phase: {phase_label}.",
-                f"Idea: {idea_label}.",
-                f"Debate reference: {reply_to_short_id or 'previous point'}",
-                f"Evidence:\n{evidence_lines or '-'}",
-                "Rules:",
-                "- Write 1-2 sentences.",
-                "- No bullets/lists/quotes.",
-                "- Sound like a real person, not a template.",
-                f"- Stay strictly in your domain: {role_guidance}.",
-                "- Keep it concise and specific.",
-            ]
-            if requires_evidence and evidence_ids:
-                prompt_lines.insert(prompt_lines.index("Rules:") + 1, f"- Include at least one evidence ID like {evidence_ids[0]}.")
-            prompt = "\n".join(prompt_lines)
+            reply_ref = reply_to_short_id or "previous point"
+        prompt = _render_prompt(
+            "emergency",
+            language,
+            role_label=role_label,
+            phase_label=phase_label,
+            idea_label=idea_label,
+            reply_ref=reply_ref,
+            evidence_lines=evidence_lines or "-",
+            role_guidance=role_guidance,
+            evidence_rule=(
+                _render_prompt("emergency_evidence_rule", language, evidence_id=evidence_ids[0])
+                if requires_evidence and evidence_ids
+                else ""
+            ),
+        )
         try:
             async with self._llm_semaphore:
                 response = await asyncio.wait_for(
@@ -689,15 +1804,14 @@ class SimulationEngine:
             explanation = response.strip()
             explanation = explanation[:450].rstrip()
             if language == "ar":
-                latin = sum(1 for ch in explanation if "a" <= ch.lower() <= "z")
-                arabic = sum(1 for ch in explanation if "\u0600" <= ch <= "\u06ff")
+                latin, arabic = _script_counts(explanation)
                 if latin > arabic * 3 and latin > 40:
                     raise RuntimeError("Emergency LLM response used mostly Latin characters.")
             lowered = explanation.lower()
             if requires_evidence and not any(eid.lower() in lowered for eid in evidence_ids):
                 raise RuntimeError("Emergency LLM response missing evidence id.")
-            for phrase in build_default_forbidden_phrases():
-                if phrase and phrase.lower() in lowered:
+            for phrase in _FORBIDDEN_PHRASES:
+                if phrase in lowered:
                     raise RuntimeError("Emergency LLM response contained forbidden phrase.")
             return explanation
         except Exception as exc:
@@ -744,55 +1858,18 @@ class SimulationEngine:
             random.seed(seed_value)
 
         # Determine number of agents (18-24 inclusive)
-        def _idea_risk_score(idea_text: str) -> float:
-            text = idea_text.lower()
-            score = 0.0
-            if any(token in text for token in ["legal", "court", "lawsuit", "police", "regulation"]):
-                score += 0.15
-            if any(token in text for token in ["predict", "prediction", "outcome", "diagnosis"]):
-                score += 0.1
-            if any(token in text for token in ["medical", "health", "clinic", "doctor"]):
-                score += 0.15
-            if any(token in text for token in ["documents", "upload", "records"]):
-                score += 0.08
-            if any(token in text for token in [
-                "privacy",
-                "surveillance",
-                "tracking",
-                "gps",
-                "location",
-                "bank",
-                "banking",
-                "account",
-                "credit",
-                "wallet",
-                "messages",
-                "email",
-                "chat",
-                "dm",
-                "personal data",
-                "pii",
-                "biometric",
-                "password",
-                "ssn",
-                "social security",
-                "خصوص",
-                "تجسس",
-                "موقع",
-                "رسائل",
-                "بنك",
-                "حساب",
-                "بطاقة",
-                "بيانات",
-                "هوية",
-                "رقم قومي",
-            ]):
-                score += 0.2
-            return min(0.6, score)
-
         idea_text = str(user_context.get("idea") or "")
         research_summary = str(user_context.get("research_summary") or "")
         research_structured = user_context.get("research_structured") or {}
+        # Stable text fallback for prompts even when structured research is missing.
+        research_signals = _research_signals_text(research_structured)
+        # The research text never changes during a run; split it once for the
+        # per-agent slices and the evidence cards.
+        summary_sentences = [s.strip() for s in research_summary.translate(_SENTENCE_END_TABLE).split(".") if s.strip()]
+        summary_sentences_lower = [s.lower() for s in summary_sentences]
+        raw_research_signals = research_structured.get("signals") if isinstance(research_structured, dict) else []
+        research_signals_list = [str(s) for s in raw_research_signals] if isinstance(raw_research_signals, list) else []
+        research_signals_lower = [s.lower() for s in research_signals_list]
         research_evidence_ladder = (
             research_structured.get("evidence_ladder")
             if isinstance(research_structured, dict) and isinstance(research_structured.get("evidence_ladder"), list)
@@ -828,92 +1905,37 @@ class SimulationEngine:
         except Exception:
             max_neutral_clarifications = 6
         max_neutral_clarifications = max(1, min(24, max_neutral_clarifications))
-        idea_risk = _idea_risk_score(idea_text)
-        regulatory_seed = ""
-        if isinstance(research_structured, dict):
-            regulatory_seed = str(research_structured.get("regulatory_risk") or "").lower()
-        if regulatory_seed in {"high", "strict"}:
-            initial_risk_bias = min(0.6, idea_risk + 0.2)
-        elif regulatory_seed in {"medium", "moderate"}:
-            initial_risk_bias = min(0.6, idea_risk + 0.1)
-        else:
-            initial_risk_bias = idea_risk
 
         safety_guard_enabled = str(os.getenv("SIM_SAFETY_GUARD_HARD", "1")).strip().lower() in {"1", "true", "yes", "on"}
         disable_random_stance_force = str(os.getenv("REASONING_DISABLE_RANDOM_STANCE_FORCE", "1")).strip().lower() in {"1", "true", "yes", "on"}
         policy_mode = "safety_guard_hard" if safety_guard_enabled else "normal"
+        # Pure CPU work: run it off the event loop while the setup below and the
+        # initial snapshot emission proceed; awaited before the first phase starts.
+        idea_profile_task = asyncio.create_task(
+            asyncio.to_thread(
+                _precompute_idea_profile,
+                idea_text,
+                language,
+                user_context,
+                preflight_summary,
+                safety_guard_enabled,
+            )
+        )
 
-        def _contains_any(source: str, items: List[str]) -> bool:
-            return any(token for token in items if token and token in source)
-
-        def _classify_hard_unsafe_policy(text: str) -> Tuple[bool, Optional[str], float]:
-            normalized = (text or "").strip().lower()
-            if not normalized:
-                return False, None, 0.0
-            score = 0.0
-            reasons: List[str] = []
-
-            invasive_data_terms = [
-                "private message", "private messages", "dm", "chat history", "bank", "banking", "credit card",
-                "gps", "location tracking", "political", "religious", "biometric", "surveillance", "monitoring",
-                "رسائل خاصة", "الرسائل الخاصة", "سجل مشترياته", "مشتريات بنكية", "تحركاته", "gps", "آرائه السياسية", "الدينية",
-                "مراقبة", "تتبع", "خصوصية",
-            ]
-            punitive_terms = [
-                "ban", "blacklist", "block from applying", "for 5 years", "five years", "statewide ban",
-                "حظر", "منع", "قائمة سوداء", "لمدة 5 سنوات", "خمس سنوات", "من التقديم",
-            ]
-            scoring_terms = [
-                "trust score", "social score", "risk score", "درجة ثقة", "نظام نقاط", "تصنيف المتقدمين",
-            ]
-
-            if _contains_any(normalized, invasive_data_terms):
-                score += 0.45
-                reasons.append("invasive_data_collection")
-            if _contains_any(normalized, punitive_terms):
-                score += 0.35
-                reasons.append("disproportionate_punitive_outcome")
-            if _contains_any(normalized, scoring_terms):
-                score += 0.20
-                reasons.append("high_risk_automated_scoring")
-
-            if score >= 0.55:
-                return True, ",".join(reasons[:3]) or "unsafe_policy", min(1.0, score)
-            return False, None, min(1.0, score)
-
-        hard_unsafe_triggered = False
-        hard_policy_reason: Optional[str] = None
-        hard_policy_risk_score = 0.0
-        if safety_guard_enabled:
-            hard_unsafe_triggered, hard_policy_reason, hard_policy_risk_score = _classify_hard_unsafe_policy(idea_text)
+        concern_language = "ar" if language == "ar" else "en"
+        idea_text_lower = idea_text.lower()
+        # Idea text is fixed for the run; only the generic fallback is drawn per call.
+        idea_concern_labels = [
+            labels[concern_language]
+            for tokens, labels in _IDEA_CONCERN_GROUPS
+            if any(token in idea_text_lower for token in tokens)
+        ]
+        idea_concerns_text = ", ".join(idea_concern_labels[:2])
 
         def _idea_concerns() -> str:
-            text = idea_text.lower()
-            concerns = []
-            if any(token in text for token in ["legal", "court", "lawsuit", "police", "regulation"]):
-                concerns.append("regulation and liability" if language != "ar" else "اللوائح والمسؤولية")
-            if any(token in text for token in ["predict", "prediction", "outcome"]):
-                concerns.append("prediction accuracy" if language != "ar" else "دقة التنبؤ")
-            if any(token in text for token in ["documents", "upload", "records", "photos"]):
-                concerns.append("privacy and data security" if language != "ar" else "الخصوصية وأمن البيانات")
-            if not concerns:
-                options = (
-                    [
-                        "go-to-market traction and delivery risk",
-                        "distribution hurdles and adoption friction",
-                        "rollout complexity and operational load",
-                        "positioning clarity and execution strain",
-                    ]
-                    if language != "ar"
-                    else [
-                        "توافق السوق وتعقيدات الإطلاق",
-                        "عوائق التوزيع وصعوبة التبني",
-                        "تعقيد الإطلاق والضغط التشغيلي",
-                        "وضوح التموضع وإجهاد التنفيذ",
-                    ]
-                )
-                return random.choice(options)
-            return ", ".join(concerns[:2])
+            if not idea_concerns_text:
+                return random.choice(_IDEA_CONCERN_FALLBACKS[concern_language])
+            return idea_concerns_text
         def _idea_label() -> str:
             text = idea_text.lower()
             if "legal" in text or "court" in text:
@@ -938,7 +1960,7 @@ class SimulationEngine:
             if language != "ar":
                 return _idea_label()
             raw = idea_text.strip()
-            if re.search(r"[\u0600-\u06FF]", raw):
+            if _ARABIC_CHAR_RE.search(raw):
                 snippet = raw
                 if len(snippet) > 60:
                     snippet = snippet[:57].rstrip() + "..."
@@ -965,12 +1987,6 @@ class SimulationEngine:
         if not idea_label_for_llm:
             idea_label_for_llm = _idea_label_localized() if language == "ar" else _idea_label()
 
-        def _clip_text(value: str, limit: int) -> str:
-            value = re.sub(r"\s+", " ", (value or "").strip())
-            if len(value) <= limit:
-                return value
-            return value[: max(0, limit - 3)].rstrip() + "..."
-
         def _research_insight() -> str:
             if not research_summary:
                 return ""
@@ -991,33 +2007,6 @@ class SimulationEngine:
                 if "regulation" in summary or "compliance" in summary:
                     return "regulatory risk looks material"
             return ""
-        def _constraints_summary() -> str:
-            category = str(user_context.get("category") or "")
-            audience = ", ".join(user_context.get("targetAudience") or [])
-            goals = ", ".join(user_context.get("goals") or [])
-            risk = user_context.get("riskAppetite")
-            maturity = str(user_context.get("ideaMaturity") or "")
-            location = f"{user_context.get('city') or ''}, {user_context.get('country') or ''}".strip(", ")
-            parts = []
-            if category:
-                parts.append(f"category={category}" if language != "ar" else f"الفئة={category}")
-            if audience:
-                parts.append(f"audience={audience}" if language != "ar" else f"الجمهور={audience}")
-            if goals:
-                parts.append(f"goals={goals}" if language != "ar" else f"الأهداف={goals}")
-            if maturity:
-                parts.append(f"maturity={maturity}" if language != "ar" else f"نضج الفكرة={maturity}")
-            if location:
-                parts.append(f"location={location}" if language != "ar" else f"المكان={location}")
-            if isinstance(risk, (int, float)):
-                parts.append(f"risk={risk:.2f}" if language != "ar" else f"المخاطرة={risk:.2f}")
-            if preflight_summary:
-                clipped_summary = _clip_text(preflight_summary, 180)
-                parts.append(
-                    f"preflight={clipped_summary}" if language != "ar" else f"توضيح ما قبل التشغيل={clipped_summary}"
-                )
-            return "; ".join(parts)
-
         def _label_opinion(opinion: str) -> str:
             if language != "ar":
                 return opinion
@@ -1030,11 +2019,12 @@ class SimulationEngine:
                 return None
             if stance_classifier is None:
                 return None
-            return await stance_classifier.classify_opinion(
-                text=text,
-                idea_label=idea_label_for_llm,
-                language=language,
-            )
+            async with self._llm_semaphore:
+                return await stance_classifier.classify_opinion(
+                    text=text,
+                    idea_label=idea_label_for_llm,
+                    language=language,
+                )
 
         def _initial_opinion(traits: Dict[str, float]) -> str:
             _ = traits
@@ -1066,21 +2056,35 @@ class SimulationEngine:
                 agents.append(agent)
         else:
             num_agents = len(agents)
-        agent_labels: Dict[str, str] = {
-            agent.agent_id: f"Agent {idx + 1}"
+        # (short id, display label) per agent; both are fixed for the run and
+        # go out with every snapshot and reasoning step.
+        agent_display: Dict[str, Tuple[str, str]] = {
+            agent.agent_id: (agent.agent_id[:4], f"Agent {idx + 1}")
             for idx, agent in enumerate(agents)
         }
 
+        # Identity, traits and biases are settled before the first snapshot and
+        # never change during the run, so each agent's copy is built once and
+        # shared by every ``agents`` event; payload consumers must not mutate it.
+        agent_static_snapshots: Dict[str, Dict[str, Any]] = {}
+
         def _agent_snapshot(agent: Agent) -> Dict[str, Any]:
+            static = agent_static_snapshots.get(agent.agent_id)
+            if static is None:
+                short_id, label = agent_display[agent.agent_id]
+                static = {
+                    "agent_id": agent.agent_id,
+                    "agent_short_id": short_id,
+                    "agent_label": label,
+                    "category_id": agent.category_id,
+                    "template_id": agent.template_id,
+                    "archetype_name": agent.archetype_name,
+                    "traits": dict(agent.traits),
+                    "biases": list(agent.biases),
+                }
+                agent_static_snapshots[agent.agent_id] = static
             return {
-                "agent_id": agent.agent_id,
-                "agent_short_id": agent.agent_id[:4],
-                "agent_label": agent_labels.get(agent.agent_id, f"Agent {agent.agent_id[:4]}"),
-                "category_id": agent.category_id,
-                "template_id": agent.template_id,
-                "archetype_name": agent.archetype_name,
-                "traits": dict(agent.traits),
-                "biases": list(agent.biases),
+                **static,
                 "influence_weight": agent.influence_weight,
                 "is_leader": agent.is_leader,
                 "fixed_opinion": agent.fixed_opinion,
@@ -1112,6 +2116,11 @@ class SimulationEngine:
         except Exception:
             step_delay = 0.08
         step_delay = max(0.0, step_delay)
+        step_pause = step_delay / speed
+        # Pauses under 10ms cost about as much in loop wakeups as they wait, so
+        # they are summed and slept once at the phase end, with a plain yield
+        # every few steps to keep the loop responsive.
+        defer_step_pause = 0.0 < step_pause < 0.01
         reasoning_scope = str(user_context.get("reasoning_scope") or "hybrid").strip().lower()
         if reasoning_scope not in {"hybrid", "full", "speakers_only"}:
             reasoning_scope = "hybrid"
@@ -1120,7 +2129,10 @@ class SimulationEngine:
             reasoning_detail = "short"
         reasoning_engine_v2 = str(os.getenv("REASONING_ENGINE_V2", "1")).strip().lower() in {"1", "true", "yes", "on"}
         # Force sequential reasoning generation so each agent can react to
-        # up-to-date dialogue context from previous agents in the same phase.
+        # up-to-date dialogue context from previous agents in the same phase:
+        # reply targets, context lines and opener dedupe all read the messages
+        # and stances accepted before the current task. Overlap LLM latency
+        # within a task instead (REASONING_SPECULATIVE_ATTEMPTS).
         llm_concurrency = 1
         try:
             reasoning_temp = float(os.getenv("LLM_REASONING_TEMPERATURE", "0.7") or 0.7)
@@ -1144,6 +2156,13 @@ class SimulationEngine:
         except ValueError:
             reasoning_max_retries = 4
         reasoning_max_retries = max(1, min(8, reasoning_max_retries))
+        # Attempts sent together before falling back to one-at-a-time retries;
+        # 1 keeps every retry sequential and informed by the previous rejection.
+        try:
+            reasoning_speculative_attempts = int(os.getenv("REASONING_SPECULATIVE_ATTEMPTS", "1") or 1)
+        except ValueError:
+            reasoning_speculative_attempts = 1
+        reasoning_speculative_attempts = max(1, min(3, reasoning_max_retries, reasoning_speculative_attempts))
         try:
             reasoning_context_turns = int(os.getenv("REASONING_MAX_CONTEXT_TURNS", "6") or 6)
         except ValueError:
@@ -1179,6 +2198,23 @@ class SimulationEngine:
             max_dialogue_context = int(os.getenv("SIM_MAX_DIALOGUE_CONTEXT", "60") or 60)
         except ValueError:
             max_dialogue_context = 60
+        # Reasoning steps between mid-phase checkpoints; a resumed run replays at
+        # most this many steps. Clarifications and phase ends always checkpoint.
+        try:
+            checkpoint_every_steps = int(os.getenv("SIM_CHECKPOINT_EVERY_STEPS", "8") or 8)
+        except ValueError:
+            checkpoint_every_steps = 8
+        checkpoint_every_steps = max(1, min(100, checkpoint_every_steps))
+        try:
+            metrics_min_interval = float(os.getenv("SIM_METRICS_MIN_INTERVAL_MS", "50") or 50) / 1000.0
+        except ValueError:
+            metrics_min_interval = 0.05
+        metrics_min_interval = max(0.0, min(5.0, metrics_min_interval))
+        # (length_mode, emit_message) for speakers (True) and listeners (False).
+        speaker_modes: Dict[bool, Tuple[str, bool]] = {
+            True: ("full" if reasoning_scope in {"full", "hybrid"} else reasoning_detail, True),
+            False: ("full" if reasoning_scope == "full" else reasoning_detail, reasoning_scope == "full"),
+        }
         llm_semaphore = asyncio.Semaphore(llm_concurrency)
         stance_classifier = None
         if LLMOutputValidator is not None:
@@ -1187,26 +2223,19 @@ class SimulationEngine:
             except ValueError:
                 judge_temp = 0.1
             stance_classifier = LLMOutputValidator(temperature=judge_temp)
-        reasoning_stats: Dict[str, Any] = {
-            "total_steps": 0,
-            "fallback_steps": 0,
-            "classified_steps": 0,
-            "regeneration_attempts": 0,
-            "autorepair_attempts": 0,
-            "autorepair_success": 0,
-            "low_quality_steps": 0,
-            "quality_flags": {},
-            "rejections": {},
-        }
+        # Fixed for the run; only the per-step draw remains in the loop.
+        validator_sampling = stance_classifier is not None and validator_sample_rate > 0
+        reasoning_stats = _ReasoningStats()
 
         def _friendly_category(category_id: str) -> str:
             return category_id.replace("_", " ").title()
 
-        def _pick_phrase(seed: str, phrases: list[str]) -> str:
+        def _pick_phrase(seed: str, phrases: Sequence[str]) -> str:
             value = int(hashlib.sha256(seed.encode("utf-8")).hexdigest()[:8], 16)
             return phrases[value % len(phrases)]
 
-        arabic_peer_tags = ["أ", "ب", "ج", "د", "هـ", "و", "ز", "ح", "ط", "ي"]
+        arabic_peer_tags = _ARABIC_PEER_TAGS
+        peer_tag_index_by_agent: Dict[str, int] = {}
 
         recent_seed = resume_state.get("recent_messages")
         if not isinstance(recent_seed, list):
@@ -1231,61 +2260,21 @@ class SimulationEngine:
             _push_recent(message)
             return message
 
-        stop_words_en = {
-            "the", "and", "for", "with", "that", "this", "from", "are", "was", "were", "have", "has", "had",
-            "you", "your", "but", "not", "about", "into", "out", "our", "their", "they", "them", "its", "it's",
-            "will", "would", "should", "could", "can", "may", "might", "just", "like", "very", "than", "then",
-            "more", "less", "also", "because", "as", "at", "by", "to", "of", "in", "on",
-        }
-        stop_words_ar = {
-            "هذا", "هذه", "ذلك", "تلك", "هنا", "هناك", "الذي", "التي", "الذين",
-            "من", "إلى", "على", "في", "عن", "مع", "بين", "أو", "و", "ثم",
-            "هو", "هي", "هم", "هن", "كان", "كانت", "يكون", "تكون",
-            "ما", "لا", "لم", "لن", "قد", "لقد", "تم", "كل", "أي",
-            "أنا", "انت", "أنت", "انتي", "أنتِ", "نحن", "هم", "هن",
-            "لدى", "عند", "بعد", "قبل", "فقط", "أيضا", "أكثر", "أقل",
-            "جدا", "تماما", "تقريبا", "ضمن", "حول", "بشكل", "طريقة",
-            "الفكرة", "مشروع", "المشروع", "النظام",
-        }
-
-        def _extract_words(text: str) -> List[str]:
-            if not text:
-                return []
-            words = re.findall(r"[A-Za-z]{3,}|[\u0600-\u06FF]{3,}", text)
-            cleaned: List[str] = []
-            for word in words:
-                lower = word.lower()
-                if lower in stop_words_en or word in stop_words_ar:
-                    continue
-                cleaned.append(lower)
-            return cleaned
-
         def _extract_reason_tag(message: str, stance_value: Optional[str] = None) -> str:
             normalized = _normalized(message)
             if not normalized:
                 return "evidence_gap"
-            for tag, keywords in reason_tag_keywords.items():
-                if any(keyword in normalized for keyword in keywords):
-                    return tag
+            matched_tags = _keyword_groups(normalized, _REASON_TAG_MATCHER)
+            if matched_tags:
+                return next(tag for tag in _REASON_TAG_KEYWORDS if tag in matched_tags)
             tokens = set(_extract_words(message))
-            if hard_unsafe_triggered and (
-                {"privacy", "legal", "compliance", "discrimination", "خصوصية", "قانون", "امتثال", "تمييز"} & tokens
-            ):
+            if hard_unsafe_triggered and (_PRIVACY_TOKENS & tokens):
                 return "legal_compliance"
-            if stance_value in {"reject", "neutral"}:
+            if stance_value in _NONPOSITIVE_OPINIONS:
                 return "evidence_gap"
             return "feasibility_scalability"
 
-        clarification_axis_map: Dict[str, str] = {
-            "privacy_surveillance": "privacy_scope",
-            "legal_compliance": "compliance_boundary",
-            "ethical_discrimination": "fairness_guardrails",
-            "unclear_target": "target_segment",
-            "unclear_value": "value_proposition",
-            "feasibility_scalability": "delivery_scope",
-            "market_demand": "demand_validation",
-            "evidence_gap": "evidence_priority",
-        }
+        clarification_axis_map = _CLARIFICATION_AXIS_MAP
         preflight_axis_by_reason_tag: Dict[str, str] = {
             "privacy_surveillance": "risk_boundary",
             "legal_compliance": "risk_boundary",
@@ -1316,161 +2305,6 @@ class SimulationEngine:
             "اختيار 3",
         }
 
-        def _build_clarification_template(reason_tag: str) -> Dict[str, Any]:
-            if language == "ar":
-                templates: Dict[str, Dict[str, Any]] = {
-                    "privacy_surveillance": {
-                        "question": "إيه حدود جمع البيانات اللي تقبلها في الفكرة؟",
-                        "options": [
-                            "بيانات يقدمها المستخدم بنفسه فقط",
-                            "بيانات عامة فقط مع موافقة صريحة",
-                            "مسموح بيانات إضافية بشرط مراجعة بشرية كاملة",
-                        ],
-                        "reason_summary": "أغلب الوكلاء شايفين مخاطر خصوصية ومراقبة عالية.",
-                    },
-                    "legal_compliance": {
-                        "question": "إيه مستوى الالتزام القانوني المطلوب قبل الإطلاق؟",
-                        "options": [
-                            "الالتزام الكامل (GDPR/قوانين محلية) قبل أي إطلاق",
-                            "إطلاق محدود مع موافقات صريحة وتدقيق شهري",
-                            "نسخة تجريبية بدون قرارات مؤثرة لحين اكتمال الامتثال",
-                        ],
-                        "reason_summary": "الاعتراضات مركزة على المخاطر القانونية والامتثال.",
-                    },
-                    "ethical_discrimination": {
-                        "question": "كيف تحب النظام يتعامل مع قرارات قد تسبب تمييز؟",
-                        "options": [
-                            "منع أي قرار آلي نهائي واعتماد مراجعة بشرية",
-                            "قرار آلي مبدئي مع حق اعتراض واضح للمستخدم",
-                            "إيقاف تقييم الحساسية والاكتفاء بمؤشرات غير شخصية",
-                        ],
-                        "reason_summary": "الوكلاء محتاجين ضمانات عدالة ومنع التمييز.",
-                    },
-                    "unclear_target": {
-                        "question": "مين الجمهور الأساسي اللي نركز عليه أولاً؟",
-                        "options": [
-                            "شريحة ضيقة جدًا كمرحلة أولى",
-                            "شريحتين بمتطلبات متقاربة",
-                            "سوق واسع مع تخصيص لاحق",
-                        ],
-                        "reason_summary": "فيه غموض في الشريحة المستهدفة.",
-                    },
-                    "unclear_value": {
-                        "question": "إيه القيمة الأساسية اللي لازم تكون واضحة للمستخدم؟",
-                        "options": [
-                            "توفير وقت/تكلفة بشكل مباشر",
-                            "تحسين الجودة والدقة",
-                            "تقليل المخاطر والامتثال",
-                        ],
-                        "reason_summary": "الوكلاء طالبين توضيح أقوى للقيمة المقدمة.",
-                    },
-                    "feasibility_scalability": {
-                        "question": "إيه مستوى التعقيد الفني المقبول في النسخة الأولى؟",
-                        "options": [
-                            "MVP بسيط بخصائص قليلة",
-                            "نطاق متوسط مع بنية قابلة للتوسع",
-                            "نطاق كامل من البداية مع استثمار أكبر",
-                        ],
-                        "reason_summary": "الأغلبية عندها قلق من قابلية التنفيذ والتوسع.",
-                    },
-                    "market_demand": {
-                        "question": "إزاي نثبت الطلب السوقي قبل التوسع؟",
-                        "options": [
-                            "Pilot صغير بعملاء حقيقيين",
-                            "اختبار أسعار مع صفحة انتظار",
-                            "شراكة مبكرة مع عميل مؤسسي",
-                        ],
-                        "reason_summary": "الاعتراضات مرتبطة بوضوح الطلب والمنافسة.",
-                    },
-                    "evidence_gap": {
-                        "question": "أي نوع دليل تحب نركز عليه قبل استكمال النقاش؟",
-                        "options": [
-                            "مصادر سوق وتسعير",
-                            "لوائح وقوانين",
-                            "مقابلات مستخدمين وحالات استخدام",
-                        ],
-                        "reason_summary": "الوكلاء محتاجين أدلة أقوى قبل الحسم.",
-                    },
-                }
-            else:
-                templates = {
-                    "privacy_surveillance": {
-                        "question": "What data-collection boundary should this idea enforce?",
-                        "options": [
-                            "Only user-submitted data",
-                            "Public data with explicit consent",
-                            "Extended data but with mandatory human review",
-                        ],
-                        "reason_summary": "Most agents flagged high privacy/surveillance risk.",
-                    },
-                    "legal_compliance": {
-                        "question": "What compliance bar must be met before launch?",
-                        "options": [
-                            "Full compliance before launch",
-                            "Limited pilot with explicit consent and audits",
-                            "No high-impact decisions until compliance is complete",
-                        ],
-                        "reason_summary": "Objections are concentrated around legal/compliance risk.",
-                    },
-                    "ethical_discrimination": {
-                        "question": "How should the system avoid discriminatory outcomes?",
-                        "options": [
-                            "No final automated decisions, always human review",
-                            "Automated draft decision with clear appeal path",
-                            "Remove sensitive scoring and keep non-personal signals only",
-                        ],
-                        "reason_summary": "Agents are asking for fairness and anti-bias safeguards.",
-                    },
-                    "unclear_target": {
-                        "question": "Who is the primary target segment for phase one?",
-                        "options": [
-                            "A narrow niche segment",
-                            "Two adjacent segments",
-                            "Broad market with later specialization",
-                        ],
-                        "reason_summary": "Target segment is still ambiguous.",
-                    },
-                    "unclear_value": {
-                        "question": "What single value promise should lead the pitch?",
-                        "options": [
-                            "Clear time/cost savings",
-                            "Higher quality/accuracy",
-                            "Risk reduction/compliance confidence",
-                        ],
-                        "reason_summary": "Agents need a sharper value proposition.",
-                    },
-                    "feasibility_scalability": {
-                        "question": "What technical scope is realistic for v1?",
-                        "options": [
-                            "Lean MVP with minimal scope",
-                            "Mid-scope with scalable architecture",
-                            "Full-scope launch with larger investment",
-                        ],
-                        "reason_summary": "Feasibility and scalability are major concerns.",
-                    },
-                    "market_demand": {
-                        "question": "How should demand be validated before scaling?",
-                        "options": [
-                            "Small paid pilot",
-                            "Pricing test + waitlist",
-                            "Early enterprise design partner",
-                        ],
-                        "reason_summary": "Debate is blocked on demand and competitive proof.",
-                    },
-                    "evidence_gap": {
-                        "question": "Which evidence should we prioritize before continuing?",
-                        "options": [
-                            "Market/pricing evidence",
-                            "Regulatory/compliance evidence",
-                            "User interviews and use-case validation",
-                        ],
-                        "reason_summary": "Agents are blocked by missing evidence.",
-                    },
-                }
-            template = dict(templates.get(reason_tag, templates["evidence_gap"]))
-            template["decision_axis"] = clarification_axis_map.get(reason_tag, "evidence_priority")
-            return template
-
         idea_anchor_terms = list(
             dict.fromkeys(
                 _extract_words(str(user_context.get("idea") or ""))
@@ -1524,8 +2358,7 @@ class SimulationEngine:
             options = _normalize_clarification_options(options_seed)
             options = [item for item in options if _is_actionable_option(str(item.get("label") or ""))]
             if len(options) < 3:
-                template = _build_clarification_template(reason_tag)
-                for item in _normalize_clarification_options(template.get("options")):
+                for item in _clarification_template_options(reason_tag, language):
                     if len(options) >= 3:
                         break
                     key = _normalized(item.get("label") or "")
@@ -1533,7 +2366,7 @@ class SimulationEngine:
                         continue
                     if any(_normalized(existing.get("label") or "") == key for existing in options):
                         continue
-                    options.append(item)
+                    options.append(dict(item))
             fallback_labels = (
                 [
                     "Set a strict v1 scope before rollout",
@@ -1577,68 +2410,6 @@ class SimulationEngine:
             score = round((len(passed) / max(1, len(checks))) * 100, 1)
             return score, passed
 
-        def _normalize_clarification_options(raw_options: Any) -> List[Dict[str, str]]:
-            normalized: List[Dict[str, str]] = []
-            if isinstance(raw_options, list):
-                for item in raw_options:
-                    label = ""
-                    option_id = ""
-                    if isinstance(item, str):
-                        label = item.strip()
-                    elif isinstance(item, dict):
-                        label = str(
-                            item.get("label")
-                            or item.get("text")
-                            or item.get("value")
-                            or ""
-                        ).strip()
-                        option_id = str(
-                            item.get("id")
-                            or item.get("option_id")
-                            or ""
-                        ).strip()
-                    if not label:
-                        continue
-                    normalized.append(
-                        {
-                            "id": option_id or f"opt_{len(normalized) + 1}",
-                            "label": label[:220],
-                        }
-                    )
-                    if len(normalized) >= 3:
-                        break
-            deduped: List[Dict[str, str]] = []
-            seen = set()
-            for item in normalized:
-                key = _normalized(item["label"])
-                if not key or key in seen:
-                    continue
-                seen.add(key)
-                deduped.append(item)
-                if len(deduped) >= 3:
-                    break
-            return deduped
-
-        def _extract_json_dict(raw_text: str) -> Dict[str, Any]:
-            text = str(raw_text or "").strip()
-            if not text:
-                return {}
-            candidates = [text]
-            fenced = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", text, re.DOTALL)
-            if fenced:
-                candidates.append(fenced.group(1))
-            match = re.search(r"(\{.*\})", text, re.DOTALL)
-            if match:
-                candidates.append(match.group(1))
-            for candidate in candidates:
-                try:
-                    parsed = json.loads(candidate)
-                except Exception:
-                    continue
-                if isinstance(parsed, dict):
-                    return parsed
-            return {}
-
         async def _generate_clarification_payload(
             *,
             reason_tag: str,
@@ -1647,9 +2418,9 @@ class SimulationEngine:
             phase_label: str,
             gate_stats: Optional[Dict[str, Any]] = None,
         ) -> Dict[str, Any]:
-            template = _build_clarification_template(reason_tag)
+            template = _build_clarification_template(reason_tag, language)
             question = str(template.get("question") or "").strip()
-            options = _ensure_meaningful_options(reason_tag, template.get("options"))
+            options: Optional[List[Dict[str, str]]] = None
             summary_text = str(template.get("reason_summary") or reason_summary).strip() or reason_summary
             decision_axis = _normalize_decision_axis(
                 str(template.get("decision_axis") or ""),
@@ -1679,7 +2450,7 @@ class SimulationEngine:
                 f"Representative snippets:\n{snippets_block}\n"
             )
             try:
-                async with llm_semaphore:
+                async with llm_semaphore, self._llm_semaphore:
                     raw = await generate_ollama(
                         prompt=prompt,
                         temperature=0.2,
@@ -1699,6 +2470,8 @@ class SimulationEngine:
                     decision_axis = parsed_axis
             except Exception:
                 pass
+            if options is None:
+                options = _ensure_meaningful_options(reason_tag, _clarification_template_options(reason_tag, language))
             if not _contains_idea_anchor(question):
                 if language == "ar":
                     question = f"في فكرة \"{anchor_hint}\"، {question}"
@@ -1717,7 +2490,7 @@ class SimulationEngine:
                         question = f"في فكرة \"{anchor_hint}\"، {question}"
                     else:
                         question = f"For \"{anchor_hint}\", {question}"
-                options = _ensure_meaningful_options(reason_tag, template.get("options"))
+                options = _ensure_meaningful_options(reason_tag, _clarification_template_options(reason_tag, language))
                 summary_text = str(template.get("reason_summary") or summary_text).strip() or summary_text
                 decision_axis = _normalize_decision_axis(str(template.get("decision_axis") or ""), reason_tag)
                 quality_score, checks_passed = _score_question_quality(
@@ -1738,7 +2511,7 @@ class SimulationEngine:
                     "total_window": int(gate_stats.get("total_window") or 0),
                 }
             return {
-                "question_id": uuid.uuid4().hex[:12],
+                "question_id": secrets.token_hex(6),
                 "question": question,
                 "options": options[:3],
                 "reason_tag": reason_tag,
@@ -1750,7 +2523,7 @@ class SimulationEngine:
                     "score": quality_score,
                     "checks_passed": checks_passed,
                 },
-                "created_at": int(time.time() * 1000),
+                "created_at": time.time_ns() // 1_000_000,
                 "required": True,
                 "phase_label": phase_label,
             }
@@ -1758,7 +2531,7 @@ class SimulationEngine:
         def _evaluate_clarification_gate(
             *,
             phase_label: str,
-            window: deque[Dict[str, Any]],
+            window: _ClarificationWindow,
             phase_messages: int,
             window_size: int,
             cooldown_steps: int,
@@ -1771,51 +2544,27 @@ class SimulationEngine:
             total = len(window)
             if total <= 0:
                 return None
-            reject_count = sum(1 for item in window if item.get("opinion") == "reject")
-            neutral_count = sum(1 for item in window if item.get("opinion") == "neutral")
+            reject_count = window.reject_count
+            neutral_count = window.neutral_count
+            focus_count = window.focus_count
+            unresolved_fallback_count = window.unresolved_fallback_count
             reject_ratio = reject_count / total
             neutral_ratio = neutral_count / total
-            focus_items = [item for item in window if item.get("opinion") in {"reject", "neutral"}]
-            if not focus_items:
+            if not focus_count:
                 return None
-            tag_counter = Counter(str(item.get("reason_tag") or "evidence_gap") for item in focus_items)
-            if not tag_counter:
-                return None
-            top_reason_tag, top_reason_count = tag_counter.most_common(1)[0]
-            top_reason_ratio = top_reason_count / max(1, len(focus_items))
-            focus_ratio = len(focus_items) / total
-            fallback_to_reason_tag = {
-                "idea_anchor_missing": "unclear_value",
-                "low_relevance": "evidence_gap",
-                "validator_fail": "evidence_gap",
-                "generation_failed": "evidence_gap",
-                "empty_or_invalid_output": "evidence_gap",
-                "no_candidate": "evidence_gap",
-                "too_short": "unclear_value",
-                "too_long": "unclear_value",
-                "template_prefix": "unclear_value",
-                "generic_template": "unclear_value",
-                "reused_opener": "unclear_value",
-                "safety_anchor_missing": "legal_compliance",
-                "unsupported_numeric_claim": "evidence_gap",
-                "unsupported_address_claim": "evidence_gap",
-                "unsupported_specific_claim": "evidence_gap",
-            }
-            unresolved_fallback_reasons = set(fallback_to_reason_tag.keys())
-            fallback_reasons = [
-                str(item.get("fallback_reason") or "").strip().lower()
-                for item in window
-                if str(item.get("fallback_reason") or "").strip()
-            ]
-            unresolved_fallback_hits = [reason for reason in fallback_reasons if reason in unresolved_fallback_reasons]
-            fallback_issue_ratio = len(unresolved_fallback_hits) / total
-            fallback_reason_variety = len(set(unresolved_fallback_hits))
-            fallback_counter = Counter(unresolved_fallback_hits)
+            top_reason_tag, top_reason_count = window.top_reason_tag()
+            top_reason_ratio = top_reason_count / max(1, focus_count)
+            focus_ratio = focus_count / total
+            fallback_issue_ratio = unresolved_fallback_count / total
+            fallback_reason_variety = len(window.fallback_counter)
             dominant_fallback_reason = ""
             dominant_fallback_ratio = 0.0
-            if fallback_counter:
-                dominant_fallback_reason, dominant_fallback_count = fallback_counter.most_common(1)[0]
-                dominant_fallback_ratio = dominant_fallback_count / max(1, len(unresolved_fallback_hits))
+            dominant_fallback_tag = top_reason_tag
+            if window.fallback_counter:
+                dominant_fallback_reason, dominant_fallback_count = window.dominant_fallback_reason()
+                dominant_fallback_ratio = dominant_fallback_count / max(1, unresolved_fallback_count)
+                # Window fallback reasons are drawn from the mapping's own keys.
+                dominant_fallback_tag = _FALLBACK_TO_REASON_TAG[dominant_fallback_reason]
 
             reject_neutral_convergence = (
                 reject_ratio >= 0.55
@@ -1839,8 +2588,9 @@ class SimulationEngine:
                 or fallback_quality_stall
             ):
                 return None
-            if fallback_quality_stall and dominant_fallback_reason:
-                top_reason_tag = fallback_to_reason_tag.get(dominant_fallback_reason, top_reason_tag)
+            if fallback_quality_stall:
+                top_reason_tag = dominant_fallback_tag
+            focus_items = window.focus_items()
             mapped_preflight_axis = preflight_axis_by_reason_tag.get(top_reason_tag)
             preflight_answer = str(preflight_answers.get(mapped_preflight_axis or "") or "").strip()
             if preflight_answer:
@@ -1850,8 +2600,9 @@ class SimulationEngine:
                     else {"غير واضح", "ناقص", "مبهم", "غير محسوم", "محتاج توضيح"}
                 )
                 contradiction_hits = 0
+                normalize = _normalized
                 for item in focus_items:
-                    msg = _normalized(str(item.get("message") or ""))
+                    msg = normalize(str(item.get("message") or ""))
                     if any(marker in msg for marker in contradiction_markers):
                         contradiction_hits += 1
                 contradiction_ratio = contradiction_hits / max(1, len(focus_items))
@@ -1868,12 +2619,22 @@ class SimulationEngine:
             if same_reason and (step_index - last_clarification_step) < cooldown_steps:
                 return None
             representative: List[str] = []
+            # The newest three focus messages double as the fallback snippets,
+            # so clip them once during the same reversed scan.
+            latest_snippets: List[str] = []
             seen = set()
-            for item in reversed(focus_items):
-                if str(item.get("reason_tag") or "evidence_gap") != top_reason_tag:
+            clip = _clip_text
+            for position, item in enumerate(reversed(focus_items)):
+                item_get = item.get
+                text = ""
+                if position < 3:
+                    text = clip(str(item_get("message") or ""), 220)
+                    latest_snippets.append(text)
+                if str(item_get("reason_tag") or "evidence_gap") != top_reason_tag:
                     continue
-                text = _clip_text(str(item.get("message") or ""), 220)
-                key = _normalized(text)
+                if position >= 3:
+                    text = clip(str(item_get("message") or ""), 220)
+                key = _snippet_key(text)
                 if not key or key in seen:
                     continue
                 seen.add(key)
@@ -1881,10 +2642,7 @@ class SimulationEngine:
                 if len(representative) >= 3:
                     break
             if not representative:
-                representative = [
-                    _clip_text(str(item.get("message") or ""), 220)
-                    for item in focus_items[-3:]
-                ]
+                representative = latest_snippets[::-1]
             reason_summary = (
                 f"reject_ratio={reject_ratio:.2f}, neutral_ratio={neutral_ratio:.2f}, "
                 f"focus_ratio={focus_ratio:.2f}, fallback_issue_ratio={fallback_issue_ratio:.2f}, "
@@ -1907,9 +2665,8 @@ class SimulationEngine:
                 "dominant_fallback_ratio": dominant_fallback_ratio,
             }
 
-        def _update_word_counts(message: str, counts: Dict[str, int]) -> None:
-            for word in _extract_words(message):
-                counts[word] = counts.get(word, 0) + 1
+        def _update_word_counts(message: str, counts: Counter[str]) -> None:
+            counts.update(_extract_words(message))
 
         def _debate_message(speaker: Agent, other: Agent, iteration: int) -> str:
             category = _friendly_category(speaker.category_id)
@@ -1917,58 +2674,25 @@ class SimulationEngine:
             vocab = _persona_vocab(archetype, category, language)
             insight = _research_insight()
             focal = _pick_phrase(f"{speaker.agent_id}-debate-{iteration}", vocab) if vocab else _idea_concerns()
-            if language != "ar":
-                other_tag = f"Agent {other.agent_id[:4]}"
+            is_ar = language == "ar"
+            other_id = other.agent_id
+            if not is_ar:
+                other_tag = f"Agent {other_id[:4]}"
             else:
-                tag_index = int(hashlib.sha256(other.agent_id.encode("utf-8")).hexdigest()[:8], 16) % len(arabic_peer_tags)
+                tag_index = peer_tag_index_by_agent.get(other_id)
+                if tag_index is None:
+                    tag_index = zlib.crc32(other_id.encode("utf-8")) % len(arabic_peer_tags)
+                    peer_tag_index_by_agent[other_id] = tag_index
                 other_tag = f"الوكيل {arabic_peer_tags[tag_index]}"
-            constraints = _constraints_summary()
-            insight_clause = f" Also, {insight}." if insight and language != "ar" else (f" أيضاً، {insight}." if insight else "")
-            if language == "ar":
-                if speaker.current_opinion == "reject":
-                    return (
-                        f"{other_tag} شايف الفكرة جيدة، لكن {focal} ما زالت نقطة ضعف واضحة عندي. "
-                        f"محتاج دليل عملي أو أرقام قبل ما أغيّر رأيي. ({constraints}){insight_clause}"
-                    )
-                if speaker.current_opinion == "accept":
-                    return (
-                        f"{other_tag} متحفظ، لكني شايف أن {focal} يعطي أفضلية واضحة للفكرة حتى الآن. ({constraints}){insight_clause}"
-                    )
-                return f"{other_tag} قال رأيه، وأنا محايد لأن تفاصيل {focal} غير محسومة حتى الآن. ({constraints}){insight_clause}"
-            if speaker.current_opinion == "reject":
-                return (
-                    f"{other_tag} likes the idea, but I still see {focal} as a major weak spot. "
-                    f"I need concrete proof before moving. ({constraints}){insight_clause}"
-                )
-            if speaker.current_opinion == "accept":
-                return f"{other_tag} is cautious, but I think {focal} keeps the upside credible right now. ({constraints}){insight_clause}"
-            return f"{other_tag} shared a view; I'm still neutral because {focal} feels unresolved. ({constraints}){insight_clause}"
-
-        def _persona_vocab(archetype: str, category: str, language: str) -> list[str]:
-            a = archetype.lower()
-            c = category.lower()
-            if "tech" in a or "developer" in a or "engineer" in c:
-                return (
-                    ["تحسين الكفاءة", "قابلية التوسع", "زمن الاستجابة", "استقرار النظام"]
-                    if language == "ar"
-                    else ["efficiency gains", "scalability", "latency and reliability", "automation potential"]
-                )
-            if "entrepreneur" in a or "business" in a:
-                return (
-                    ["العائد على الاستثمار", "طلب السوق", "هامش الربح", "تكلفة الاستحواذ"]
-                    if language == "ar"
-                    else ["ROI", "market demand", "profit margin", "pricing leverage"]
-                )
-            if "worker" in a or "employee" in c:
-                return (
-                    ["التوفير الشهري", "سهولة الاستخدام", "الاستقرار الوظيفي", "الموثوقية"]
-                    if language == "ar"
-                    else ["monthly savings", "reliability", "day-to-day usability", "job stability"]
-                )
-            return (
-                ["توافق السوق", "الثقة", "الامتثال", "تبني المستخدمين"]
-                if language == "ar"
-                else ["go-to-market traction", "trust", "compliance", "user adoption"]
+            template_language = "ar" if is_ar else "en"
+            insight_clause = _DEBATE_INSIGHT_CLAUSES[template_language].format(insight=insight) if insight else ""
+            opinion = speaker.current_opinion
+            opinion_key = opinion if opinion in {"accept", "reject"} else "neutral"
+            return _DEBATE_TEMPLATES[(template_language, opinion_key)].format(
+                other_tag=other_tag,
+                focal=focal,
+                constraints=constraints_summary,
+                insight_clause=insight_clause,
             )
 
         def _human_reasoning(
@@ -1986,19 +2710,12 @@ class SimulationEngine:
             top_opinion = max(influence_weights, key=influence_weights.get)
             archetype = agent.archetype_name or category
             idea_local = _idea_label_localized() if language == "ar" else _idea_label()
-            prefix = _pick_phrase(
-                f"{agent.agent_id}-{iteration}",
-                ["From my perspective", "Given my background", "As someone in this segment", "In my view"]
-                if language != "ar"
-                else ["من وجهة نظري", "بحكم خبرتي", "كممثل لهذا النوع من الجمهور", "برأيي الشخصي"],
-            )
+            phrase_language = "ar" if language == "ar" else "en"
+            prefix = _pick_phrase(f"{agent.agent_id}-{iteration}", _REASONING_PREFIXES[phrase_language])
             vocab = _persona_vocab(archetype, category, language)
             insight = _research_insight()
             focal = _pick_phrase(f"{agent.agent_id}-vocab-{iteration}", vocab) if vocab else _idea_concerns()
-            peer = _pick_phrase(
-                f"{agent.agent_id}-peer-{iteration}",
-                ["Agent A", "Agent B", "Agent C"] if language != "ar" else ["الوكيل أ", "الوكيل ب", "الوكيل ج"],
-            )
+            peer = _pick_phrase(f"{agent.agent_id}-peer-{iteration}", _PEER_LABELS[phrase_language])
             if changed and prev_opinion and new_opinion:
                 if new_opinion == "accept":
                     if language == "ar":
@@ -2034,10 +2751,8 @@ class SimulationEngine:
             if agent.current_opinion == "accept":
                 reason = _pick_phrase(
                     f"{agent.agent_id}-accept-{iteration}",
-                    [f"{focal} looks strong", f"{focal} is still compelling", f"{focal} keeps the value clear"]
-                    if language != "ar"
-                    else [f"{focal} تبدو قوية", f"{focal} ما زالت مقنعة", f"{focal} توضح القيمة بشكل كافٍ"],
-                )
+                    _ACCEPT_REASON_TEMPLATES[phrase_language],
+                ).format(focal=focal)
                 if skepticism > 0.6:
                     reason = f"{focal} واضحة لكني أريد ضمانات" if language == "ar" else f"{focal} is clear, but I still want safeguards"
                 if language == "ar":
@@ -2045,20 +2760,14 @@ class SimulationEngine:
                 return f"{prefix} ({archetype}), I still lean accept on {idea_local} because {reason}, though {_idea_concerns()} needs safeguards."
 
             if agent.current_opinion == "reject":
+                # Both concerns are drawn up front, in the same order as before,
+                # so the seeded RNG advances identically whichever template wins.
+                concern = _idea_concerns()
+                other_concern = _idea_concerns()
                 reason = _pick_phrase(
                     f"{agent.agent_id}-reject-{iteration}",
-                    [
-                        f"{focal} risk feels too high, especially around {_idea_concerns()}",
-                        f"{focal} uncertainty is still too high",
-                        f"{focal} and {_idea_concerns()} are unresolved",
-                    ]
-                    if language != "ar"
-                    else [
-                        f"مخاطر {focal} مرتفعة، خصوصاً فيما يتعلق بـ {_idea_concerns()}",
-                        f"عدم وضوح {focal} ما زال كبيراً",
-                        f"{focal} و {_idea_concerns()} لم تُحل بعد",
-                    ],
-                )
+                    _REJECT_REASON_TEMPLATES[phrase_language],
+                ).format(focal=focal, concern=concern, other_concern=other_concern)
                 if risk_tolerance > 0.7:
                     reason = f"{focal} مرتفعة والقيمة غير واضحة" if language == "ar" else f"{focal} is high and the value is unclear"
                 if language == "ar":
@@ -2080,13 +2789,20 @@ class SimulationEngine:
                 f"and {_idea_concerns()} still needs concrete proof."
             )
 
-        def _research_signals_text() -> str:
-            signals = research_structured.get("signals") if isinstance(research_structured, dict) else []
-            if isinstance(signals, list) and signals:
-                return "; ".join(str(s) for s in signals[:6])
-            return ""
+        # Focus and research slices depend only on the agent and on research text
+        # that is fixed for the run, so each agent is resolved at most once.
+        # Focus is keyed by (archetype, category) since many agents share one.
+        focus_by_signature: Dict[Tuple[str, str], str] = {}
+        agent_research_cache: Dict[str, Tuple[str, str]] = {}
 
         def _agent_focus(agent: Agent) -> str:
+            signature = (agent.archetype_name or "", str(agent.category_id or ""))
+            focus = focus_by_signature.get(signature)
+            if focus is None:
+                focus = focus_by_signature[signature] = _resolve_agent_focus(agent)
+            return focus
+
+        def _resolve_agent_focus(agent: Agent) -> str:
             archetype = (agent.archetype_name or "").lower()
             category = str(agent.category_id or "").lower()
             if "tech" in archetype or "developer" in archetype or "engineer" in category:
@@ -2101,23 +2817,30 @@ class SimulationEngine:
                 return "employee"
             return "consumer"
 
-
         def _slice_research_for_agent(agent: Agent) -> Tuple[str, str]:
-            summary = research_summary or ""
-            signals = research_structured.get("signals") if isinstance(research_structured, dict) else []
-            signals_list = [str(s) for s in signals] if isinstance(signals, list) else []
-            if not summary and not signals_list:
+            cached = agent_research_cache.get(agent.agent_id)
+            if cached is None:
+                cached = agent_research_cache[agent.agent_id] = _resolve_research_slice(agent)
+            return cached
+
+        # Focus groups hit by each research sentence and signal, scanned once on
+        # first use so every agent's slice is a set-membership test per text.
+        research_focus_groups: Dict[str, List[set[str]]] = {}
+
+        def _research_focus_groups(kind: str, texts_lower: List[str]) -> List[set[str]]:
+            groups = research_focus_groups.get(kind)
+            if groups is None:
+                groups = research_focus_groups[kind] = [
+                    _keyword_groups(text, _FOCUS_RESEARCH_MATCHER) for text in texts_lower
+                ]
+            return groups
+
+        def _resolve_research_slice(agent: Agent) -> Tuple[str, str]:
+            signals_list = research_signals_list
+            if not research_summary and not signals_list:
                 return "", ""
 
             focus = _agent_focus(agent)
-            keywords = {
-                "tech": ["latency", "scalability", "performance", "throughput", "reliability", "uptime", "api", "backend", "server", "security", "infrastructure"],
-                "health": ["patient", "safety", "ethic", "clinical", "privacy", "consent", "care", "harm", "mental"],
-                "policy": ["regulation", "law", "compliance", "liability", "privacy", "audit", "gdpr"],
-                "business": ["market", "pricing", "roi", "competition", "demand", "margin", "acquisition", "growth", "cac"],
-                "employee": ["budget", "stability", "workflow", "training", "support", "salary", "workload"],
-                "consumer": ["price", "cost", "usability", "convenience", "support", "trust", "onboarding"],
-            }
             directives = {
                 "tech": "Focus: APIs, backend latency, scalability, reliability, security.",
                 "business": "Focus: ROI, CAC, pricing, demand, competition.",
@@ -2126,24 +2849,25 @@ class SimulationEngine:
                 "employee": "Focus: stability, budget impact, workload, operational friction.",
                 "consumer": "Focus: usability, trust, support, onboarding, price sensitivity.",
             }
-            focus_keywords = keywords.get(focus, [])
-
-            def _contains_any(text: str, keys: List[str]) -> bool:
-                if not keys:
-                    return False
-                hay = text.lower()
-                return any(k in hay for k in keys)
 
-            sentences = [s.strip() for s in re.split(r"[.!?]", summary) if s.strip()]
-            focus_sent = [s for s in sentences if _contains_any(s, focus_keywords)]
+            sentences = summary_sentences
+            focus_sent = [
+                sentence
+                for sentence, groups in zip(sentences, _research_focus_groups("summary", summary_sentences_lower))
+                if focus in groups
+            ]
             if not focus_sent and sentences:
-                start = int(hashlib.sha256((agent.agent_id + idea_text).encode("utf-8")).hexdigest()[:8], 16) % len(sentences)
+                start = zlib.crc32((agent.agent_id + idea_text).encode("utf-8")) % len(sentences)
                 focus_sent = [sentences[start]]
             summary_slice = " ".join(focus_sent[:2]) if focus_sent else ""
 
-            focus_signals = [s for s in signals_list if _contains_any(s, focus_keywords)]
+            focus_signals = [
+                signal
+                for signal, groups in zip(signals_list, _research_focus_groups("signals", research_signals_lower))
+                if focus in groups
+            ]
             if not focus_signals and signals_list:
-                start = int(hashlib.sha256((agent.agent_id + str(len(signals_list))).encode("utf-8")).hexdigest()[:8], 16) % len(signals_list)
+                start = zlib.crc32((agent.agent_id + str(len(signals_list))).encode("utf-8")) % len(signals_list)
                 count = min(2, len(signals_list))
                 focus_signals = [signals_list[(start + i) % len(signals_list)] for i in range(count)]
             signals_slice = "; ".join(focus_signals[:2]) if focus_signals else ""
@@ -2153,49 +2877,76 @@ class SimulationEngine:
                 signals_slice = f"{signals_slice}; {focus_directive}" if signals_slice else focus_directive
             return summary_slice, signals_slice
 
-        def _apply_research_grounding(agent: Agent, weights: Dict[str, float]) -> None:
-            structured = user_context.get("research_structured") or {}
-            if not isinstance(structured, dict):
-                return
+        # The research levels are fixed for the run: resolve them once into the
+        # (reject, penalty) and accept coefficients applied to every agent.
+        grounding_structured = user_context.get("research_structured") or {}
+        grounding_enabled = isinstance(grounding_structured, dict)
+        grounding_reject_terms: List[Tuple[float, float]] = []
+        grounding_accept_terms: List[float] = []
+        grounding_demand_strong = False
+        if grounding_enabled:
+            competition_level = str(grounding_structured.get("competition_level") or "").lower()
+            demand_level = str(grounding_structured.get("demand_level") or "").lower()
+            regulatory_level = str(grounding_structured.get("regulatory_risk") or "").lower()
+            price_level = str(grounding_structured.get("price_sensitivity") or "").lower()
+            if competition_level in {"high", "crowded", "saturated"}:
+                grounding_reject_terms.append((0.24, 0.12))
+            if competition_level in {"medium", "moderate"}:
+                grounding_reject_terms.append((0.14, 0.0))
+            if demand_level in {"low", "weak"}:
+                grounding_reject_terms.append((0.22, 0.12))
+            if demand_level in {"medium", "moderate"}:
+                grounding_reject_terms.append((0.12, 0.0))
+            if regulatory_level in {"high", "strict"}:
+                grounding_reject_terms.append((0.32, 0.18))
+            if regulatory_level in {"medium", "moderate"}:
+                grounding_reject_terms.append((0.18, 0.0))
+            if price_level in {"high"}:
+                grounding_reject_terms.append((0.14, 0.08))
+            grounding_demand_strong = demand_level in {"high", "strong"}
+            if grounding_demand_strong:
+                grounding_accept_terms.append(0.18)
+            if competition_level in {"low"}:
+                grounding_accept_terms.append(0.14)
+
+        # Trait-scaled grounding deltas per agent id; traits and research levels
+        # are fixed for the run, so each agent's terms are derived only once.
+        grounding_agent_terms: Dict[str, Tuple[Tuple[float, ...], Tuple[float, ...], float, float]] = {}
+
+        def _grounding_terms(agent: Agent) -> Tuple[Tuple[float, ...], Tuple[float, ...], float, float]:
             risk_tolerance = float(agent.traits.get("risk_tolerance", 0.5))
             skepticism = float(agent.traits.get("skepticism", 0.5))
             negative_scale = 0.85 + (0.3 * (1.0 - risk_tolerance))
             positive_scale = 0.85 + (0.3 * (1.0 - skepticism))
-            competition = str(structured.get("competition_level") or "").lower()
-            demand = str(structured.get("demand_level") or "").lower()
-            regulatory = str(structured.get("regulatory_risk") or "").lower()
-            price = str(structured.get("price_sensitivity") or "").lower()
+            reject_terms: List[float] = []
             penalty = 0.0
             if idea_risk > 0:
                 base_risk_boost = idea_risk * (0.18 + (0.22 * (1.0 - risk_tolerance)))
-                weights["reject"] += base_risk_boost
+                reject_terms.append(base_risk_boost)
                 penalty += base_risk_boost * 0.35
-            if competition in {"high", "crowded", "saturated"}:
-                weights["reject"] += 0.24 * negative_scale
-                penalty += 0.12 * negative_scale
-            if competition in {"medium", "moderate"}:
-                weights["reject"] += 0.14 * negative_scale
-            if demand in {"low", "weak"}:
-                weights["reject"] += 0.22 * negative_scale
-                penalty += 0.12 * negative_scale
-            if demand in {"medium", "moderate"}:
-                weights["reject"] += 0.12 * negative_scale
-            if regulatory in {"high", "strict"}:
-                weights["reject"] += 0.32 * negative_scale
-                penalty += 0.18 * negative_scale
-            if regulatory in {"medium", "moderate"}:
-                weights["reject"] += 0.18 * negative_scale
-            if price in {"high"}:
-                weights["reject"] += 0.14 * negative_scale
-                penalty += 0.08 * negative_scale
-            if demand in {"high", "strong"}:
-                weights["accept"] += 0.18 * positive_scale
-            if competition in {"low"}:
-                weights["accept"] += 0.14 * positive_scale
+            for reject_weight, penalty_weight in grounding_reject_terms:
+                reject_terms.append(reject_weight * negative_scale)
+                if penalty_weight:
+                    penalty += penalty_weight * negative_scale
+            accept_terms = tuple(accept_weight * positive_scale for accept_weight in grounding_accept_terms)
+            return tuple(reject_terms), accept_terms, penalty, 0.04 * positive_scale
+
+        def _apply_research_grounding(agent: Agent, weights: Dict[str, float]) -> None:
+            if not grounding_enabled:
+                return
+            terms = grounding_agent_terms.get(agent.agent_id)
+            if terms is None:
+                terms = grounding_agent_terms[agent.agent_id] = _grounding_terms(agent)
+            reject_terms, accept_terms, penalty, demand_relief = terms
+            # Added one term at a time to keep the original float accumulation.
+            for term in reject_terms:
+                weights["reject"] += term
+            for term in accept_terms:
+                weights["accept"] += term
             if penalty > 0 and agent.current_opinion == "accept":
                 agent.confidence = max(0.2, agent.confidence - penalty)
-            if demand in {"high", "strong"} and agent.current_opinion == "reject":
-                agent.confidence = max(0.2, agent.confidence - (0.04 * positive_scale))
+            if grounding_demand_strong and agent.current_opinion == "reject":
+                agent.confidence = max(0.2, agent.confidence - demand_relief)
 
         # Dialogue orchestration (formal state machine / fixed 4 user-facing stages)
         phase_order = [
@@ -2211,6 +2962,14 @@ class SimulationEngine:
             "Final Convergence": "verdict",
         }
 
+        # Ladder rows with their normalized text; the ladder is fixed for the run
+        # and every evidence lookup compares against these lowered texts.
+        ladder_texts = [
+            (item, str(item.get("text") or "").strip().lower())
+            for item in research_evidence_ladder
+            if isinstance(item, dict)
+        ]
+
         def _build_evidence_cards() -> List[str]:
             def _type_rank(summary: Dict[str, Any]) -> int:
                 if int(summary.get("direct_count") or 0) > 0:
@@ -2225,23 +2984,15 @@ class SimulationEngine:
                 normalized = str(text or "").strip().lower()
                 if not normalized:
                     return []
-                exact = [
-                    item
-                    for item in research_evidence_ladder
-                    if isinstance(item, dict) and str(item.get("text") or "").strip().lower() == normalized
-                ]
+                exact = [item for item, ladder_text in ladder_texts if ladder_text == normalized]
                 if exact:
                     return exact
                 if len(normalized) < 18:
                     return []
                 return [
                     item
-                    for item in research_evidence_ladder
-                    if isinstance(item, dict)
-                    and (
-                        normalized in str(item.get("text") or "").strip().lower()
-                        or str(item.get("text") or "").strip().lower() in normalized
-                    )
+                    for item, ladder_text in ladder_texts
+                    if normalized in ladder_text or ladder_text in normalized
                 ][:3]
 
             card_summary_map: Dict[str, Dict[str, Any]] = {}
@@ -2250,17 +3001,20 @@ class SimulationEngine:
                 text = str(card or "").strip()
                 if not text:
                     return None
-                matched = _matching_ladder_items(text)
-                card_summary_map[text] = summarize_evidence_confidence(matched) if matched else dict(overall_evidence_summary)
+                # The summary depends only on the text, so repeats keep the first one.
+                if text not in card_summary_map:
+                    matched = _matching_ladder_items(text)
+                    card_summary_map[text] = summarize_evidence_confidence(matched) if matched else dict(overall_evidence_summary)
                 return text
 
+            def _ladder_row_key(item: Dict[str, Any]) -> Tuple[int, float]:
+                summary = summarize_evidence_confidence([item])
+                return _type_rank(summary), -float((summary or {}).get("score") or 0.0)
+
             cards: List[str] = []
             ordered_ladder_rows = sorted(
-                [item for item in research_evidence_ladder if isinstance(item, dict) and str(item.get("text") or "").strip()],
-                key=lambda item: (
-                    _type_rank(summarize_evidence_confidence([item])),
-                    -float((summarize_evidence_confidence([item]) or {}).get("score") or 0.0),
-                ),
+                [item for item, ladder_text in ladder_texts if ladder_text],
+                key=_ladder_row_key,
             )
             for item in ordered_ladder_rows:
                 text = _register(str(item.get("text") or ""))
@@ -2281,7 +3035,7 @@ class SimulationEngine:
             if isinstance(structured, dict):
                 summary = str(structured.get("summary") or "").strip()
                 if summary:
-                    for sentence in re.split(r"[.!?]", summary):
+                    for sentence in summary.translate(_SENTENCE_END_TABLE).split("."):
                         sentence = sentence.strip()
                         if len(sentence) > 12:
                             text = _register(sentence)
@@ -2301,21 +3055,14 @@ class SimulationEngine:
                             cards.append(text)
 
             if research_summary:
-                for sentence in re.split(r"[.!?]", research_summary):
-                    sentence = sentence.strip()
+                for sentence in summary_sentences:
                     if len(sentence) > 12:
                         text = _register(sentence)
                         if text:
                             cards.append(text)
 
-            seen = set()
-            unique_cards = []
-            for card in cards:
-                if card and card not in seen:
-                    seen.add(card)
-                    unique_cards.append(card)
             ranked_cards = sorted(
-                unique_cards,
+                dict.fromkeys(cards),
                 key=lambda card: (
                     _type_rank(card_summary_map.get(card, {})),
                     -float((card_summary_map.get(card, {}) or {}).get("score") or 0.0),
@@ -2325,16 +3072,14 @@ class SimulationEngine:
             return ranked_cards[:8]
 
         evidence_cards = _build_evidence_cards()
+        evidence_cards_lower = [card.lower() for card in evidence_cards]
 
         def _evidence_summary_for_cards(cards: List[str]) -> Dict[str, Any]:
             normalized_cards = [str(card).strip().lower() for card in cards if str(card).strip()]
             if not normalized_cards:
                 return dict(overall_evidence_summary)
             matched: List[Dict[str, Any]] = []
-            for item in research_evidence_ladder:
-                if not isinstance(item, dict):
-                    continue
-                item_text = str(item.get("text") or "").strip().lower()
+            for item, item_text in ladder_texts:
                 if not item_text:
                     continue
                 for card in normalized_cards:
@@ -2360,14 +3105,6 @@ class SimulationEngine:
             "policy": "law, compliance, regulatory risk, auditability",
             "consumer": "trust, usability, cost-to-value, support",
         }
-        role_keywords = {
-            "tech": ["latency", "scalability", "performance", "api", "backend", "server", "security"],
-            "business": ["roi", "cac", "market", "pricing", "competition", "demand", "margin", "revenue"],
-            "employee": ["budget", "stability", "workflow", "training", "salary", "workload"],
-            "health": ["ethic", "privacy", "patient", "safety", "clinical", "harm", "mental"],
-            "policy": ["law", "regulation", "compliance", "liability", "gdpr", "audit"],
-            "consumer": ["price", "cost", "usability", "trust", "support", "onboarding"],
-        }
         role_fallback_evidence = {
             "tech": [
                 "Engineering memo flags backend latency spikes under peak usage.",
@@ -2395,7 +3132,18 @@ class SimulationEngine:
             ],
         }
 
+        # Agents built from the same template share archetype, category and
+        # biases, so each distinct signature is classified once.
+        role_by_signature: Dict[Tuple[str, str, Tuple[str, ...]], Tuple[str, str, str]] = {}
+
         def _role_for_agent(agent: Agent) -> Tuple[str, str, str]:
+            signature = (agent.archetype_name or "", agent.category_id or "", tuple(agent.biases))
+            role = role_by_signature.get(signature)
+            if role is None:
+                role = role_by_signature[signature] = _classify_role(agent)
+            return role
+
+        def _classify_role(agent: Agent) -> Tuple[str, str, str]:
             archetype = agent.archetype_name or agent.category_id or "Participant"
             archetype_lower = archetype.lower()
             category = (agent.category_id or "").lower()
@@ -2418,11 +3166,16 @@ class SimulationEngine:
             guidance = role_guidance_map.get(role_key, role_guidance_map["consumer"])
             return role_key, label, guidance
 
-        agent_roles: Dict[str, Tuple[str, str, str]] = {}
+        # Role rows line up with ``agents`` so the per-phase task loop reads them
+        # by position.
+        agent_roles: List[Tuple[str, str, str]] = []
+        # Biases are fixed once agents are built, so the task summary is joined once.
+        agent_bias_summaries: Dict[str, str] = {}
         role_buckets: Dict[str, List[Agent]] = {k: [] for k in role_guidance_map.keys()}
         for agent in agents:
             role_key, role_label, role_guidance = _role_for_agent(agent)
-            agent_roles[agent.agent_id] = (role_key, role_label, role_guidance)
+            agent_roles.append((role_key, role_label, role_guidance))
+            agent_bias_summaries[agent.agent_id] = ", ".join(agent.biases[:2]) if agent.biases else "none"
             role_buckets.setdefault(role_key, []).append(agent)
 
         role_rotations = {k: 0 for k in role_buckets.keys()}
@@ -2435,67 +3188,70 @@ class SimulationEngine:
             role_rotations[role] = role_rotations.get(role, 0) + 1
             return pool[idx]
 
-        def _select_speakers(count: int) -> List[Agent]:
+        def _select_speakers(count: int) -> set[int]:
+            """Positions in ``agents`` of the agents picked to speak this phase."""
             selected: List[Agent] = []
+            selected_positions: set[int] = set()
+
+            def _take(candidate: Agent) -> None:
+                position = agent_positions[candidate.agent_id]
+                if position not in selected_positions:
+                    selected_positions.add(position)
+                    selected.append(candidate)
+
             priority_roles = ["tech", "business", "employee", "health", "policy"]
             for role in priority_roles:
                 if len(selected) >= count:
                     break
                 if role_buckets.get(role):
-                    candidate = _pick_role_agent(role)
-                    if candidate not in selected:
-                        selected.append(candidate)
+                    _take(_pick_role_agent(role))
             available_roles = [r for r in priority_roles if role_buckets.get(r)] or list(role_buckets.keys())
             while len(selected) < count and len(selected) < len(agents):
                 role = random.choice(available_roles) if available_roles else None
-                candidate = _pick_role_agent(role) if role else random.choice(agents)
-                if candidate not in selected:
-                    selected.append(candidate)
+                _take(_pick_role_agent(role) if role else random.choice(agents))
             # Ensure we don't sample only one opinion when others exist.
-            opinions_present = {a.current_opinion for a in agents}
-            selected_opinions = {a.current_opinion for a in selected}
-            missing = [op for op in opinions_present if op not in selected_opinions]
+            opinions_present = {op for op, positions in opinion_positions.items() if positions}
+            # Slots per opinion, ascending; the slot count doubles as the opinion
+            # count, and the first slot is the one a replacement overwrites.
+            opinion_slots: Dict[str, List[int]] = {}
+            for idx, agent in enumerate(selected):
+                opinion_slots.setdefault(agent.current_opinion, []).append(idx)
+            missing = [op for op in opinions_present if op not in opinion_slots]
             if missing and selected:
-                selected_counts = Counter(a.current_opinion for a in selected)
                 for op in missing:
-                    candidates = [a for a in agents if a.current_opinion == op and a not in selected]
+                    candidates = [agents[idx] for idx in sorted(opinion_positions[op] - selected_positions)]
                     if not candidates:
                         continue
-                    max_op = max(selected_counts, key=selected_counts.get)
-                    replace_idx = next((i for i, a in enumerate(selected) if a.current_opinion == max_op), None)
-                    if replace_idx is None:
+                    max_op = max(opinion_slots, key=lambda key: len(opinion_slots[key]))
+                    max_slots = opinion_slots[max_op]
+                    if not max_slots:
                         continue
-                    selected[replace_idx] = random.choice(candidates)
-                    selected_counts[max_op] = max(0, selected_counts[max_op] - 1)
-                    selected_counts[op] = selected_counts.get(op, 0) + 1
-            return selected
+                    replace_idx = max_slots.pop(0)
+                    replacement = random.choice(candidates)
+                    selected_positions.discard(agent_positions[selected[replace_idx].agent_id])
+                    selected_positions.add(agent_positions[replacement.agent_id])
+                    selected[replace_idx] = replacement
+                    bisect.insort(opinion_slots.setdefault(op, []), replace_idx)
+            return selected_positions
 
-        def _build_role_evidence(cards: List[str]) -> Dict[str, List[str]]:
+        idea_context_tokens = frozenset(_extract_words(f"{idea_label_for_llm} {idea_text}"))
+
+        def _build_role_evidence(cards: List[str], cards_lower: List[str]) -> Dict[str, List[str]]:
             evidence_by_role = {k: [] for k in role_guidance_map.keys()}
             general: List[str] = []
-            idea_tokens = set(_extract_words(f"{idea_label_for_llm} {idea_text}"))
-            for card in cards:
-                low = card.lower()
-                matched = False
-                for role, keys in role_keywords.items():
-                    if any(k in low for k in keys):
-                        evidence_by_role[role].append(card)
-                        matched = True
-                if not matched:
+            for card, card_lower in zip(cards, cards_lower):
+                matched_roles = _keyword_groups(card_lower, _ROLE_EVIDENCE_MATCHER)
+                for role in matched_roles:
+                    evidence_by_role[role].append(card)
+                if not matched_roles:
                     general.append(card)
 
             def _dedupe(items: List[str]) -> List[str]:
-                seen = set()
-                out: List[str] = []
-                for item in items:
-                    if item and item not in seen:
-                        seen.add(item)
-                        out.append(item)
-                return out
+                return list(dict.fromkeys(filter(None, items)))
 
             def _score_card(card: str) -> Tuple[int, int]:
                 tokens = set(_extract_words(str(card or "")))
-                overlap = len(tokens & idea_tokens)
+                overlap = len(tokens & idea_context_tokens)
                 return overlap, len(tokens)
 
             for role in evidence_by_role:
@@ -2524,26 +3280,50 @@ class SimulationEngine:
                 evidence_by_role[role] = selected[:6]
             return evidence_by_role
 
-        evidence_by_role = _build_role_evidence(evidence_cards)
+        evidence_by_role = _build_role_evidence(evidence_cards, evidence_cards_lower)
+        # Per-role task hints; the evidence pools are fixed for the run, so every
+        # agent sharing a role in every phase gets the same clipped hints.
+        role_evidence_hints: Dict[str, Tuple[str, Tuple[str, ...], float]] = {}
+
+        def _role_evidence_hints(role_key: str) -> Tuple[str, Tuple[str, ...], float]:
+            cached = role_evidence_hints.get(role_key)
+            if cached is None:
+                evidence_pool = evidence_by_role.get(role_key) or evidence_cards
+                evidence_hint = _clip_text(str(evidence_pool[0]), 120) if evidence_pool else ""
+                evidence_hints = tuple(_clip_text(str(item), 120) for item in (evidence_pool[:2] if evidence_pool else ()))
+                task_evidence_summary = _evidence_summary_for_cards(list(evidence_hints) or ([evidence_hint] if evidence_hint else []))
+                confidence = float(task_evidence_summary.get("score") or overall_evidence_summary.get("score") or 0.5)
+                cached = role_evidence_hints[role_key] = (evidence_hint, evidence_hints, confidence)
+            return cached
         used_openers_seed = resume_state.get("used_openers")
-        used_openers: set[str] = set(
+        # Recently accepted openers, oldest first; bounded so long runs do not
+        # grow it without limit and only fairly recent openers are blocked.
+        used_openers: OrderedDict[str, None] = OrderedDict.fromkeys(
             str(item).strip().lower()
             for item in (used_openers_seed or [])
             if str(item).strip()
         )
+        while len(used_openers) > _USED_OPENERS_LIMIT:
+            used_openers.popitem(last=False)
+
+        def _remember_opener(opener: str) -> None:
+            if not opener:
+                return
+            used_openers[opener] = None
+            used_openers.move_to_end(opener)
+            if len(used_openers) > _USED_OPENERS_LIMIT:
+                used_openers.popitem(last=False)
         dialogue_seed = resume_state.get("dialogue_history")
         if not isinstance(dialogue_seed, list):
             dialogue_seed = []
-        dialogue_history: deque[Dict[str, Any]] = deque(
+        dialogue_history = _DialogueHistory(
             [item for item in dialogue_seed if isinstance(item, dict)],
             maxlen=max_dialogue_context,
         )
 
         def _pick_reply_target(speaker: Agent) -> Tuple[str, str, str]:
-            candidates = [h for h in dialogue_history if h.get("agent_id") != speaker.agent_id]
-            if candidates:
-                diff = [c for c in candidates if c.get("opinion") != speaker.current_opinion]
-                target = diff[-1] if diff else candidates[-1]
+            target = dialogue_history.reply_target(speaker.agent_id, speaker.current_opinion)
+            if target is not None:
                 return target["agent_id"], target["short_id"], target["message"]
             # No prior dialogue: do not force a reply-to reference on the very first message.
             fallback_msg = evidence_cards[0] if evidence_cards else (idea_text.strip() or "the idea")
@@ -2585,19 +3365,35 @@ class SimulationEngine:
         else:
             metrics_counts, metrics_breakdown = _init_metrics_state()
 
-        def _apply_metrics_change(category_id: str, prev: str, new: str) -> None:
+        # Positions in ``agents`` grouped by current opinion, moved on every
+        # stance update so speaker selection never rescans the population.
+        agent_positions: Dict[str, int] = {agent.agent_id: idx for idx, agent in enumerate(agents)}
+        opinion_positions: Dict[str, set[int]] = {}
+        for idx, agent in enumerate(agents):
+            opinion_positions.setdefault(agent.current_opinion, set()).add(idx)
+
+        def _apply_metrics_change(agent: Agent, prev: str, new: str) -> None:
+            position = agent_positions[agent.agent_id]
+            for op, positions in opinion_positions.items():
+                if op != new:
+                    positions.discard(position)
+            opinion_positions.setdefault(new, set()).add(position)
             if prev == new:
                 return
+            category_id = agent.category_id
             if prev not in metrics_counts:
                 prev = "neutral"
             if new not in metrics_counts:
                 new = "neutral"
-            metrics_counts[prev] = max(0, metrics_counts.get(prev, 0) - 1)
-            metrics_counts[new] = metrics_counts.get(new, 0) + 1
-            if category_id not in metrics_breakdown:
-                metrics_breakdown[category_id] = {"accept": 0, "reject": 0, "neutral": 0}
-            metrics_breakdown[category_id][prev] = max(0, metrics_breakdown[category_id].get(prev, 0) - 1)
-            metrics_breakdown[category_id][new] = metrics_breakdown[category_id].get(new, 0) + 1
+            # Both count tables always carry all three opinion keys, and prev/new
+            # are normalized onto them above, so plain indexing is safe here.
+            metrics_counts[prev] = max(0, metrics_counts[prev] - 1)
+            metrics_counts[new] += 1
+            category_counts = metrics_breakdown.get(category_id)
+            if category_counts is None:
+                category_counts = metrics_breakdown[category_id] = {"accept": 0, "reject": 0, "neutral": 0}
+            category_counts[prev] = max(0, category_counts[prev] - 1)
+            category_counts[new] += 1
 
         def _build_metrics_payload(iteration_value: int) -> Dict[str, Any]:
             total = len(agents)
@@ -2605,12 +3401,7 @@ class SimulationEngine:
             rejected = metrics_counts.get("reject", 0)
             neutral = metrics_counts.get("neutral", 0)
             acceptance_rate = accepted / total if total > 0 else 0.0
-            decided = accepted + rejected
-            if decided > 0:
-                balance = 1.0 - (abs(accepted - rejected) / decided)
-                polarization = max(0.0, min(1.0, balance * (decided / total)))
-            else:
-                polarization = 0.0
+            polarization = polarization_score(accepted, rejected, total)
             per_category = {k: v.get("accept", 0) for k, v in metrics_breakdown.items()}
             return {
                 "accepted": accepted,
@@ -2631,9 +3422,12 @@ class SimulationEngine:
             stubbornness = float(traits.get("stubbornness", 0.4))
             return f"optimism={optimism:.2f}, skepticism={skepticism:.2f}, risk={risk_tolerance:.2f}, stubborn={stubbornness:.2f}"
 
+        # Traits are fixed once agents are built; project each agent's summary once.
+        agent_trait_summaries: Dict[str, str] = {agent.agent_id: _compact_traits(agent.traits) for agent in agents}
+
         def _detect_output_language() -> str:
-            has_ar = bool(re.search(r"[\u0600-\u06FF]", idea_text or ""))
-            has_en = bool(re.search(r"[A-Za-z]", idea_text or ""))
+            has_ar = bool(_ARABIC_CHAR_RE.search(idea_text or ""))
+            has_en = bool(_LATIN_CHAR_RE.search(idea_text or ""))
             if has_ar and has_en:
                 return "mixed"
             if language in {"ar", "en"}:
@@ -2678,129 +3472,50 @@ class SimulationEngine:
         except Exception:
             clarification_total_steps = 0
 
-        reason_tag_keywords: Dict[str, List[str]] = {
-            "privacy_surveillance": [
-                "privacy", "surveillance", "tracking", "gps", "messages", "private chat", "bank", "banking",
-                "pii", "personal data", "monitor", "مراقبة", "خصوصية", "تتبع", "تحركات", "رسائل خاصة", "بيانات شخصية",
-            ],
-            "legal_compliance": [
-                "legal", "law", "gdpr", "eeoc", "compliance", "regulation", "liability", "audit", "policy",
-                "قانون", "امتثال", "تشريعات", "لائحة", "تنظيم", "مساءلة", "تدقيق",
-            ],
-            "ethical_discrimination": [
-                "ethic", "ethical", "discrimination", "bias", "fairness", "unfair", "تمييز", "تحيز", "عدالة", "أخلاقي",
-            ],
-            "unclear_target": [
-                "target audience", "segment", "customer", "persona", "who will use", "من هو العميل", "الجمهور", "الشريحة",
-            ],
-            "unclear_value": [
-                "value proposition", "why now", "unclear value", "problem fit", "need clearer benefit",
-                "القيمة", "غير واضح", "الفائدة", "حل المشكلة",
-            ],
-            "feasibility_scalability": [
-                "feasible", "feasibility", "scalability", "latency", "infrastructure", "implementation",
-                "maintenance", "complexity", "deploy", "تشغيل", "قابلية", "توسع", "تنفيذ", "تعقيد",
-            ],
-            "market_demand": [
-                "market", "demand", "competition", "pricing", "cac", "roi", "sales", "traction",
-                "السوق", "الطلب", "منافسة", "تسعير", "عوائد",
-            ],
-            "evidence_gap": [
-                "evidence", "source", "citation", "proof", "missing data", "insufficient data", "need data",
-                "أدلة", "مصدر", "إثبات", "بيانات غير كافية",
-            ],
-        }
-        # Keep a stable text fallback for prompts even when structured research is missing.
-        try:
-            research_signals = _research_signals_text()
-        except Exception:
-            research_signals = ""
-
-        def _normalized(text: str) -> str:
-            return re.sub(r"\s+", " ", (text or "").strip().lower())
-
         def _extract_text_from_llm_output(raw_value: Any) -> str:
             raw_text = str(raw_value or "").strip()
             if not raw_text:
                 return ""
-            candidates = [raw_text]
-            fenced = re.search(r"```(?:json)?\s*(\{.*?\}|\[.*?\])\s*```", raw_text, re.DOTALL)
-            if fenced:
-                candidates.append(fenced.group(1).strip())
-            for pattern in (r"(\{.*\})", r"(\[.*\])"):
-                match = re.search(pattern, raw_text, re.DOTALL)
-                if match:
-                    candidates.append(match.group(1).strip())
-            for candidate in candidates:
-                try:
-                    parsed = json.loads(candidate)
-                except Exception:
-                    continue
-                if isinstance(parsed, dict):
-                    for key in ("message", "text", "response", "content"):
-                        value = parsed.get(key)
-                        if isinstance(value, str) and value.strip():
-                            return value.strip()
-                if isinstance(parsed, list):
-                    for item in parsed:
-                        if isinstance(item, dict):
-                            value = item.get("message") or item.get("text")
+            # Reasoning is requested as plain text, and without a bracket no
+            # fragment can decode to an object or list, so skip the JSON probes.
+            if "{" in raw_text or "[" in raw_text:
+                for candidate in _candidate_json_fragments(raw_text):
+                    try:
+                        parsed = _loads_json(candidate)
+                    except Exception:
+                        continue
+                    if isinstance(parsed, dict):
+                        for key in ("message", "text", "response", "content"):
+                            value = parsed.get(key)
                             if isinstance(value, str) and value.strip():
                                 return value.strip()
+                    if isinstance(parsed, list):
+                        for item in parsed:
+                            if isinstance(item, dict):
+                                value = item.get("message") or item.get("text")
+                                if isinstance(value, str) and value.strip():
+                                    return value.strip()
             if raw_text.startswith('"') and raw_text.endswith('"'):
                 try:
-                    return str(json.loads(raw_text))
+                    return str(_loads_json(raw_text))
                 except Exception:
                     pass
             return raw_text
 
-        template_signatures = {
-            _normalized("كمختص"),
-            _normalized("as a"),
-            _normalized("I need more clarity"),
-            _normalized("this could work if executed carefully"),
-            _normalized("this is too risky to accept as-is"),
-        }
-        generic_signatures = {
-            _normalized("As a specialist"),
-            _normalized("Based on the available data"),
-            _normalized("I need more concrete detail before deciding"),
-            _normalized("كمختص"),
-            _normalized("أنا محتاج توضيح أكتر قبل ما أحكم"),
-        }
+        # The idea, style and policy/research lines are the same for every task
+        # in a run; they are joined once on first use (the hard safety flag is
+        # only known after setup) and spliced between the per-task lines.
+        reasoning_prompt_blocks: List[Tuple[str, str, str]] = []
 
-        def _build_reasoning_prompt(task: Dict[str, Any]) -> str:
-            context_turns = list(dialogue_history)[-reasoning_context_turns:]
-            context_lines: List[str] = []
-            for turn in context_turns:
-                short_id = str(turn.get("short_id") or "")[:4]
-                msg = _clip_text(str(turn.get("message") or ""), 180)
-                if short_id and msg:
-                    context_lines.append(f"- {short_id}: {msg}")
-            role_label = str(task.get("role_label") or "Participant")
-            role_guidance = str(task.get("role_guidance") or "")
-            evidence_hints = task.get("evidence_hints") or []
-            if not isinstance(evidence_hints, list):
-                evidence_hints = []
-            evidence_hints = [str(item).strip() for item in evidence_hints if str(item).strip()][:2]
-            reply_to_short = str(task.get("reply_to_short") or "")
-            reply_hint = _clip_text(str(task.get("reply_to_message") or ""), 180)
+        def _reasoning_prompt_static_blocks() -> Tuple[str, str, str]:
+            if reasoning_prompt_blocks:
+                return reasoning_prompt_blocks[0]
             style_hint = {
                 "ar": "Arabic (Egyptian colloquial), natural and direct.",
                 "en": "English, natural spoken tone.",
                 "mixed": "Natural mixed Arabic-English only if it feels organic.",
             }[output_language]
-            lines = [
-                "You are one agent in a social simulation debate.",
-                f"Idea: {idea_label_for_llm}",
-                f"Role: {role_label}",
-                f"Phase: {task.get('phase_label') or 'debate'}",
-                f"Role guidance: {role_guidance}",
-                f"Traits: {task.get('traits_summary')}",
-                f"Biases: {task.get('bias_summary')}",
-                f"Current stance hint: {task.get('math_opinion')}",
-                f"Style language: {style_hint}",
-                f"Reasoning length mode: {task.get('length_mode')}",
+            rules = [
                 "Write 2-4 concise, natural sentences.",
                 "No templates, no bullet lists, no boilerplate.",
                 "The first sentence must explicitly reference the IDEA.",
@@ -2810,7 +3525,7 @@ class SimulationEngine:
                 "If data is missing, say it is missing and ask for clarification instead of guessing.",
             ]
             if hard_unsafe_triggered:
-                lines.extend(
+                rules.extend(
                     [
                         "Policy mode is HARD SAFETY GATE.",
                         "The idea appears high-risk; explicitly address legal, ethical, privacy, and discrimination impact.",
@@ -2818,7 +3533,64 @@ class SimulationEngine:
                     ]
                 )
             if research_summary or research_signals:
-                lines.append(f"Research summary: {_clip_text(research_summary or research_signals, 280)}")
+                rules.append(f"Research summary: {_clip_text(research_summary or research_signals, 280)}")
+            blocks = (
+                f"You are one agent in a social simulation debate.\nIdea: {idea_label_for_llm}",
+                f"Style language: {style_hint}",
+                "\n".join(rules),
+            )
+            reasoning_prompt_blocks.append(blocks)
+            return blocks
+
+        # Rendered context lines for the latest dialogue history version; every
+        # task and retry between two appended turns shares the same block. Each
+        # turn's own line is kept while it stays in the window, so a new turn
+        # clips one message instead of re-clipping the whole window. Entries hold
+        # the turn itself, which keeps its id() from being reused meanwhile.
+        context_lines_cache: Dict[int, List[str]] = {}
+        context_line_by_turn: Dict[int, Tuple[Dict[str, Any], str]] = {}
+
+        def _recent_context_lines() -> List[str]:
+            version = dialogue_history.version
+            cached = context_lines_cache.get(version)
+            if cached is not None:
+                return cached
+            context_lines: List[str] = []
+            window_lines: Dict[int, Tuple[Dict[str, Any], str]] = {}
+            for turn in dialogue_history.recent(reasoning_context_turns):
+                entry = context_line_by_turn.get(id(turn))
+                if entry is None or entry[0] is not turn:
+                    short_id = str(turn.get("short_id") or "")[:4]
+                    msg = _clip_text(str(turn.get("message") or ""), 180)
+                    entry = (turn, f"- {short_id}: {msg}" if short_id and msg else "")
+                window_lines[id(turn)] = entry
+                if entry[1]:
+                    context_lines.append(entry[1])
+            context_line_by_turn.clear()
+            context_line_by_turn.update(window_lines)
+            context_lines_cache.clear()
+            context_lines_cache[version] = context_lines
+            return context_lines
+
+        def _build_reasoning_prompt(task: _ReasoningTask) -> str:
+            context_lines = _recent_context_lines()
+            role_label = task.role_label or "Participant"
+            evidence_hints = [str(item).strip() for item in task.evidence_hints if str(item).strip()][:2]
+            reply_to_short = task.reply_to_short
+            reply_hint = _clip_text(task.reply_to_message, 180)
+            head, style_line, rules = _reasoning_prompt_static_blocks()
+            lines = [
+                head,
+                f"Role: {role_label}",
+                f"Phase: {task.phase_label or 'debate'}",
+                f"Role guidance: {task.role_guidance}",
+                f"Traits: {task.traits_summary}",
+                f"Biases: {task.bias_summary}",
+                f"Current stance hint: {task.math_opinion}",
+                style_line,
+                f"Reasoning length mode: {task.length_mode}",
+                rules,
+            ]
             if context_lines:
                 lines.append("Recent debate context:")
                 lines.extend(context_lines)
@@ -2832,14 +3604,14 @@ class SimulationEngine:
             lines.append("Return plain text only.")
             return "\n".join(lines)
 
-        def _detect_unsupported_specifics(text: str, task: Dict[str, Any]) -> Optional[str]:
+        def _detect_unsupported_specifics(text: str, task: _ReasoningTask) -> Optional[str]:
             content = str(text or "").strip()
             if not content:
                 return None
             evidence_blob = " ".join([
-                str(task.get("evidence_hint") or ""),
-                " ".join([str(x) for x in (task.get("evidence_hints") or []) if str(x).strip()]),
-                str(task.get("reply_to_message") or ""),
+                task.evidence_hint,
+                " ".join([str(x) for x in task.evidence_hints if str(x).strip()]),
+                task.reply_to_message,
                 str(research_summary or ""),
                 str(research_signals or ""),
                 str(idea_label_for_llm or ""),
@@ -2869,60 +3641,73 @@ class SimulationEngine:
                     return "unsupported_specific_claim"
             return None
 
-        def _compute_relevance_score(text: str, task: Dict[str, Any]) -> float:
-            message_tokens = set(_extract_words(text))
+        # Idea and research tokens are fixed for the run; the per-task evidence
+        # and reply tokens are cached by their text, since retries and repeated
+        # hints score against the same references.
+        relevance_base_tokens = frozenset(_extract_words(idea_label_for_llm)) | frozenset(
+            _extract_words(str(research_summary or research_signals or ""))
+        )
+        relevance_task_tokens: Dict[Tuple[str, str], Tuple[FrozenSet[str], FrozenSet[str]]] = {}
+        relevance_idea_tokens = frozenset(_extract_words(idea_label_for_llm))
+
+        def _relevance_references(task: _ReasoningTask) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+            evidence_hint = task.evidence_hint
+            reply_message = task.reply_to_message
+            key = (evidence_hint, reply_message)
+            cached = relevance_task_tokens.get(key)
+            if cached is None:
+                reply_tokens = frozenset(_extract_words(reply_message))
+                reference_tokens = relevance_base_tokens | frozenset(_extract_words(evidence_hint)) | reply_tokens
+                cached = relevance_task_tokens[key] = (reference_tokens, reply_tokens)
+            return cached
+
+        def _compute_relevance_score(message_tokens: FrozenSet[str], task: _ReasoningTask) -> float:
             if not message_tokens:
                 return 0.0
-            references: List[str] = []
-            references.extend(_extract_words(idea_label_for_llm))
-            references.extend(_extract_words(str(task.get("evidence_hint") or "")))
-            references.extend(_extract_words(str(task.get("reply_to_message") or "")))
-            references.extend(_extract_words(str(research_summary or research_signals or "")))
-            reference_tokens = set(references)
+            reference_tokens, reply_tokens = _relevance_references(task)
             if not reference_tokens:
                 return 0.5
-            overlap = len(message_tokens & reference_tokens)
-            base_score = overlap / max(1, min(len(message_tokens), len(reference_tokens)))
-            if task.get("reply_to_short") and task.get("reply_to_message"):
-                reply_tokens = set(_extract_words(str(task.get("reply_to_message") or "")))
+            # Set & already walks the smaller operand in C. Reply tokens are a
+            # subset of the references, so the reply overlap only needs to look
+            # at the shared tokens instead of the whole message again.
+            shared = message_tokens & reference_tokens
+            base_score = len(shared) / max(1, min(len(message_tokens), len(reference_tokens)))
+            if task.reply_to_short and task.reply_to_message:
                 if reply_tokens:
-                    reply_overlap = len(message_tokens & reply_tokens) / max(1, len(reply_tokens))
+                    reply_overlap = len(shared & reply_tokens) / max(1, len(reply_tokens))
                     base_score = (base_score * 0.7) + (reply_overlap * 0.3)
             return max(0.0, min(1.0, base_score))
 
-        def _validate_generated_reasoning(text: str, task: Dict[str, Any]) -> Tuple[bool, str, float]:
+        def _validate_generated_reasoning(text: str, task: _ReasoningTask) -> Tuple[bool, str, float, str]:
             content = _normalized(text)
-            relevance_score = _compute_relevance_score(text, task)
+            opener = ""
+            # Tokenized once and shared by the relevance score and anchor checks.
+            message_tokens = frozenset(_extract_words(text))
+            relevance_score = _compute_relevance_score(message_tokens, task)
             if not content:
-                return False, "empty", relevance_score
+                return False, "empty", relevance_score, opener
             if len(content) < reasoning_min_chars:
-                return False, "too_short", relevance_score
+                return False, "too_short", relevance_score, opener
             if len(content) > full_limit:
-                return False, "too_long", relevance_score
-            if any(content.startswith(sig) for sig in template_signatures):
-                return False, "template_prefix", relevance_score
-            if any(sig in content for sig in generic_signatures):
-                return False, "generic_template", relevance_score
+                return False, "too_long", relevance_score, opener
+            if _TEMPLATE_PREFIX_RE.match(content):
+                return False, "template_prefix", relevance_score, opener
+            if _GENERIC_TEMPLATE_RE.search(content):
+                return False, "generic_template", relevance_score, opener
             opener = " ".join(content.split()[:4]).strip()
             if opener and opener in used_openers:
-                return False, "reused_opener", relevance_score
-            message_tokens = set(_extract_words(text))
-            idea_tokens = set(_extract_words(idea_label_for_llm))
-            if idea_tokens and not (message_tokens & idea_tokens):
-                return False, "idea_anchor_missing", relevance_score
+                return False, "reused_opener", relevance_score, opener
+            if relevance_idea_tokens and not (message_tokens & relevance_idea_tokens):
+                return False, "idea_anchor_missing", relevance_score, opener
             if hard_unsafe_triggered:
-                safety_tokens = {
-                    "privacy", "ethical", "ethic", "legal", "compliance", "discrimination", "bias", "consent",
-                    "خصوصية", "أخلاقي", "قانون", "امتثال", "تمييز", "تحيز", "موافقة",
-                }
-                if not (message_tokens & safety_tokens):
-                    return False, "safety_anchor_missing", relevance_score
+                if not (message_tokens & _SAFETY_ANCHOR_TOKENS):
+                    return False, "safety_anchor_missing", relevance_score, opener
             unsupported_specific_reason = _detect_unsupported_specifics(text, task)
             if unsupported_specific_reason:
-                return False, unsupported_specific_reason, relevance_score
+                return False, unsupported_specific_reason, relevance_score, opener
             if relevance_score < reasoning_min_relevance:
-                return False, "low_relevance", relevance_score
-            return True, "ok", relevance_score
+                return False, "low_relevance", relevance_score, opener
+            return True, "ok", relevance_score, opener
 
         repairable_generation_reasons = {
             "idea_anchor_missing",
@@ -2951,7 +3736,7 @@ class SimulationEngine:
             cleaned = re.sub(r"\s{2,}", " ", cleaned).strip(" ,.;:،")
             return cleaned
 
-        def _auto_repair_generated_reasoning(text: str, task: Dict[str, Any], reason: str) -> str:
+        def _auto_repair_generated_reasoning(text: str, task: _ReasoningTask, reason: str) -> str:
             candidate = _clip_text(str(text or "").strip(), full_limit)
             if not candidate:
                 return ""
@@ -2978,9 +3763,8 @@ class SimulationEngine:
                     if language == "ar"
                     else "Priority here is privacy protection, legal compliance, and reducing discrimination risk."
                 )
-                safety_tokens = {"privacy", "legal", "compliance", "discrimination", "خصوصية", "قانون", "امتثال", "تمييز"}
                 message_tokens = set(_extract_words(candidate))
-                if not (message_tokens & safety_tokens):
+                if not (message_tokens & _PRIVACY_TOKENS):
                     candidate = f"{candidate} {safety_line}".strip()
                     normalized_candidate = _normalized(candidate)
 
@@ -2999,23 +3783,14 @@ class SimulationEngine:
 
             return _clip_text(re.sub(r"\s{2,}", " ", candidate).strip(), full_limit)
 
-        def _collect_signal_snippet(task: Dict[str, Any]) -> str:
+        def _collect_signal_snippet(task: _ReasoningTask) -> str:
             candidates = [
-                str(task.get("evidence_hint") or "").strip(),
-                " ".join(str(item).strip() for item in (task.get("evidence_hints") or []) if str(item).strip()),
+                task.evidence_hint.strip(),
+                " ".join(str(item).strip() for item in task.evidence_hints if str(item).strip()),
                 str(research_summary or "").strip(),
                 str(research_signals or "").strip(),
-                str(task.get("reply_to_message") or "").strip(),
+                task.reply_to_message.strip(),
             ]
-            idea_tokens = set(_extract_words(f"{idea_label_for_llm} {idea_text}"))
-            safety_tokens = {
-                "privacy", "legal", "compliance", "discrimination", "bias", "consent",
-                "خصوصية", "قانون", "امتثال", "تمييز", "تحيز", "موافقة", "مراقبة",
-            }
-            noisy_markers = {
-                "best", "top", "list", "review", "rank", "ranking", "software", "tools", "guide",
-                "الأفضل", "افضل", "قائمة", "دليل", "مراجعة",
-            }
 
             def _score(item: str) -> float:
                 if not item:
@@ -3023,15 +3798,15 @@ class SimulationEngine:
                 tokens = set(_extract_words(item))
                 if not tokens:
                     return -1.0
-                overlap = len(tokens & idea_tokens)
-                safety_overlap = len(tokens & safety_tokens)
+                overlap = len(tokens & idea_context_tokens)
+                safety_overlap = len(tokens & _SIGNAL_SAFETY_TOKENS)
                 normalized_item = _normalized(item)
                 noise_penalty = 0.0
                 if "|" in item:
                     noise_penalty += 0.35
                 if "..." in item:
                     noise_penalty += 0.25
-                if any(marker in normalized_item for marker in noisy_markers):
+                if any(marker in normalized_item for marker in _SIGNAL_NOISE_MARKERS):
                     noise_penalty += 0.2
                 if len(item) < 24:
                     noise_penalty += 0.15
@@ -3108,17 +3883,12 @@ class SimulationEngine:
                 return "Enable auditable logs and bias testing before rollout."
             return "Limit data scope and block automatic punitive enforcement."
 
-        def _build_recovery_reasoning(task: Dict[str, Any], reason: str) -> str:
-            role_label = str(task.get("role_label") or "Participant")
-            stance_hint = _normalize_stance(task.get("math_opinion")) or "neutral"
+        def _build_recovery_reasoning(task: _ReasoningTask, reason: str) -> str:
+            role_label = task.role_label or "Participant"
+            stance_hint = _normalize_stance(task.math_opinion) or "neutral"
             if hard_unsafe_triggered and stance_hint == "accept":
                 stance_hint = "neutral"
-            agent_token = str(
-                task.get("agent_id")
-                or getattr(task.get("agent"), "agent_id", "")
-                or task.get("reply_to_short")
-                or role_label
-            )
+            agent_token = task.agent.agent_id or task.reply_to_short or role_label
             variant = int(hashlib.sha256(f"{agent_token}:{role_label}:{reason}".encode("utf-8")).hexdigest()[:8], 16) % 4
             idea_anchor = _clip_text(str(idea_label_for_llm or idea_text or "").strip(), 170)
             if not idea_anchor:
@@ -3218,125 +3988,162 @@ class SimulationEngine:
             )
             return _clip_text(message_en, full_limit)
 
-        async def _generate_reasoning_text(task: Dict[str, Any]) -> Tuple[str, int, str, float]:
+        def _retry_prompt(prompt: str, attempt: int, last_reason: Optional[str]) -> str:
+            if attempt == 1:
+                return prompt
+            if last_reason is None:
+                return prompt + "\n\nRewrite with different wording. Avoid repeating previous structure."
+            return prompt + (
+                "\n\nRewrite with different wording. "
+                f"Previous rejection reason: {last_reason}. "
+                "Avoid repeating previous structure."
+            )
+
+        async def _request_reasoning(prompt: str, attempt: int, task: _ReasoningTask) -> Any:
+            # Only seeds the sampler, so a non-cryptographic 32-bit hash suffices.
+            seed_value = zlib.crc32(
+                f"{task.agent.agent_id}:{task.phase_label}:{task.reply_to_short}:{attempt}".encode("utf-8")
+            )
+            # Each request holds its own engine slot, so a speculative batch never
+            # puts more requests in flight than the engine ceiling allows.
+            async with self._llm_semaphore:
+                return await generate_ollama(
+                    prompt=prompt,
+                    temperature=min(1.15, reasoning_temp + (attempt - 1) * 0.08),
+                    seed=seed_value,
+                    options={
+                        "repeat_penalty": min(1.8, 1.15 + (attempt - 1) * 0.1),
+                        "frequency_penalty": 0.7,
+                    },
+                )
+
+        def _judge_generated_reasoning(
+            raw: Any,
+            task: _ReasoningTask,
+            attempt: int,
+        ) -> Tuple[Optional[Tuple[str, int, str, float]], str, float]:
+            """Validate (and auto-repair) one response; returns the accepted result or the rejection."""
+            text = _clip_text(_extract_text_from_llm_output(raw), full_limit)
+            ok, reason, relevance_score, opener = _validate_generated_reasoning(text, task)
+            if ok:
+                _remember_opener(opener)
+                return (text, attempt, "ok", relevance_score), reason, relevance_score
+            if autorepair_enabled and autorepair_max_passes > 0 and reason in repairable_generation_reasons:
+                repaired_text = text
+                repaired_reason = reason
+                repaired_relevance = relevance_score
+                for _ in range(autorepair_max_passes):
+                    reasoning_stats.autorepair_attempts += 1
+                    repaired_text = _auto_repair_generated_reasoning(repaired_text, task, repaired_reason)
+                    if not repaired_text:
+                        break
+                    repaired_ok, repaired_reason, repaired_relevance, repaired_opener = _validate_generated_reasoning(
+                        repaired_text, task
+                    )
+                    if repaired_ok:
+                        _remember_opener(repaired_opener)
+                        reasoning_stats.autorepair_success += 1
+                        return (repaired_text, attempt, "auto_repair", repaired_relevance), repaired_reason, repaired_relevance
+                relevance_score = repaired_relevance
+                reason = repaired_reason
+            reasoning_stats.rejections[reason] = reasoning_stats.rejections.get(reason, 0) + 1
+            return None, reason, relevance_score
+
+        async def _generate_reasoning_text(task: _ReasoningTask) -> Tuple[str, int, str, float]:
             try:
                 prompt = _build_reasoning_prompt(task)
             except Exception:
                 prompt = (
                     "You are one agent in a social simulation debate.\n"
                     f"Idea: {idea_label_for_llm}\n"
-                    f"Role: {task.get('role_label') or 'Participant'}\n"
+                    f"Role: {task.role_label or 'Participant'}\n"
                     "Write 2-4 concise, natural sentences tied to the idea.\n"
                     "Return plain text only."
                 )
             last_reason = "unknown"
             last_relevance = 0.0
-            for attempt in range(1, reasoning_max_retries + 1):
-                patched_prompt = prompt
-                if attempt > 1:
-                    patched_prompt += (
-                        "\n\nRewrite with different wording. "
-                        f"Previous rejection reason: {last_reason}. "
-                        "Avoid repeating previous structure."
+            first_sequential_attempt = 1
+            if reasoning_speculative_attempts > 1:
+                # The first attempts go out together during this run's turn, each
+                # under its own engine slot, and are then judged in attempt order,
+                # so the accepted text does not depend on which response happened
+                # to arrive first.
+                batch = range(1, reasoning_speculative_attempts + 1)
+                async with llm_semaphore:
+                    raws = await asyncio.gather(
+                        *(_request_reasoning(_retry_prompt(prompt, attempt, None), attempt, task) for attempt in batch),
+                        return_exceptions=True,
                     )
+                for attempt, raw in zip(batch, raws):
+                    if isinstance(raw, Exception):
+                        last_reason = "llm_error"
+                        continue
+                    if isinstance(raw, BaseException):
+                        raise raw
+                    accepted, last_reason, last_relevance = _judge_generated_reasoning(raw, task, attempt)
+                    if accepted is not None:
+                        return accepted
+                first_sequential_attempt = reasoning_speculative_attempts + 1
+            for attempt in range(first_sequential_attempt, reasoning_max_retries + 1):
                 try:
-                    seed_value = int(
-                        hashlib.sha256(
-                            f"{task['agent'].agent_id}:{task.get('phase_label','')}:{task.get('reply_to_short','')}:{attempt}".encode("utf-8")
-                        ).hexdigest()[:8],
-                        16,
-                    )
                     async with llm_semaphore:
-                        raw = await generate_ollama(
-                            prompt=patched_prompt,
-                            temperature=min(1.15, reasoning_temp + (attempt - 1) * 0.08),
-                            seed=seed_value,
-                            options={
-                                "repeat_penalty": min(1.8, 1.15 + (attempt - 1) * 0.1),
-                                "frequency_penalty": 0.7,
-                            },
-                        )
+                        raw = await _request_reasoning(_retry_prompt(prompt, attempt, last_reason), attempt, task)
                 except Exception:
                     last_reason = "llm_error"
                     continue
-                text = _clip_text(_extract_text_from_llm_output(raw), full_limit)
-                ok, reason, relevance_score = _validate_generated_reasoning(text, task)
-                last_relevance = relevance_score
-                if ok:
-                    opener = " ".join(_normalized(text).split()[:4]).strip()
-                    if opener:
-                        used_openers.add(opener)
-                    return text, attempt, "ok", relevance_score
-                if autorepair_enabled and autorepair_max_passes > 0 and reason in repairable_generation_reasons:
-                    repaired_text = text
-                    repaired_reason = reason
-                    repaired_relevance = relevance_score
-                    for _ in range(autorepair_max_passes):
-                        reasoning_stats["autorepair_attempts"] = int(reasoning_stats.get("autorepair_attempts", 0)) + 1
-                        repaired_text = _auto_repair_generated_reasoning(repaired_text, task, repaired_reason)
-                        if not repaired_text:
-                            break
-                        repaired_ok, repaired_reason, repaired_relevance = _validate_generated_reasoning(repaired_text, task)
-                        if repaired_ok:
-                            opener = " ".join(_normalized(repaired_text).split()[:4]).strip()
-                            if opener:
-                                used_openers.add(opener)
-                            reasoning_stats["autorepair_success"] = int(reasoning_stats.get("autorepair_success", 0)) + 1
-                            return repaired_text, attempt, "auto_repair", repaired_relevance
-                    last_relevance = repaired_relevance
-                    reason = repaired_reason
-                last_reason = reason
-                reasoning_stats["rejections"][reason] = int(reasoning_stats["rejections"].get(reason, 0)) + 1
+                accepted, last_reason, last_relevance = _judge_generated_reasoning(raw, task, attempt)
+                if accepted is not None:
+                    return accepted
             recovered_text = _build_recovery_reasoning(task, last_reason)
             if recovered_text:
-                recovered_ok, recovered_reason, recovered_relevance = _validate_generated_reasoning(recovered_text, task)
+                recovered_ok, recovered_reason, recovered_relevance, _ = _validate_generated_reasoning(recovered_text, task)
                 if recovered_ok:
                     return recovered_text, reasoning_max_retries, "rule_based_recovery", recovered_relevance
                 last_reason = recovered_reason
                 last_relevance = recovered_relevance
             return "", reasoning_max_retries, last_reason, last_relevance
 
-        def _build_single_prompt(task: Dict[str, Any]) -> str:
-            idea = idea_label_for_llm
-            insight = _clip_text(research_summary or research_signals or "", 220)
-            preflight_hint = _clip_text(preflight_summary, 220)
-            language_note = "Arabic (Egyptian slang)" if language == "ar" else "English"
+        # Everything above the task JSON is fixed for the run.
+        single_prompt_insight = _clip_text(research_summary or research_signals or "", 220)
+        single_prompt_preflight = _clip_text(preflight_summary, 220)
+        single_prompt_prefix = (
+            "You are generating human reasoning for a social simulation.\n"
+            "Return JSON ONLY: {\"agent_id\": string, \"stance\": \"accept|reject|neutral\", \"confidence\": 0-1, \"message\": string}.\n"
+            "Use language: "
+            + ("Arabic (Egyptian slang)" if language == "ar" else "English")
+            + ".\n"
+            "Length rules: short=1-2 sentences, max "
+            + str(short_limit)
+            + " chars. full=2-4 sentences, max "
+            + str(full_limit)
+            + " chars.\n"
+            "If reply_to is empty, do NOT mention any other agent.\n"
+            "Use prior_stance as a hint, but decide stance based on meaning.\n\n"
+            "IDEA: "
+            + idea_label_for_llm
+            + "\n"
+            + ("RESEARCH: " + single_prompt_insight + "\n" if single_prompt_insight else "")
+            + ("PREFLIGHT: " + single_prompt_preflight + "\n" if single_prompt_preflight else "")
+            + "TASK JSON:\n"
+        )
+
+        def _build_single_prompt(task: _ReasoningTask) -> str:
             payload = {
-                "agent_id": task["agent"].agent_id,
-                "role": task["role_label"],
-                "traits": task["traits_summary"],
-                "biases": task["bias_summary"],
-                "prior_stance": task["math_opinion"],
-                "reply_to": task.get("reply_to_short") or "",
-                "reply_hint": task.get("reply_to_message") or "",
-                "length": task["length_mode"],
-                "evidence": task.get("evidence_hint") or "",
+                "agent_id": task.agent.agent_id,
+                "role": task.role_label,
+                "traits": task.traits_summary,
+                "biases": task.bias_summary,
+                "prior_stance": task.math_opinion,
+                "reply_to": task.reply_to_short,
+                "reply_hint": task.reply_to_message,
+                "length": task.length_mode,
+                "evidence": task.evidence_hint,
             }
-            return (
-                "You are generating human reasoning for a social simulation.\n"
-                "Return JSON ONLY: {\"agent_id\": string, \"stance\": \"accept|reject|neutral\", \"confidence\": 0-1, \"message\": string}.\n"
-                "Use language: "
-                + language_note
-                + ".\n"
-                "Length rules: short=1-2 sentences, max "
-                + str(short_limit)
-                + " chars. full=2-4 sentences, max "
-                + str(full_limit)
-                + " chars.\n"
-                "If reply_to is empty, do NOT mention any other agent.\n"
-                "Use prior_stance as a hint, but decide stance based on meaning.\n\n"
-                "IDEA: "
-                + idea
-                + "\n"
-                + ("RESEARCH: " + insight + "\n" if insight else "")
-                + ("PREFLIGHT: " + preflight_hint + "\n" if preflight_hint else "")
-                + "TASK JSON:\n"
-                + json.dumps(payload, ensure_ascii=False)
-            )
+            return single_prompt_prefix + _PROMPT_JSON_ENCODER.encode(payload)
 
         def _normalize_stance(value: Any) -> str | None:
             stance = str(value or "").strip().lower()
-            if stance in {"accept", "reject", "neutral"}:
+            if stance in _CANONICAL_STANCES:
                 return stance
             return None
 
@@ -3349,10 +4156,17 @@ class SimulationEngine:
             Resolve stance without random forcing.
             Priority: LLM/classifier stance -> computed preferred -> previous state -> neutral.
             """
-            stance_norm = _normalize_stance(stance_value)
-            preferred_norm = _normalize_stance(preferred_value)
-            previous_norm = _normalize_stance(previous_value)
-            resolved = stance_norm or preferred_norm or previous_norm or "neutral"
+            # Callers almost always pass a canonical stance first, so take it
+            # as-is and only normalize the fallbacks when it is unusable.
+            if stance_value in _CANONICAL_STANCES:
+                resolved = stance_value
+            else:
+                resolved = (
+                    _normalize_stance(stance_value)
+                    or _normalize_stance(preferred_value)
+                    or _normalize_stance(previous_value)
+                    or "neutral"
+                )
             if not disable_random_stance_force:
                 # Backward-compatible branch for emergency rollback only.
                 return resolved
@@ -3362,17 +4176,9 @@ class SimulationEngine:
             raw_text = str(raw_value or "").strip()
             if not raw_text:
                 raise RuntimeError("Empty LLM response")
-            candidates = [raw_text]
-            fenced = re.search(r"```(?:json)?\s*(\{.*?\}|\[.*?\])\s*```", raw_text, re.DOTALL)
-            if fenced:
-                candidates.append(fenced.group(1).strip())
-            for pattern in (r"(\{.*\})", r"(\[.*\])"):
-                match = re.search(pattern, raw_text, re.DOTALL)
-                if match:
-                    candidates.append(match.group(1).strip())
-            for candidate in candidates:
+            for candidate in _candidate_json_fragments(raw_text):
                 try:
-                    parsed = json.loads(candidate)
+                    parsed = _loads_json(candidate)
                 except Exception:
                     continue
                 if isinstance(parsed, dict):
@@ -3381,9 +4187,9 @@ class SimulationEngine:
                     return parsed[0]
             raise RuntimeError("Unable to parse LLM JSON response")
 
-        async def _run_single(task: Dict[str, Any]) -> Dict[str, Any]:
+        async def _run_single(task: _ReasoningTask) -> Dict[str, Any]:
             prompt = _build_single_prompt(task)
-            async with llm_semaphore:
+            async with llm_semaphore, self._llm_semaphore:
                 raw = await generate_ollama(
                     prompt=prompt,
                     temperature=reasoning_temp,
@@ -3408,18 +4214,11 @@ class SimulationEngine:
             role_label: str,
             stance: str,
             evidence_hint: str,
-            task: Optional[Dict[str, Any]] = None,
+            task: _ReasoningTask,
         ) -> str:
-            task_payload = dict(task or {})
-            task_payload.setdefault("role_label", role_label)
-            task_payload.setdefault("math_opinion", stance)
-            task_payload.setdefault("evidence_hint", evidence_hint)
-            if evidence_hint and not task_payload.get("evidence_hints"):
-                task_payload["evidence_hints"] = [evidence_hint]
-            recovered = _build_recovery_reasoning(
-                task_payload,
-                "fallback",
-            )
+            if evidence_hint and not task.evidence_hints:
+                task = replace(task, evidence_hints=(evidence_hint,))
+            recovered = _build_recovery_reasoning(task, "fallback")
             if recovered:
                 return recovered
             if language == "ar":
@@ -3439,7 +4238,7 @@ class SimulationEngine:
             role_label: str,
             stance: str,
             evidence_hint: str,
-            task: Optional[Dict[str, Any]] = None,
+            task: _ReasoningTask,
         ) -> Tuple[str, Optional[str]]:
             text = str(raw_text or "").strip()
             if not text:
@@ -3457,7 +4256,7 @@ class SimulationEngine:
         def _evaluate_reasoning_quality(
             *,
             persona: Agent,
-            task: Dict[str, Any],
+            task: _ReasoningTask,
             previous_stance: str,
             new_stance: str,
             message: str,
@@ -3475,13 +4274,13 @@ class SimulationEngine:
                     "relevance_score": current_relevance if isinstance(current_relevance, (int, float)) else None,
                 }
 
+            words = _extract_words(text)
             relevance_score = (
                 float(current_relevance)
                 if isinstance(current_relevance, (int, float))
-                else _compute_relevance_score(text, task)
+                else _compute_relevance_score(frozenset(words), task)
             )
             normalized = _normalized(text)
-            words = _extract_words(text)
             unique_ratio = (len(set(words)) / max(1, len(words))) if words else 0.0
             generic_markers = {
                 "more data",
@@ -3512,10 +4311,10 @@ class SimulationEngine:
             persona_terms = _extract_words(
                 " ".join(
                     [
-                        str(task.get("role_label") or ""),
-                        str(task.get("traits_summary") or ""),
-                        str(task.get("bias_summary") or ""),
-                        str(task.get("role_guidance") or ""),
+                        task.role_label,
+                        task.traits_summary,
+                        task.bias_summary,
+                        task.role_guidance,
                         str(persona.archetype_name or ""),
                         " ".join(str(item) for item in (persona.biases or [])[:2]),
                     ]
@@ -3532,7 +4331,7 @@ class SimulationEngine:
             proxy_ratio = float(evidence_summary.get("proxy_ratio") or 0.0)
             evidence_score = float(
                 evidence_summary.get("score")
-                or task.get("evidence_confidence")
+                or task.evidence_confidence
                 or 0.5
             )
             certainty_markers = {
@@ -3577,38 +4376,36 @@ class SimulationEngine:
         async def _infer_stance_from_llm(text: str) -> str | None:
             if stance_classifier is None:
                 return None
-            return await stance_classifier.classify_opinion(
-                text=text,
-                idea_label=idea_label_for_llm,
-                language=language,
-            )
+            async with self._llm_semaphore:
+                return await stance_classifier.classify_opinion(
+                    text=text,
+                    idea_label=idea_label_for_llm,
+                    language=language,
+                )
 
         async def _infer_stance_with_confidence(text: str) -> Tuple[str | None, float | None]:
             if stance_classifier is None:
                 return None, None
-            if hasattr(stance_classifier, "classify_opinion_with_confidence"):
-                stance, conf = await stance_classifier.classify_opinion_with_confidence(
+            async with self._llm_semaphore:
+                if hasattr(stance_classifier, "classify_opinion_with_confidence"):
+                    stance, conf = await stance_classifier.classify_opinion_with_confidence(
+                        text=text,
+                        idea_label=idea_label_for_llm,
+                        language=language,
+                    )
+                    return stance, conf
+                stance = await stance_classifier.classify_opinion(
                     text=text,
                     idea_label=idea_label_for_llm,
                     language=language,
                 )
-                return stance, conf
-            stance = await stance_classifier.classify_opinion(
-                text=text,
-                idea_label=idea_label_for_llm,
-                language=language,
-            )
             return stance, None
 
         def _apply_policy_guard(stance_value: str | None) -> Tuple[str, bool, Optional[str], bool]:
             stance_norm = _normalize_stance(stance_value) or "neutral"
             if not (safety_guard_enabled and hard_unsafe_triggered):
                 return stance_norm, False, None, False
-            if stance_norm == "accept":
-                return "reject", True, hard_policy_reason or "unsafe_policy", True
-            if stance_norm not in {"reject", "neutral"}:
-                return "neutral", True, hard_policy_reason or "unsafe_policy", True
-            return stance_norm, True, hard_policy_reason or "unsafe_policy", False
+            return policy_guard_outcomes[stance_norm]
 
         async def _enforce_neutral_cap_before_complete(phase_label_hint: str) -> None:
             nonlocal pending_clarification_state
@@ -3663,6 +4460,18 @@ class SimulationEngine:
 
         total_iterations = len(phase_order)
         effective_total_iterations = total_iterations
+        # (label, key, runs dialogue, start progress %) for each phase, in order.
+        phase_table: List[Tuple[str, str, bool, float]] = []
+        for phase_index, label in enumerate(phase_order):
+            key = phase_key_map.get(label, f"phase_{phase_index + 1}")
+            phase_table.append(
+                (
+                    label,
+                    key,
+                    key in {"intake", "deliberation", "convergence", "verdict"},
+                    (phase_index / max(1, total_iterations)) * 100.0,
+                )
+            )
         checkpoint_event_seq = int(checkpoint_meta.get("event_seq") or 0)
 
         def _next_event_seq() -> int:
@@ -3702,44 +4511,68 @@ class SimulationEngine:
                 },
             )
 
+        idea_profile = await idea_profile_task
+        idea_risk = float(idea_profile["risk"])
+        regulatory_seed = ""
+        if isinstance(research_structured, dict):
+            regulatory_seed = str(research_structured.get("regulatory_risk") or "").lower()
+        if regulatory_seed in {"high", "strict"}:
+            initial_risk_bias = min(0.6, idea_risk + 0.2)
+        elif regulatory_seed in {"medium", "moderate"}:
+            initial_risk_bias = min(0.6, idea_risk + 0.1)
+        else:
+            initial_risk_bias = idea_risk
+        hard_unsafe_triggered, hard_policy_reason, hard_policy_risk_score = idea_profile["hard_unsafe"]
+        # Guarded stance outcomes: (stance, policy_guard, policy_reason, stance_locked).
+        policy_guard_reason = hard_policy_reason or "unsafe_policy"
+        policy_guard_outcomes: Dict[str, Tuple[str, bool, Optional[str], bool]] = {
+            "accept": ("reject", True, policy_guard_reason, True),
+            "reject": ("reject", True, policy_guard_reason, False),
+            "neutral": ("neutral", True, policy_guard_reason, False),
+        }
+        constraints_summary = str(idea_profile["constraints_summary"])
+
         agent_index: Dict[str, Agent] = {agent.agent_id: agent for agent in agents}
 
-        def _hydrate_task(raw_task: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        def _hydrate_task(raw_task: Dict[str, Any]) -> Optional[_ReasoningTask]:
             if not isinstance(raw_task, dict):
                 return None
-            agent_id = str(raw_task.get("agent_id") or "").strip()
+            agent_id = _str_field(raw_task, "agent_id").strip()
             agent = agent_index.get(agent_id)
             if agent is None:
                 return None
-            role_label = str(raw_task.get("role_label") or (agent.archetype_name or agent.category_id))
-            phase_label = str(raw_task.get("phase_label") or "")
-            role_guidance = str(raw_task.get("role_guidance") or "")
-            prev_opinion = str(raw_task.get("prev_opinion") or agent.current_opinion)
+            role_label = _str_field(raw_task, "role_label", agent.archetype_name or agent.category_id)
+            prev_opinion = _str_field(raw_task, "prev_opinion", agent.current_opinion)
             if prev_opinion not in Agent.VALID_OPINIONS:
                 prev_opinion = "neutral"
-            math_opinion = str(raw_task.get("math_opinion") or agent.current_opinion)
+            math_opinion = _str_field(raw_task, "math_opinion", agent.current_opinion)
             if math_opinion not in Agent.VALID_OPINIONS:
                 math_opinion = prev_opinion
-            return {
-                "agent": agent,
-                "prev_opinion": prev_opinion,
-                "math_opinion": math_opinion,
-                "changed": bool(raw_task.get("changed")),
-                "role_label": role_label,
-                "phase_label": phase_label,
-                "role_guidance": role_guidance,
-                "traits_summary": str(raw_task.get("traits_summary") or _compact_traits(agent.traits)),
-                "bias_summary": str(raw_task.get("bias_summary") or (", ".join(agent.biases[:2]) if agent.biases else "none")),
-                "reply_to_id": str(raw_task.get("reply_to_id") or ""),
-                "reply_to_short": str(raw_task.get("reply_to_short") or ""),
-                "reply_to_message": str(raw_task.get("reply_to_message") or ""),
-                "length_mode": "full" if str(raw_task.get("length_mode") or "") == "full" else "short",
-                "emit_message": bool(raw_task.get("emit_message", True)),
-                "evidence_hint": str(raw_task.get("evidence_hint") or ""),
-                "evidence_hints": raw_task.get("evidence_hints") or [],
-                "evidence_confidence": float(raw_task.get("evidence_confidence") or 0.0) if raw_task.get("evidence_confidence") is not None else None,
-            }
+            evidence_hints = raw_task.get("evidence_hints")
+            evidence_confidence = raw_task.get("evidence_confidence")
+            return _ReasoningTask(
+                agent=agent,
+                prev_opinion=prev_opinion,
+                math_opinion=math_opinion,
+                changed=bool(raw_task.get("changed")),
+                role_label=role_label,
+                phase_label=_str_field(raw_task, "phase_label"),
+                role_guidance=_str_field(raw_task, "role_guidance"),
+                traits_summary=_str_field(raw_task, "traits_summary", agent_trait_summaries[agent.agent_id]),
+                bias_summary=_str_field(raw_task, "bias_summary", agent_bias_summaries[agent.agent_id]),
+                reply_to_id=_str_field(raw_task, "reply_to_id"),
+                reply_to_short=_str_field(raw_task, "reply_to_short"),
+                reply_to_message=_str_field(raw_task, "reply_to_message"),
+                length_mode="full" if raw_task.get("length_mode") == "full" else "short",
+                emit_message=bool(raw_task.get("emit_message", True)),
+                evidence_hint=_str_field(raw_task, "evidence_hint"),
+                evidence_hints=tuple(evidence_hints) if isinstance(evidence_hints, list) else (),
+                evidence_confidence=float(evidence_confidence or 0.0) if evidence_confidence is not None else None,
+            )
 
+        # Checkpoints stay plain JSON-ready data: the emitter persists them and a
+        # resume may happen in another worker or after a restart, so process
+        # snapshots (fork/copy-on-write) cannot stand in for them.
         async def _emit_checkpoint(
             *,
             status_value: str,
@@ -3748,7 +4581,7 @@ class SimulationEngine:
             phase_label: Optional[str] = None,
             phase_key: Optional[str] = None,
             phase_progress_pct: Optional[float] = None,
-            tasks: Optional[List[Dict[str, Any]]] = None,
+            tasks: Optional[List[_ReasoningTask]] = None,
             next_task_index: int = 0,
             last_error: Optional[str] = None,
             status_reason: Optional[str] = None,
@@ -3756,26 +4589,20 @@ class SimulationEngine:
         ) -> None:
             if checkpoint_emitter is None:
                 return
-            serialized_tasks = [self._serialize_task(task) for task in (tasks or [])]
+            serialized_tasks = [task.to_dict() for task in (tasks or [])]
             payload = {
                 "version": 1,
                 "seed_value": seed_value,
                 "rng_state": self._serialize_random_state(random.getstate()),
                 "agents": [self._serialize_agent_runtime(agent) for agent in agents],
                 "metrics_counts": dict(metrics_counts),
-                "metrics_breakdown": {
-                    str(key): {
-                        "accept": int(values.get("accept") or 0),
-                        "reject": int(values.get("reject") or 0),
-                        "neutral": int(values.get("neutral") or 0),
-                    }
-                    for key, values in metrics_breakdown.items()
-                    if isinstance(values, dict)
-                },
+                # Every write path keeps three int counters per category, so a
+                # shallow copy of each row is already the canonical form.
+                "metrics_breakdown": {str(key): dict(values) for key, values in metrics_breakdown.items()},
                 "recent_messages": list(recent_messages),
                 "dialogue_history": list(dialogue_history),
-                "used_openers": sorted(used_openers),
-                "reasoning_telemetry": dict(reasoning_stats),
+                "used_openers": list(used_openers),
+                "reasoning_telemetry": reasoning_stats.to_dict(),
                 "meta": {
                     "status": status_value,
                     "status_reason": status_reason or status_value,
@@ -3827,6 +4654,11 @@ class SimulationEngine:
             resume_current_iteration = resume_next_iteration
         if resume_current_iteration > total_iterations:
             resume_current_iteration = 0
+        # (iteration, next task index) to re-enter a phase the checkpoint caught
+        # mid-way; the run starts at that iteration, so only its first pass uses it.
+        resume_cursor: Optional[Tuple[int, int]] = None
+        if resume_current_iteration > 0 and resume_tasks_payload:
+            resume_cursor = (resume_current_iteration, resume_task_index)
 
         start_iteration = resume_current_iteration if resume_current_iteration > 0 else resume_next_iteration
         if start_iteration > total_iterations:
@@ -3858,10 +4690,40 @@ class SimulationEngine:
             last_step_uid=last_reasoning_step_uid,
         )
 
+        # One clarification window serves every phase; it is reset per phase.
+        phase_clarification_window: Optional[_ClarificationWindow] = None
         for iteration in range(start_iteration, total_iterations + 1):
-            phase_label = phase_order[iteration - 1]
-            phase_key = phase_key_map.get(phase_label, f"phase_{iteration}")
-            phase_start_progress = ((iteration - 1) / max(1, total_iterations)) * 100.0
+            phase_label, phase_key, reasoning_phase, phase_start_progress = phase_table[iteration - 1]
+            if not reasoning_phase:
+                # Non-dialogue phases do no work, so one boundary checkpoint and a
+                # single completed update are all a resume or the UI needs.
+                await asyncio.gather(
+                    _emit_checkpoint(
+                        status_value="running",
+                        next_iteration=iteration + 1,
+                        current_iteration=0,
+                        phase_label=None,
+                        phase_key=phase_key,
+                        phase_progress_pct=(iteration / max(1, total_iterations)) * 100.0,
+                        tasks=[],
+                        next_task_index=0,
+                        status_reason="running",
+                        last_step_uid=last_reasoning_step_uid,
+                    ),
+                    _emit_event(
+                        "phase_update",
+                        {
+                            "phase_key": phase_key,
+                            "phase_label": phase_label,
+                            "progress_pct": (iteration / max(1, total_iterations)) * 100.0,
+                            "status": "completed",
+                        },
+                    ),
+                )
+                if step_pause > 0:
+                    await asyncio.sleep(step_pause)
+                continue
+
             await _emit_event(
                 "phase_update",
                 {
@@ -3871,73 +4733,18 @@ class SimulationEngine:
                     "status": "running",
                 },
             )
-            opinion_changes: Dict[str, Tuple[str, str, bool]] = {}
-            tasks: List[Dict[str, Any]] = []
+            tasks: List[_ReasoningTask] = []
             next_task_index = 0
-            using_resume_tasks = (
-                iteration == resume_current_iteration
-                and bool(resume_tasks_payload)
-            )
-
-            reasoning_phase = phase_key in {"intake", "deliberation", "convergence", "verdict"}
-
-            if not reasoning_phase:
-                # Non-dialogue phases: emit entry + completion checkpoints and move on.
-                await _emit_checkpoint(
-                    status_value="running",
-                    next_iteration=iteration,
-                    current_iteration=iteration,
-                    phase_label=phase_label,
-                    phase_key=phase_key,
-                    phase_progress_pct=phase_start_progress,
-                    tasks=[],
-                    next_task_index=0,
-                    status_reason="running",
-                    last_step_uid=last_reasoning_step_uid,
-                )
-                await _emit_event(
-                    "phase_update",
-                    {
-                        "phase_key": phase_key,
-                        "phase_label": phase_label,
-                        "progress_pct": phase_start_progress,
-                        "status": "running",
-                    },
-                )
-                await _emit_checkpoint(
-                    status_value="running",
-                    next_iteration=iteration + 1,
-                    current_iteration=0,
-                    phase_label=None,
-                    phase_key=phase_key,
-                    phase_progress_pct=(iteration / max(1, total_iterations)) * 100.0,
-                    tasks=[],
-                    next_task_index=0,
-                    status_reason="running",
-                    last_step_uid=last_reasoning_step_uid,
-                )
-                await _emit_event(
-                    "phase_update",
-                    {
-                        "phase_key": phase_key,
-                        "phase_label": phase_label,
-                        "progress_pct": (iteration / max(1, total_iterations)) * 100.0,
-                        "status": "completed",
-                    },
-                )
-                if step_delay > 0:
-                    await asyncio.sleep(step_delay / speed)
-                continue
+            using_resume_tasks = resume_cursor is not None and resume_cursor[0] == iteration
 
             if using_resume_tasks:
-                for raw_task in resume_tasks_payload:
-                    hydrated = _hydrate_task(raw_task)
-                    if hydrated is not None:
-                        tasks.append(hydrated)
-                next_task_index = min(max(0, resume_task_index), len(tasks))
+                tasks = [task for task in map(_hydrate_task, resume_tasks_payload) if task is not None]
+                next_task_index = min(resume_cursor[1], len(tasks))
             else:
                 phase_intensity = 0.85 + (0.1 * iteration)
                 influences = compute_pairwise_influences(agents, self.dataset)
+                # One (prev, math, changed) row per agent, in population order.
+                opinion_decisions: List[Tuple[str, str, bool]] = []
                 for agent in agents:
                     influence_weights = influences[agent.agent_id]
                     _apply_research_grounding(agent, influence_weights)
@@ -3956,61 +4763,44 @@ class SimulationEngine:
                             evidence_summary=overall_evidence_summary,
                         )
                     # Keep state transitions tied to emitted reasoning messages.
-                    opinion_changes[agent.agent_id] = (prev_opinion, new_opinion, changed)
+                    opinion_decisions.append((prev_opinion, new_opinion, changed))
 
-                if num_agents <= 40 or reasoning_scope == "full":
-                    speakers = list(agents)
-                    random.shuffle(speakers)
-                else:
+                # Tasks are built in population order, so only membership matters:
+                # everyone speaks in small or full-scope runs, otherwise a sample.
+                speaker_positions: Optional[set[int]] = None
+                if num_agents > 40 and reasoning_scope != "full":
                     base_speakers = int(math.ceil(0.12 * max(1, num_agents)))
                     dynamic_speakers = min(80, max(24, base_speakers))
                     if phase_label in {"Discussion", "Neutrality Reduction", "Final Convergence"}:
                         dynamic_speakers = min(num_agents, max(dynamic_speakers, 36))
-                    speakers = _select_speakers(min(num_agents, dynamic_speakers))
-                speaker_ids = {agent.agent_id for agent in speakers}
-
-                for agent in agents:
-                    prev_opinion, math_opinion, changed = opinion_changes[agent.agent_id]
-                    role_key, role_label, role_guidance = agent_roles[agent.agent_id]
-                    is_speaker = agent.agent_id in speaker_ids
-                    if reasoning_scope == "full":
-                        length_mode = "full"
-                    elif reasoning_scope == "hybrid" and is_speaker:
-                        length_mode = "full"
-                    else:
-                        length_mode = reasoning_detail
-                    if reasoning_scope == "full":
-                        emit_message = True
-                    else:
-                        emit_message = bool(is_speaker)
-                    evidence_pool = evidence_by_role.get(role_key) or evidence_cards
-                    evidence_hint = _clip_text(str(evidence_pool[0]), 120) if evidence_pool else ""
-                    evidence_hints = [_clip_text(str(item), 120) for item in (evidence_pool[:2] if evidence_pool else [])]
-                    task_evidence_summary = _evidence_summary_for_cards(evidence_hints or ([evidence_hint] if evidence_hint else []))
-                    task_evidence_confidence = float(task_evidence_summary.get("score") or overall_evidence_summary.get("score") or 0.5)
+                    speaker_positions = _select_speakers(min(num_agents, dynamic_speakers))
+
+                for position, agent in enumerate(agents):
+                    prev_opinion, math_opinion, changed = opinion_decisions[position]
+                    role_key, role_label, role_guidance = agent_roles[position]
+                    is_speaker = speaker_positions is None or position in speaker_positions
+                    length_mode, emit_message = speaker_modes[is_speaker]
+                    evidence_hint, evidence_hints, task_evidence_confidence = _role_evidence_hints(role_key)
                     tasks.append(
-                        {
-                            "agent": agent,
-                            "prev_opinion": prev_opinion,
-                            "math_opinion": math_opinion,
-                            "changed": changed,
-                            "role_label": role_label,
-                            "phase_label": phase_label,
-                            "role_guidance": role_guidance,
-                            "traits_summary": _compact_traits(agent.traits),
-                            "bias_summary": ", ".join(agent.biases[:2]) if agent.biases else "none",
-                            "reply_to_id": "",
-                            "reply_to_short": "",
-                            "reply_to_message": "",
-                            "length_mode": length_mode,
-                            "emit_message": emit_message,
-                            "evidence_hint": evidence_hint,
-                            "evidence_hints": evidence_hints,
-                            "evidence_confidence": task_evidence_confidence,
-                        }
+                        _ReasoningTask(
+                            agent=agent,
+                            prev_opinion=prev_opinion,
+                            math_opinion=math_opinion,
+                            changed=changed,
+                            role_label=role_label,
+                            phase_label=phase_label,
+                            role_guidance=role_guidance,
+                            traits_summary=agent_trait_summaries[agent.agent_id],
+                            bias_summary=agent_bias_summaries[agent.agent_id],
+                            length_mode=length_mode,
+                            emit_message=emit_message,
+                            evidence_hint=evidence_hint,
+                            evidence_hints=evidence_hints,
+                            evidence_confidence=task_evidence_confidence,
+                        )
                     )
 
-            active_speakers = max(1, sum(1 for item in tasks if bool(item.get("emit_message"))))
+            active_speakers = max(1, sum(1 for item in tasks if item.emit_message))
             clarification_window_cap = min(80, active_speakers)
             clarification_window_size = max(
                 1,
@@ -4023,7 +4813,10 @@ class SimulationEngine:
                 max(4, int(math.ceil(0.08 * active_speakers))),
                 max(4, active_speakers),
             )
-            phase_clarification_window: deque[Dict[str, Any]] = deque(maxlen=clarification_window_size)
+            if phase_clarification_window is None:
+                phase_clarification_window = _ClarificationWindow(clarification_window_size)
+            else:
+                phase_clarification_window.reset(clarification_window_size)
             phase_reasoning_messages = 0
 
             await _emit_checkpoint(
@@ -4041,29 +4834,29 @@ class SimulationEngine:
 
             tasks_to_process = tasks[next_task_index:]
             processed_index = next_task_index
+            last_checkpoint_index = next_task_index
+            last_metrics_emit_at = float("-inf")
+            deferred_pause = 0.0
 
             for task in tasks_to_process:
-                agent = task["agent"]
-                prev_opinion = task["prev_opinion"]
-                role_label = task["role_label"]
-                length_mode = task["length_mode"]
-                emit_message = task["emit_message"]
-                step_uid = f"{iteration}:{processed_index}:{agent.agent_id}"
+                agent = task.agent
+                prev_opinion = task.prev_opinion
+                role_label = task.role_label
+                length_mode = task.length_mode
+                emit_message = task.emit_message
                 reply_to_id = ""
                 reply_to_short = ""
                 reply_to_msg = ""
                 if length_mode == "full":
                     reply_to_id, reply_to_short, reply_to_msg = _pick_reply_target(agent)
-                task["reply_to_id"] = reply_to_id
-                task["reply_to_short"] = reply_to_short
-                task["reply_to_message"] = reply_to_msg
+                task.set_reply_target(reply_to_id, reply_to_short, reply_to_msg)
                 message = ""
                 confidence = 0.58
-                evidence_confidence = float(task.get("evidence_confidence") or overall_evidence_summary.get("score") or 0.5)
+                evidence_confidence = float(task.evidence_confidence or overall_evidence_summary.get("score") or 0.5)
                 task_evidence_summary = _evidence_summary_for_cards(
-                    list(task.get("evidence_hints") or []) or ([str(task.get("evidence_hint") or "").strip()] if str(task.get("evidence_hint") or "").strip() else [])
+                    list(task.evidence_hints) or ([task.evidence_hint.strip()] if task.evidence_hint.strip() else [])
                 )
-                stance = task["math_opinion"]
+                stance = task.math_opinion
                 opinion_source = "llm"
                 fallback_reason: Optional[str] = None
                 relevance_score: Optional[float] = None
@@ -4079,11 +4872,11 @@ class SimulationEngine:
                 reasoning_quality_flags: List[str] = []
 
                 if emit_message:
-                    reasoning_stats["total_steps"] = int(reasoning_stats.get("total_steps", 0)) + 1
+                    reasoning_stats.total_steps += 1
                     if reasoning_engine_v2:
                         message, attempts_used, generation_reason, generated_relevance = await _generate_reasoning_text(task)
                         relevance_score = generated_relevance if generated_relevance > 0 else None
-                        reasoning_stats["regeneration_attempts"] = int(reasoning_stats.get("regeneration_attempts", 0)) + max(0, attempts_used - 1)
+                        reasoning_stats.regeneration_attempts += max(0, attempts_used - 1)
                         if message:
                             classified_stance, classified_conf = await _infer_stance_with_confidence(message)
                             if classified_stance:
@@ -4091,27 +4884,27 @@ class SimulationEngine:
                                 confidence = float(classified_conf) if isinstance(classified_conf, (int, float)) else 0.68
                                 confidence = max(0.0, min(1.0, confidence))
                                 opinion_source = "llm_classified"
-                                reasoning_stats["classified_steps"] = int(reasoning_stats.get("classified_steps", 0)) + 1
+                                reasoning_stats.classified_steps += 1
                             else:
-                                stance = task["math_opinion"]
+                                stance = task.math_opinion
                                 confidence = 0.58
                                 opinion_source = "llm"
                             stance = _resolve_stance_semantic(
                                 stance_value=stance,
-                                preferred_value=task["math_opinion"],
+                                preferred_value=task.math_opinion,
                                 previous_value=prev_opinion,
                             )
                         else:
                             fallback_reason = generation_reason or "generation_failed"
                             stance = _resolve_stance_semantic(
-                                stance_value=task["math_opinion"],
-                                preferred_value=task["math_opinion"],
+                                stance_value=task.math_opinion,
+                                preferred_value=task.math_opinion,
                                 previous_value=prev_opinion,
                             )
-                            message = _fallback_message(role_label, stance, task.get("evidence_hint") or "", task=task)
+                            message = _fallback_message(role_label, stance, task.evidence_hint, task=task)
                             opinion_source = "fallback"
                             confidence = 0.32
-                            reasoning_stats["fallback_steps"] = int(reasoning_stats.get("fallback_steps", 0)) + 1
+                            reasoning_stats.fallback_steps += 1
                     else:
                         try:
                             result = await _run_single(task)
@@ -4121,7 +4914,7 @@ class SimulationEngine:
                         stance = _normalize_stance(result.get("stance"))
                         message = str(result.get("message") or "").strip()
                         if message:
-                            relevance_score = _compute_relevance_score(message, task)
+                            relevance_score = _compute_relevance_score(frozenset(_extract_words(message)), task)
                         try:
                             confidence = float(result.get("confidence") or 0.0)
                         except Exception:
@@ -4131,27 +4924,27 @@ class SimulationEngine:
 
                         if not stance and message:
                             inferred = await _infer_stance_from_llm(message)
-                            stance = inferred or task["math_opinion"]
+                            stance = inferred or task.math_opinion
                             if inferred:
                                 opinion_source = "llm_classified"
-                                reasoning_stats["classified_steps"] = int(reasoning_stats.get("classified_steps", 0)) + 1
+                                reasoning_stats.classified_steps += 1
                         if not stance:
-                            stance = task["math_opinion"]
+                            stance = task.math_opinion
                         stance = _resolve_stance_semantic(
                             stance_value=stance,
-                            preferred_value=task["math_opinion"],
+                            preferred_value=task.math_opinion,
                             previous_value=prev_opinion,
                         )
                         if not message:
-                            message = _fallback_message(role_label, stance, task.get("evidence_hint") or "", task=task)
+                            message = _fallback_message(role_label, stance, task.evidence_hint, task=task)
                             opinion_source = "fallback"
                             fallback_reason = "empty_or_invalid_output"
-                            reasoning_stats["fallback_steps"] = int(reasoning_stats.get("fallback_steps", 0)) + 1
+                            reasoning_stats.fallback_steps += 1
                 else:
                     # Keep non-speaker agents stable to avoid hidden, unexplained stance jumps.
                     stance = _resolve_stance_semantic(
                         stance_value=prev_opinion,
-                        preferred_value=task["math_opinion"],
+                        preferred_value=task.math_opinion,
                         previous_value=prev_opinion,
                     )
                     confidence = max(0.25, min(1.0, float(agent.confidence)))
@@ -4181,12 +4974,12 @@ class SimulationEngine:
                         raw_text=message,
                         role_label=role_label,
                         stance=stance,
-                        evidence_hint=task.get("evidence_hint") or "",
+                        evidence_hint=task.evidence_hint,
                         task=task,
                     )
                     if sanitized_state == "fallback":
                         if opinion_source != "fallback":
-                            reasoning_stats["fallback_steps"] = int(reasoning_stats.get("fallback_steps", 0)) + 1
+                            reasoning_stats.fallback_steps += 1
                         opinion_source = "fallback"
                         fallback_reason = fallback_reason or "encoding_mojibake"
                         confidence = min(confidence, 0.35)
@@ -4196,15 +4989,16 @@ class SimulationEngine:
                     reason_tag = _extract_reason_tag(message, stance)
 
                 # Optional sampling validator (no rejection by default)
-                if emit_message and validator_sample_rate > 0 and stance_classifier is not None:
+                if emit_message and validator_sampling:
                     if random.random() < validator_sample_rate:
                         try:
-                            res = await stance_classifier.validate(message, role_label, list(recent_messages))
+                            async with self._llm_semaphore:
+                                res = await stance_classifier.validate(message, role_label, list(recent_messages))
                             if not res.ok:
                                 opinion_source = "fallback"
-                                message = _fallback_message(role_label, stance, task.get("evidence_hint") or "", task=task)
+                                message = _fallback_message(role_label, stance, task.evidence_hint, task=task)
                                 fallback_reason = "validator_fail"
-                                reasoning_stats["fallback_steps"] = int(reasoning_stats.get("fallback_steps", 0)) + 1
+                                reasoning_stats.fallback_steps += 1
                         except Exception:
                             pass
 
@@ -4235,13 +5029,10 @@ class SimulationEngine:
                         ),
                     )
                     if low_quality_reasoning:
-                        reasoning_stats["low_quality_steps"] = int(reasoning_stats.get("low_quality_steps", 0)) + 1
-                        quality_flags_counter = reasoning_stats.get("quality_flags")
-                        if not isinstance(quality_flags_counter, dict):
-                            quality_flags_counter = {}
-                            reasoning_stats["quality_flags"] = quality_flags_counter
+                        reasoning_stats.low_quality_steps += 1
+                        quality_flags_counter = reasoning_stats.quality_flags
                         for flag in reasoning_quality_flags:
-                            quality_flags_counter[flag] = int(quality_flags_counter.get(flag, 0)) + 1
+                            quality_flags_counter[flag] = quality_flags_counter.get(flag, 0) + 1
 
                 agent.current_opinion = stance
                 changed = prev_opinion != stance
@@ -4253,8 +5044,7 @@ class SimulationEngine:
                     else:
                         agent.confidence = min(1.0, agent.confidence + 0.03)
 
-                opinion_changes[agent.agent_id] = (prev_opinion, stance, changed)
-                _apply_metrics_change(agent.category_id, prev_opinion, stance)
+                _apply_metrics_change(agent, prev_opinion, stance)
 
                 if message:
                     _push_recent(message)
@@ -4270,14 +5060,19 @@ class SimulationEngine:
                             "message": message,
                         }
                     )
-                    gate = _evaluate_clarification_gate(
-                        phase_label=phase_label,
-                        window=phase_clarification_window,
-                        phase_messages=phase_reasoning_messages,
-                        window_size=clarification_window_size,
-                        cooldown_steps=clarification_cooldown_steps,
-                        step_index=clarification_total_steps,
-                    )
+                    gate = None
+                    if (
+                        phase_reasoning_messages >= clarification_window_size
+                        and len(phase_clarification_window) >= clarification_window_size
+                    ):
+                        gate = _evaluate_clarification_gate(
+                            phase_label=phase_label,
+                            window=phase_clarification_window,
+                            phase_messages=phase_reasoning_messages,
+                            window_size=clarification_window_size,
+                            cooldown_steps=clarification_cooldown_steps,
+                            step_index=clarification_total_steps,
+                        )
                     if gate:
                         clarification_payload = await _generate_clarification_payload(
                             reason_tag=str(gate.get("reason_tag") or "evidence_gap"),
@@ -4311,13 +5106,16 @@ class SimulationEngine:
                         reply_to_agent_id=reply_to_id or None,
                         opinion_change={"from": prev_opinion, "to": stance} if changed else None,
                     )
+                    # Only emitted steps carry a uid, so it is formatted here.
+                    step_uid = f"{iteration}:{processed_index}:{agent.agent_id}"
+                    agent_short_id, agent_label = agent_display[agent.agent_id]
                     await _emit_event(
                         "reasoning_step",
                         {
                             "step_uid": step_uid,
                             "agent_id": agent.agent_id,
-                            "agent_short_id": agent.agent_id[:4],
-                            "agent_label": agent_labels.get(agent.agent_id, f"Agent {agent.agent_id[:4]}"),
+                            "agent_short_id": agent_short_id,
+                            "agent_label": agent_label,
                             "archetype": role_label,
                             "iteration": iteration,
                             "phase": phase_label,
@@ -4347,43 +5145,45 @@ class SimulationEngine:
                         dialogue_history.append(
                             {
                                 "agent_id": agent.agent_id,
-                                "short_id": agent.agent_id[:4],
+                                "short_id": agent_short_id,
                                 "message": message,
                                 "opinion": stance,
                             }
                         )
 
                 processed_index += 1
-                await _emit_checkpoint(
-                    status_value="running",
-                    next_iteration=iteration,
-                    current_iteration=iteration,
-                    phase_label=phase_label,
-                    phase_key=phase_key,
-                    phase_progress_pct=phase_start_progress,
-                    tasks=tasks,
-                    next_task_index=processed_index,
-                    status_reason="running",
-                    last_step_uid=last_reasoning_step_uid,
-                )
-
-                await _emit_event("metrics", _build_metrics_payload(iteration))
-                await _emit_checkpoint(
-                    status_value="running",
-                    next_iteration=iteration,
-                    current_iteration=iteration,
-                    phase_label=phase_label,
-                    phase_key=phase_key,
-                    phase_progress_pct=phase_start_progress,
-                    tasks=tasks,
-                    next_task_index=processed_index,
-                    status_reason="running",
-                    last_step_uid=last_reasoning_step_uid,
-                )
-                if clarification_triggered and clarification_payload:
-                    raise ClarificationNeeded(clarification_payload)
-                if step_delay > 0:
-                    await asyncio.sleep(step_delay / speed)
+                # A clarification stops the run here, so it must resume from this
+                # step; otherwise the end-of-phase checkpoint covers the tail.
+                clarification_pending = bool(clarification_triggered and clarification_payload)
+                checkpoint_due = clarification_pending or processed_index - last_checkpoint_index >= checkpoint_every_steps
+                # Steps that finish quickly (fallbacks, short replies) share one
+                # metrics update; checkpoints and the phase end always send one.
+                metrics_now = time.monotonic()
+                if checkpoint_due or metrics_now - last_metrics_emit_at >= metrics_min_interval:
+                    await _emit_event("metrics", _build_metrics_payload(iteration))
+                    last_metrics_emit_at = metrics_now
+                if checkpoint_due:
+                    await _emit_checkpoint(
+                        status_value="running",
+                        next_iteration=iteration,
+                        current_iteration=iteration,
+                        phase_label=phase_label,
+                        phase_key=phase_key,
+                        phase_progress_pct=phase_start_progress,
+                        tasks=tasks,
+                        next_task_index=processed_index,
+                        status_reason="running",
+                        last_step_uid=last_reasoning_step_uid,
+                    )
+                    last_checkpoint_index = processed_index
+                    if clarification_pending:
+                        raise ClarificationNeeded(clarification_payload)
+                if defer_step_pause:
+                    deferred_pause += step_pause
+                    if processed_index % 8 == 0:
+                        await asyncio.sleep(0)
+                elif step_pause > 0:
+                    await asyncio.sleep(step_pause)
 
             await _emit_event("metrics", _build_metrics_payload(iteration))
             await _emit_event(
@@ -4394,70 +5194,76 @@ class SimulationEngine:
                     "agents": [_agent_snapshot(agent) for agent in agents],
                 },
             )
-            await _emit_checkpoint(
-                status_value="running",
-                next_iteration=iteration + 1,
-                current_iteration=0,
-                phase_label=None,
-                phase_key=phase_key,
-                phase_progress_pct=(iteration / max(1, total_iterations)) * 100.0,
-                tasks=[],
-                next_task_index=0,
-                status_reason="running",
-                last_step_uid=last_reasoning_step_uid,
-            )
-            await _emit_event(
-                "phase_update",
-                {
-                    "phase_key": phase_key,
-                    "phase_label": phase_label,
-                    "progress_pct": (iteration / max(1, total_iterations)) * 100.0,
-                    "status": "completed",
-                },
-            )
-            if step_delay > 0:
-                await asyncio.sleep(step_delay / speed)
-
-            if using_resume_tasks:
-                resume_tasks_payload = []
-                resume_current_iteration = 0
-
-            neutral_ratio = metrics_counts.get("neutral", 0) / max(1, len(agents))
-            if phase_key == "convergence" and neutral_ratio <= 0.10:
-                effective_total_iterations = max(1, iteration)
-                await _emit_event("metrics", _build_metrics_payload(iteration))
-                await _emit_checkpoint(
+            # The checkpoint store and the event stream are separate sinks, so the
+            # checkpoint write overlaps the phase_update send. Both payloads are
+            # built before either awaits, in this order, so sequencing is unchanged.
+            await asyncio.gather(
+                _emit_checkpoint(
                     status_value="running",
-                    next_iteration=effective_total_iterations + 1,
+                    next_iteration=iteration + 1,
                     current_iteration=0,
                     phase_label=None,
                     phase_key=phase_key,
-                    phase_progress_pct=100.0,
+                    phase_progress_pct=(iteration / max(1, total_iterations)) * 100.0,
                     tasks=[],
                     next_task_index=0,
                     status_reason="running",
                     last_step_uid=last_reasoning_step_uid,
-                )
-                await _emit_event(
+                ),
+                _emit_event(
                     "phase_update",
                     {
                         "phase_key": phase_key,
                         "phase_label": phase_label,
-                        "progress_pct": 100.0,
+                        "progress_pct": (iteration / max(1, total_iterations)) * 100.0,
                         "status": "completed",
-                        "reason": "neutral_target_reached",
                     },
+                ),
+            )
+            if step_pause > 0:
+                await asyncio.sleep(step_pause + deferred_pause)
+
+            if using_resume_tasks:
+                resume_cursor = None
+
+            neutral_ratio = metrics_counts.get("neutral", 0) / max(1, len(agents))
+            if phase_key == "convergence" and neutral_ratio <= 0.10:
+                effective_total_iterations = max(1, iteration)
+                await _emit_event("metrics", _build_metrics_payload(iteration))
+                await asyncio.gather(
+                    _emit_checkpoint(
+                        status_value="running",
+                        next_iteration=effective_total_iterations + 1,
+                        current_iteration=0,
+                        phase_label=None,
+                        phase_key=phase_key,
+                        phase_progress_pct=100.0,
+                        tasks=[],
+                        next_task_index=0,
+                        status_reason="running",
+                        last_step_uid=last_reasoning_step_uid,
+                    ),
+                    _emit_event(
+                        "phase_update",
+                        {
+                            "phase_key": phase_key,
+                            "phase_label": phase_label,
+                            "progress_pct": 100.0,
+                            "status": "completed",
+                            "reason": "neutral_target_reached",
+                        },
+                    ),
                 )
 
         await _enforce_neutral_cap_before_complete("Finalization Gate")
         # After all iterations, compute final metrics
         final_metrics = compute_metrics(agents)
         final_metrics["total_iterations"] = effective_total_iterations
-        total_steps = int(reasoning_stats.get("total_steps") or 0)
-        fallback_steps = int(reasoning_stats.get("fallback_steps") or 0)
+        total_steps = reasoning_stats.total_steps
+        fallback_steps = reasoning_stats.fallback_steps
         fallback_ratio = (fallback_steps / total_steps) if total_steps > 0 else 0.0
         final_metrics["reasoning_telemetry"] = {
-            **dict(reasoning_stats),
+            **reasoning_stats.to_dict(),
             "fallback_ratio": fallback_ratio,
             "engine_v2": reasoning_engine_v2,
             "policy_mode": policy_mode,
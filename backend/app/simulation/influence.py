@@ -64,6 +64,15 @@ def compute_pairwise_influences(agents: List[Agent], dataset: Dataset) -> Dict[s
         else:
             influencer_pool = [a for a in agents if a.agent_id != target.agent_id]
 
+        # Target-side factors are the same for every influencer of this target.
+        # Skepticism resistance: high skepticism reduces influence
+        skepticism_factor = 1.0 - target.traits.get("skepticism", 0.0)
+        skepticism_factor = max(0.15, min(1.0, skepticism_factor))
+        # Susceptibility from target's template
+        target_template = dataset.template_by_id.get(target.template_id)
+        susceptibility = target_template.influence_susceptibility if target_template else 1.0
+        target_accum = accum[target.agent_id]
+
         for influencer in influencer_pool:
             # Determine base influence from dataset rule
             rule_key = (influencer.category_id, target.category_id)
@@ -85,12 +94,6 @@ def compute_pairwise_influences(agents: List[Agent], dataset: Dataset) -> Dict[s
             if target.template_id == influencer.template_id:
                 homophily += 0.1
             homophily = min(1.3, homophily)
-            # Skepticism resistance: high skepticism reduces influence
-            skepticism_factor = 1.0 - target.traits.get("skepticism", 0.0)
-            skepticism_factor = max(0.15, min(1.0, skepticism_factor))
-            # Susceptibility from target's template
-            target_template = dataset.template_by_id.get(target.template_id)
-            susceptibility = target_template.influence_susceptibility if target_template else 1.0
             # Random noise (multiplicative, unbiased)
             noise = random.uniform(-0.04, 0.04)
             noise_factor = max(0.85, 1.0 + noise)
@@ -99,7 +102,7 @@ def compute_pairwise_influences(agents: List[Agent], dataset: Dataset) -> Dict[s
             # Clamp weight to non-negative values
             weight = max(weight, 0.0)
             # Accumulate influence towards the influencer's current opinion
-            accum[target.agent_id][influencer.current_opinion] += weight
+            target_accum[influencer.current_opinion] += weight
     return accum
 
 
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+import unittest
+from collections import Counter
+from pathlib import Path
+from unittest import mock
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "backend"))
+
+import app.simulation.engine as engine_module  # noqa: E402
+import app.simulation.llm_output_validator as validator_module  # noqa: E402
+from app.core.dataset_loader import load_dataset  # noqa: E402
+from app.simulation.engine import (  # noqa: E402
+    SimulationEngine,
+    _ClarificationWindow,
+    _DialogueHistory,
+    _compile_keyword_matcher,
+    _find_balanced,
+    _keyword_groups,
+    _script_counts,
+    _snippet_key,
+)
+
+
+def _entry(opinion: str, reason_tag: str = "evidence_gap", fallback_reason: str | None = None) -> dict:
+    return {
+        "opinion": opinion,
+        "reason_tag": reason_tag,
+        "fallback_reason": fallback_reason,
+        "message": f"{opinion} {reason_tag}",
+    }
+
+
+class ClarificationWindowTests(unittest.TestCase):
+    def test_counters_track_evicted_entries(self) -> None:
+        window = _ClarificationWindow(3)
+        window.append(_entry("reject", "market_demand", "low_relevance"))
+        window.append(_entry("accept", "unclear_value"))
+        window.append(_entry("neutral", "unclear_value", "too_short"))
+        window.append(_entry("neutral", "evidence_gap", "not_a_known_reason"))
+
+        self.assertEqual(len(window), 3)
+        self.assertEqual(window.reject_count, 0)
+        self.assertEqual(window.neutral_count, 2)
+        self.assertEqual(window.focus_count, 2)
+        self.assertEqual(window.tag_counter, Counter({"unclear_value": 1, "evidence_gap": 1}))
+        self.assertEqual(window.fallback_counter, Counter({"too_short": 1}))
+        self.assertEqual(window.unresolved_fallback_count, 1)
+        self.assertEqual([item["opinion"] for item in window.focus_items()], ["neutral", "neutral"])
+
+    def test_reset_clears_entries_and_counters(self) -> None:
+        window = _ClarificationWindow(3)
+        window.append(_entry("reject", "market_demand", "low_relevance"))
+        window.reset(3)
+        self.assertEqual(len(window), 0)
+        self.assertEqual((window.reject_count, window.focus_count, window.unresolved_fallback_count), (0, 0, 0))
+        self.assertEqual(window.tag_counter, Counter())
+
+        window.reset(2)
+        for opinion in ("reject", "neutral", "neutral"):
+            window.append(_entry(opinion))
+        self.assertEqual(len(window), 2)
+        self.assertEqual((window.reject_count, window.neutral_count), (0, 2))
+
+    def test_leader_ties_follow_current_window_order(self) -> None:
+        window = _ClarificationWindow(3)
+        window.append(_entry("reject", "market_demand"))
+        window.append(_entry("reject", "legal_compliance"))
+        window.append(_entry("reject", "market_demand"))
+        window.append(_entry("accept", "unclear_value"))
+
+        # market_demand was counted first overall, but its earliest entry has
+        # left the window; legal_compliance now appears first.
+        self.assertEqual(window.top_reason_tag(), ("legal_compliance", 1))
+
+
+class DialogueHistoryTests(unittest.TestCase):
+    def test_reply_target_prefers_latest_differing_opinion(self) -> None:
+        history = _DialogueHistory([], maxlen=4)
+        history.append({"agent_id": "a", "opinion": "reject", "message": "first"})
+        history.append({"agent_id": "b", "opinion": "accept", "message": "second"})
+        history.append({"agent_id": "c", "opinion": "accept", "message": "third"})
+
+        self.assertEqual(history.reply_target("c", "accept")["message"], "first")
+        self.assertEqual(history.reply_target("a", "accept")["message"], "third")
+        self.assertEqual(history.reply_target("c", "reject")["message"], "second")
+
+    def test_reply_target_ignores_evicted_entries(self) -> None:
+        history = _DialogueHistory(
+            [
+                {"agent_id": "a", "opinion": "reject", "message": "old"},
+                {"agent_id": "b", "opinion": "accept", "message": "kept"},
+                {"agent_id": "c", "opinion": "accept", "message": "latest"},
+            ],
+            maxlen=2,
+        )
+
+        self.assertEqual(len(history), 2)
+        self.assertEqual(history.reply_target("c", "accept")["message"], "kept")
+        self.assertIsNone(_DialogueHistory([], maxlen=2).reply_target("a", "accept"))
+
+    def test_recent_returns_tail_in_order(self) -> None:
+        history = _DialogueHistory([{"message": str(idx)} for idx in range(5)], maxlen=4)
+
+        self.assertEqual([item["message"] for item in history.recent(2)], ["3", "4"])
+        self.assertEqual([item["message"] for item in history.recent(10)], ["1", "2", "3", "4"])
+        self.assertEqual(history.version, 5)
+
+
+class KeywordMatcherTests(unittest.TestCase):
+    def test_reports_overlapping_and_prefix_keywords(self) -> None:
+        matcher = _compile_keyword_matcher({
+            "a": ("price",),
+            "b": ("pricey",),
+            "c": ("icey",),
+            "d": ("ice",),
+        })
+
+        self.assertEqual(_keyword_groups("too pricey", matcher), {"a", "b", "c", "d"})
+        self.assertEqual(_keyword_groups("prices", matcher), {"a", "d"})
+        self.assertEqual(_keyword_groups("nothing here", matcher), set())
+
+
+class FindBalancedTests(unittest.TestCase):
+    def test_stops_at_matching_bracket_outside_strings(self) -> None:
+        text = 'Sure: {"message": "a } inside", "tags": ["x]"]} and a stray }'
+
+        self.assertEqual(_find_balanced(text, "{", "}"), '{"message": "a } inside", "tags": ["x]"]}')
+        self.assertEqual(_find_balanced(text, "[", "]"), '["x]"]')
+
+    def test_handles_escaped_quotes_and_unbalanced_text(self) -> None:
+        self.assertEqual(_find_balanced('{"a": "say \\"}\\" ok"}', "{", "}"), '{"a": "say \\"}\\" ok"}')
+        self.assertIsNone(_find_balanced("{ never closed", "{", "}"))
+        self.assertIsNone(_find_balanced("no json here", "{", "}"))
+
+
+class ScriptCountsTests(unittest.TestCase):
+    def test_counts_latin_and_arabic_characters(self) -> None:
+        self.assertEqual(_script_counts("App تطبيق 42!"), (3, 5))
+        self.assertEqual(_script_counts(""), (0, 0))
+
+
+class SnippetKeyTests(unittest.TestCase):
+    def test_near_duplicates_differing_in_spacing_share_a_key(self) -> None:
+        base = _snippet_key("Delivery fees are too high")
+
+        self.assertEqual(_snippet_key("Delivery \u200b fees are too  high"), base)
+        self.assertEqual(_snippet_key("delivery\u200f fees are too high "), base)
+        self.assertNotEqual(_snippet_key("Delivery fees are high"), base)
+
+
+class LLMConcurrencyTests(unittest.IsolatedAsyncioTestCase):
+    async def test_speculative_batches_stay_within_engine_ceiling(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def fake_generate(prompt: str, **_: object) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                await asyncio.sleep(0.001)
+            finally:
+                in_flight -= 1
+            if "stance classifier" in prompt:
+                return json.dumps({"stance": "neutral", "confidence": 0.5})
+            if "Human Reasoning Judge" in prompt:
+                return json.dumps({"ok": True, "reasons": []})
+            return "short"
+
+        env = {
+            "SIM_LLM_CONCURRENCY": "2",
+            "REASONING_SPECULATIVE_ATTEMPTS": "3",
+            "SIMULATION_STEP_DELAY": "0",
+        }
+        with mock.patch.dict(os.environ, env), \
+                mock.patch.object(engine_module, "generate_ollama", fake_generate), \
+                mock.patch.object(validator_module, "generate_ollama", fake_generate):
+            engine = SimulationEngine(load_dataset(str(ROOT / "backend" / "app" / "data")))
+
+            async def emit(_event: str, _payload: dict) -> None:
+                return None
+
+            try:
+                await engine.run_simulation(
+                    {"idea": "Office bakery subscription", "language": "en", "agentCount": 6},
+                    emit,
+                )
+            except engine_module.ClarificationNeeded:
+                pass
+
+        self.assertEqual(peak, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()